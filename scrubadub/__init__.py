@@ -1,19 +1,84 @@
+import threading
 
-from typing import Union, List, Dict, Sequence, Optional
+from typing import Union, List, Dict, Sequence, Optional, Tuple, Any
 
 # convenient imports
 from .scrubbers import Scrubber
 from . import filth
 from . import detectors
 from . import post_processors
+from . import cache
+from . import lookup
+from . import stats
+from . import table
 from .filth import Filth
 
 __version__ = VERSION = "2.0.1"
 __all__ = [
-    'Scrubber', 'filth', 'detectors', 'post_processors', 'clean', 'clean_documents', 'list_filth',
-    'list_filth_documents',
+    'Scrubber', 'filth', 'detectors', 'post_processors', 'cache', 'lookup', 'stats', 'table', 'clean',
+    'clean_documents', 'list_filth', 'list_filth_documents', 'reset_default_scrubbers',
 ]
 
+# The Scrubbers used by the functions below, keyed by locale. These are shared between calls (and threads) to save
+# building a new Scrubber each time, and are rebuilt when the detectors or post-processors that would be loaded by
+# default change.
+_default_scrubbers = {}  # type: Dict[Optional[str], Scrubber]
+_default_scrubbers_state = None  # type: Optional[Tuple[Any, ...]]
+_catalogue_classes = None  # type: Optional[Tuple[Tuple[int, int], List[Any]]]
+_default_scrubbers_lock = threading.Lock()
+
+
+def _get_catalogue_state() -> Tuple[Any, ...]:
+    """Return a value that changes when the detectors or post-processors that ``Scrubber()`` loads could change."""
+    global _catalogue_classes
+
+    versions = (detectors.catalogue.catalogue_version, post_processors.catalogue.catalogue_version)
+    catalogue_classes = _catalogue_classes
+    if catalogue_classes is None or catalogue_classes[0] != versions:
+        catalogue_classes = (versions, (
+            list(detectors.catalogue.detector_catalogue.get_all().values()) +
+            list(post_processors.catalogue.post_processor_catalogue.get_all().values())
+        ))
+        _catalogue_classes = catalogue_classes
+    # The autoload flag is often changed on the class directly, rather than by registering the class again
+    return versions + tuple(getattr(component, 'autoload', None) for component in catalogue_classes[1])
+
+
+def _get_default_scrubber(locale: Optional[str] = None) -> Scrubber:
+    """Return the shared ``Scrubber`` with the default detectors and post-processors for ``locale``."""
+    global _default_scrubbers_state
+
+    state = _get_catalogue_state()
+    with _default_scrubbers_lock:
+        if state != _default_scrubbers_state:
+            _default_scrubbers.clear()
+            _default_scrubbers_state = state
+        scrubber = _default_scrubbers.get(locale, None)
+        if scrubber is None:
+            scrubber = Scrubber(locale=locale)
+            _default_scrubbers[locale] = scrubber
+    return scrubber
+
+
+def reset_default_scrubbers():
+    """Forget the ``Scrubber`` instances shared by ``scrubadub.clean()`` and the other functions in this module.
+
+    These are rebuilt automatically when detectors or post-processors are registered or removed, or when their
+    ``autoload`` flag is changed. Call this if the default detectors have been changed in some other way, for example
+    by changing a class attribute that is used when the detector is created.
+
+    .. code:: pycon
+
+        >>> import scrubadub
+        >>> scrubadub.reset_default_scrubbers()
+    """
+    global _default_scrubbers_state, _catalogue_classes
+
+    with _default_scrubbers_lock:
+        _default_scrubbers.clear()
+        _default_scrubbers_state = None
+        _catalogue_classes = None
+
 
 def clean(text: str, locale: Optional[str] = None, **kwargs) -> str:
     """Seaches for ``Filth`` in `text` in a string and replaces it with placeholders.
@@ -33,7 +98,7 @@ def clean(text: str, locale: Optional[str] = None, **kwargs) -> str:
     :rtype: `str`
 
     """
-    scrubber = Scrubber(locale=locale)
+    scrubber = _get_default_scrubber(locale=locale)
     return scrubber.clean(text, **kwargs)
 
 
@@ -64,7 +129,7 @@ def clean_documents(documents: Union[Sequence[str], Dict[Optional[str], str]], l
     :return: Documents in the same format as input, but with `Filth` redacted
     :rtype: `list` of `str` objects, `dict` of `str` objects; same as input
     """
-    scrubber = Scrubber(locale=locale)
+    scrubber = _get_default_scrubber(locale=locale)
     return scrubber.clean_documents(documents, **kwargs)
 
 
@@ -86,7 +151,7 @@ def list_filth(text: str, locale: Optional[str] = None, **kwargs) -> List[Filth]
     :rtype: `list` of :class:``Filth`` objects
 
     """
-    scrubber = Scrubber(locale=locale)
+    scrubber = _get_default_scrubber(locale=locale)
     return list(scrubber.iter_filth(text, **kwargs))
 
 
@@ -120,5 +185,5 @@ locale='en_US'>]
     :rtype: `list` of :class:``Filth`` objects
 
     """
-    scrubber = Scrubber(locale=locale)
+    scrubber = _get_default_scrubber(locale=locale)
     return list(scrubber.iter_filth_documents(documents, **kwargs))
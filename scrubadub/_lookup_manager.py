@@ -0,0 +1,11 @@
+import multiprocessing.managers
+
+from .lookup import MemoryLookupStore
+
+
+class LookupManager(multiprocessing.managers.BaseManager):
+    """Runs the ``MemoryLookupStore`` of a ``scrubadub.lookup.ManagerLookupStore`` in a server process."""
+    pass
+
+
+LookupManager.register('MemoryLookupStore', MemoryLookupStore, exposed=('get_id', 'clear', '__len__'))
@@ -0,0 +1,135 @@
+import sqlite3
+import threading
+import contextlib
+
+from typing import Optional, Sequence, Dict, Any, Generator
+
+from .utils import PicklableLockMixin
+
+
+class SqliteLRU(PicklableLockMixin):
+    """The least recently used bookkeeping shared by ``scrubadub.cache.SqliteCache`` and
+    ``scrubadub.lookup.SqliteLookupStore``.
+
+    Each row of ``table`` has a ``last_used`` column, set from a counter that only ever increases. The counter and
+    the number of rows are kept in a one row ``<table>_lru`` table that is updated in the same transaction as the
+    rows, so that the rows only need to be counted or searched for the oldest ones when there are too many of them.
+
+    :param path: The path of the sqlite database file.
+    :type path: str
+    :param max_entries: The maximum number of rows to keep, no limit if ``None``.
+    :type max_entries: int, optional
+    :param timeout: How long to wait, in seconds, when the database is locked by another process.
+    :type timeout: float
+    """
+
+    # The table that holds the rows and the columns that identify a row, set by the derived classes
+    table = ''  # type: str
+    key_columns = ()  # type: Sequence[str]
+
+    def __init__(self, path: str, max_entries: Optional[int] = None, timeout: float = 30.0):
+        self.path = path
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._connection = self._connect()
+
+    def _create_tables(self, connection: sqlite3.Connection):
+        """Create ``table``, which needs an indexed ``last_used INTEGER NOT NULL`` column, and any other tables."""
+        raise NotImplementedError('must be implemented in derived classes')
+
+    def _connect(self) -> sqlite3.Connection:
+        # Transactions are started explicitly, so that reading and updating the counter happen together even when
+        # several processes use the database
+        connection = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False, isolation_level=None)
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            self._create_tables(connection)
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS {}_lru '
+                '(id INTEGER PRIMARY KEY CHECK (id = 0), counter INTEGER NOT NULL, entries INTEGER NOT NULL)'.format(
+                    self.table
+                )
+            )
+            if connection.execute('SELECT 1 FROM {}_lru'.format(self.table)).fetchone() is None:
+                # Databases made before the counter was kept are counted once
+                connection.execute(
+                    'INSERT INTO {table}_lru (id, counter, entries) '
+                    'SELECT 0, COALESCE(MAX(last_used), 0), COUNT(*) FROM {table}'.format(table=self.table)
+                )
+        except BaseException:
+            connection.execute('ROLLBACK')
+            connection.close()
+            raise
+        connection.execute('COMMIT')
+        return connection
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Generator[sqlite3.Connection, None, None]:
+        """Hold the lock and a write transaction on the database, which is rolled back if anything goes wrong."""
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute('ROLLBACK')
+                raise
+            self._connection.execute('COMMIT')
+
+    def _key_condition(self) -> str:
+        return ' AND '.join('{} = ?'.format(column) for column in self.key_columns)
+
+    def _next_counter(self) -> int:
+        """Return the next value for ``last_used``, this must be called within ``_transaction()``."""
+        self._connection.execute('UPDATE {}_lru SET counter = counter + 1'.format(self.table))
+        return int(self._connection.execute('SELECT counter FROM {}_lru'.format(self.table)).fetchone()[0])
+
+    def _touch(self, key: Sequence[Any]):
+        """Mark a row as the most recently used, this must be called within ``_transaction()``."""
+        if self.max_entries is not None:
+            self._connection.execute(
+                'UPDATE {} SET last_used = ? WHERE {}'.format(self.table, self._key_condition()),
+                (self._next_counter(), *key),
+            )
+
+    def _added(self):
+        """Record that a row was inserted and remove the least recently used rows if there are now too many, this
+        must be called within ``_transaction()``."""
+        self._connection.execute('UPDATE {}_lru SET entries = entries + 1'.format(self.table))
+        if self.max_entries is None:
+            return
+
+        entries = int(self._connection.execute('SELECT entries FROM {}_lru'.format(self.table)).fetchone()[0])
+        excess = entries - max(1, self.max_entries)
+        if excess <= 0:
+            return
+
+        # The last_used values are unique, so everything up to the excess-th oldest is removed
+        cutoff = self._connection.execute(
+            'SELECT last_used FROM {} ORDER BY last_used LIMIT 1 OFFSET ?'.format(self.table), (excess - 1, )
+        ).fetchone()[0]
+        removed = self._connection.execute('DELETE FROM {} WHERE last_used <= ?'.format(self.table), (cutoff, ))
+        self._connection.execute('UPDATE {}_lru SET entries = entries - ?'.format(self.table), (removed.rowcount, ))
+
+    def _clear_rows(self):
+        """Remove all of the rows, this must be called within ``_transaction()``."""
+        self._connection.execute('DELETE FROM {}'.format(self.table))
+        self._connection.execute('UPDATE {}_lru SET entries = 0'.format(self.table))
+
+    def close(self):
+        """Close the connection to the database."""
+        self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._connection.execute('SELECT entries FROM {}_lru'.format(self.table)).fetchone()[0])
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Connections can not be pickled either, so a copy reconnects to the same database
+        state = super().__getstate__()
+        del state['_connection']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        super().__setstate__(state)
+        self._connection = self._connect()
@@ -0,0 +1,215 @@
+"""Caches that let a ``Scrubber`` skip searching text that it has already seen.
+
+The cache stores the ``Filth`` found in each text, keyed by a hash of the text and a fingerprint of the scrubber's
+detectors. The ``PostProcessor``\\ s are still run on the cached ``Filth`` every time, since they are cheap and may
+keep state between calls (such as the numbering used by ``FilthReplacer(include_count=True)``).
+
+.. code:: pycon
+
+    >>> import scrubadub, scrubadub.cache
+    >>> scrubber = scrubadub.Scrubber(cache=scrubadub.cache.MemoryCache(max_entries=1000))
+    >>> scrubber.clean("contact me at joe@example.com")
+    'contact me at {{EMAIL}}'
+    >>> len(scrubber.cache)
+    1
+"""
+import pickle
+import sqlite3
+import hashlib
+import threading
+import collections
+
+from typing import Optional, List, Any
+
+from .filth import Filth
+from .utils import PicklableLockMixin
+from ._sqlite_lru import SqliteLRU
+
+# A fixed protocol keeps the fingerprints and stored values readable between python versions
+PICKLE_PROTOCOL = 4
+
+
+class Cache(object):
+    """Base class for the caches used by a ``Scrubber``, which map a key to the list of ``Filth`` found in a text.
+
+    The ``Filth`` is stored pickled, so that the ``Filth`` returned by the cache can be changed by the
+    ``PostProcessor``\\ s without changing the cached copy.
+    """
+
+    def get(self, key: str) -> Optional[List[Filth]]:
+        """Return the ``Filth`` stored under ``key``, or ``None`` if the key is not in the cache.
+
+        :param key: The key returned by ``Cache.make_key``.
+        :type key: str
+        :return: The list of ``Filth`` or None
+        :rtype: Optional[List[Filth]]
+        """
+        value = self._get(key)
+        if value is None:
+            return None
+        return pickle.loads(value)
+
+    def set(self, key: str, filth_list: List[Filth]):
+        """Store ``filth_list`` under ``key``.
+
+        :param key: The key returned by ``Cache.make_key``.
+        :type key: str
+        :param filth_list: The ``Filth`` found in the text.
+        :type filth_list: List[Filth]
+        """
+        self._set(key, pickle.dumps(filth_list, protocol=PICKLE_PROTOCOL))
+
+    def _get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError('must be implemented in derived classes')
+
+    def _set(self, key: str, value: bytes):
+        raise NotImplementedError('must be implemented in derived classes')
+
+    def clear(self):
+        """Remove everything from the cache."""
+        raise NotImplementedError('must be implemented in derived classes')
+
+    def __len__(self) -> int:
+        raise NotImplementedError('must be implemented in derived classes')
+
+    @staticmethod
+    def make_key(text: str, fingerprint: str) -> str:
+        """Return the key for ``text`` searched by a ``Scrubber`` with the given configuration ``fingerprint``.
+
+        :param text: The text that is searched.
+        :type text: str
+        :param fingerprint: The fingerprint of the ``Scrubber`` configuration.
+        :type fingerprint: str
+        :return: A hex digest
+        :rtype: str
+        """
+        text_hash = hashlib.sha256()
+        text_hash.update(fingerprint.encode('ascii'))
+        text_hash.update(text.encode('utf-8', errors='surrogatepass'))
+        return text_hash.hexdigest()
+
+    @staticmethod
+    def make_fingerprint(configuration: Any) -> str:
+        """Return a fingerprint of a ``Scrubber`` configuration, such as its locale and the settings of its detectors.
+
+        The configuration is pickled to find the fingerprint, so any change to it gives a new fingerprint. If it can
+        not be pickled, its ``repr`` is used instead. The version of scrubadub is included, so that upgrading
+        scrubadub does not reuse results from an older version.
+
+        :param configuration: A description of the configuration
+        :type configuration: Any
+        :return: A hex digest
+        :rtype: str
+        """
+        import scrubadub
+        try:
+            serialised = pickle.dumps((scrubadub.__version__, configuration), protocol=PICKLE_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            serialised = repr((scrubadub.__version__, configuration)).encode('utf-8', errors='surrogatepass')
+        return hashlib.sha256(serialised).hexdigest()
+
+
+class MemoryCache(PicklableLockMixin, Cache):
+    """An in-memory least recently used cache.
+
+    :param max_entries: The maximum number of texts to keep the results of, no limit if ``None``.
+    :type max_entries: int, optional
+    :param max_bytes: The maximum size of the pickled ``Filth`` to keep, no limit if ``None``.
+    :type max_bytes: int, optional
+    """
+
+    def __init__(self, max_entries: Optional[int] = 10000, max_bytes: Optional[int] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = collections.OrderedDict()  # type: collections.OrderedDict
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key, None)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: bytes):
+        with self._lock:
+            old_value = self._entries.pop(key, None)
+            if old_value is not None:
+                self._size -= len(old_value)
+            self._entries[key] = value
+            self._size += len(value)
+
+            # Remove the least recently used entries, but always keep the newest one
+            while len(self._entries) > 1 and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries) or
+                (self.max_bytes is not None and self._size > self.max_bytes)
+            ):
+                _, removed_value = self._entries.popitem(last=False)
+                self._size -= len(removed_value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteCache(SqliteLRU, Cache):
+    """A least recently used cache stored in an sqlite database, so that results are kept between runs.
+
+    The same database file can be used by several processes at the same time, and a ``Scrubber`` with this cache
+    that is sent to another process opens its own connection to the database.
+
+    :param path: The path of the sqlite database file.
+    :type path: str
+    :param max_entries: The maximum number of texts to keep the results of, no limit if ``None``.
+    :type max_entries: int, optional
+    :param timeout: How long to wait, in seconds, when the database is locked by another process.
+    :type timeout: float
+    """
+
+    table = 'filth_cache'
+    key_columns = ('key', )
+
+    def _create_tables(self, connection: sqlite3.Connection):
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS filth_cache '
+            '(key TEXT PRIMARY KEY, value BLOB NOT NULL, last_used INTEGER NOT NULL)'
+        )
+        connection.execute('CREATE INDEX IF NOT EXISTS filth_cache_last_used ON filth_cache (last_used)')
+
+    def _get(self, key: str) -> Optional[bytes]:
+        if self.max_entries is None:
+            with self._lock:
+                row = self._connection.execute('SELECT value FROM filth_cache WHERE key = ?', (key, )).fetchone()
+            return None if row is None else bytes(row[0])
+
+        with self._transaction() as connection:
+            row = connection.execute('SELECT value FROM filth_cache WHERE key = ?', (key, )).fetchone()
+            if row is None:
+                return None
+            self._touch((key, ))
+            return bytes(row[0])
+
+    def _set(self, key: str, value: bytes):
+        with self._transaction() as connection:
+            last_used = self._next_counter()
+            updated = connection.execute(
+                'UPDATE filth_cache SET value = ?, last_used = ? WHERE key = ?', (sqlite3.Binary(value), last_used, key)
+            )
+            if updated.rowcount == 0:
+                connection.execute(
+                    'INSERT INTO filth_cache (key, value, last_used) VALUES (?, ?, ?)',
+                    (key, sqlite3.Binary(value), last_used),
+                )
+                self._added()
+
+    def clear(self):
+        with self._transaction():
+            self._clear_rows()
+
+
+__all__ = ['Cache', 'MemoryCache', 'SqliteCache']
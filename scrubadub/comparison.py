@@ -3,16 +3,16 @@ import copy
 import random
 import itertools
 
-from faker import Faker
-
 from . import filth as filth_module
 from .filth import Filth
 from .detectors.tagged import KnownFilthItem
 
-from typing import List, Dict, Union, Optional, Tuple, Callable, Iterable, Type, Set
-import numpy as np
-import pandas as pd
-import sklearn.metrics
+from typing import List, Dict, Union, Optional, Tuple, Callable, Iterable, Type, Set, TYPE_CHECKING
+
+# pandas, numpy, sklearn and faker are slow to import, so they are imported by the functions that use them
+if TYPE_CHECKING:
+    import pandas as pd
+    from faker import Faker
 
 # I was originally thinking of building this into the Filth system, but they serve subtlly different purposes:
 #   * Filths need to be merged by text location so that replacements can be made
@@ -96,7 +96,9 @@ class FilthTypePositions(ToStringMixin, object):
     def merge_positions(self):
         self.positions = self._merge_position_list(self.positions)
 
-    def get_counts(self) -> pd.DataFrame:
+    def get_counts(self) -> 'pd.DataFrame':
+        import pandas as pd
+
         self.merge_positions()
 
         data_list = []  # type: List[Dict[Tuple[str, ...], int]]
@@ -243,14 +245,16 @@ class FilthGrouper(ToStringMixin, object):
         grouper.merge_positions()
         return grouper
 
-    def expand_missing(self, df: pd.DataFrame) -> pd.DataFrame:
+    def expand_missing(self, df: 'pd.DataFrame') -> 'pd.DataFrame':
         set_list = [set(s) for s in zip(*df.columns.values.tolist())]
         for column in itertools.product(*set_list):
             if column not in df.columns:
                 df.loc[:, column] = 0
         return df
 
-    def get_counts(self, expand_missing: bool = False) -> pd.DataFrame:
+    def get_counts(self, expand_missing: bool = False) -> 'pd.DataFrame':
+        import pandas as pd
+
         if len(self.types) == 0:
             return pd.DataFrame()
         df_list = []  # type: List[pd.DataFrame]
@@ -310,6 +314,9 @@ def get_filth_classification_report(
     if len(filth_list) == 0:
         return None
 
+    import numpy as np
+    import sklearn.metrics
+
     grouper = FilthGrouper.from_filth_list(filth_list, combine_detectors=combine_detectors,
                                            groupby_documents=groupby_documents)
     results_df = grouper.get_counts(expand_missing=True)
@@ -395,7 +402,7 @@ def get_filth_classification_report(
     return report
 
 
-def get_filth_dataframe(filth_list: List[Filth]) -> pd.DataFrame:
+def get_filth_dataframe(filth_list: List[Filth]) -> 'pd.DataFrame':
     """Produces a pandas `DataFrame` to allow debugging and improving detectors.
 
     An example of using this is shown below:
@@ -411,6 +418,7 @@ def get_filth_dataframe(filth_list: List[Filth]) -> pd.DataFrame:
         ...     ]),
         ... ])
         >>> filth_list = list(scrubber.iter_filth("Hello I am Tom"))
+        >>> import pandas as pd
         >>> with pd.option_context("display.max_columns", 20):
         ...     print(scrubadub.comparison.get_filth_dataframe(filth_list))  # doctest: +NORMALIZE_WHITESPACE
            group_id  filth_id filth_type  detector_name document_name text  beg  end  \\
@@ -431,6 +439,8 @@ def get_filth_dataframe(filth_list: List[Filth]) -> pd.DataFrame:
     :rtype: `pd.DataFrame`
 
     """
+    import pandas as pd
+
     results = []
     for group_id, filth_item in enumerate(filth_list):
         sub_filths = [filth_item]
@@ -477,7 +487,7 @@ def get_filth_dataframe(filth_list: List[Filth]) -> pd.DataFrame:
 
 
 def make_fake_document(
-        paragraphs: int = 20, locale: str = 'en_US', seed: Optional[int] = None, faker: Optional[Faker] = None,
+        paragraphs: int = 20, locale: str = 'en_US', seed: Optional[int] = None, faker: Optional['Faker'] = None,
         filth_types: Optional[List[str]] = None, fake_text_function: Optional[Callable[..., str]] = None,
         additional_filth_types: Optional[Iterable[Type[Filth]]] = None,
 ) -> Tuple[str, List[KnownFilthItem]]:
@@ -516,7 +526,8 @@ def make_fake_document(
     :type seed: int, optional
     :param faker: A Faker object that is used to generate the text
     :type faker: int
-    :param filth_types: A list of the ``Filth.type`` to generate
+    :param filth_types: A list of the ``Filth.type`` to generate, by default all of the ``Filth`` registered with
+        ``autoload`` set (see ``scrubadub.filth.register_filth``) and the ``additional_filth_types`` are generated
     :type filth_types: List[str]
     :param fake_text_function: A function that will generate a 1-3 sentances of text
     :type fake_text_function: Callable, optional
@@ -524,23 +535,18 @@ def make_fake_document(
     :rtype: Tuple[str, List[KnownFilthItem]]
 
     """
+    from faker import Faker
+
     if faker is None:
         faker = Faker(locale=locale)
 
     if fake_text_function is None:
         fake_text_function = faker.text
 
-    # TODO: register filth types to build up a dict that can be read from, like the detectors
     possible_filth = [
-        filth_module.AddressFilth,
-        filth_module.EmailFilth,
-        filth_module.NameFilth,
-        filth_module.PhoneFilth,
-        filth_module.PostalCodeFilth,
-        filth_module.SocialSecurityNumberFilth,
-        filth_module.TwitterFilth,
-        filth_module.UrlFilth,
-    ]
+        filth_cls for filth_type, filth_cls in sorted(filth_module.catalogue.get_filth_classes().items())
+        if filth_cls.autoload
+    ]  # type: List[Type[Filth]]
     if additional_filth_types is not None:
         possible_filth += list(additional_filth_types)
 
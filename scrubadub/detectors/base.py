@@ -1,6 +1,6 @@
 import re
 import warnings
-from typing import Optional, ClassVar, Type, Generator, Pattern, Dict, Sequence
+from typing import Optional, ClassVar, Type, Generator, Pattern, Dict, Sequence, Tuple
 
 from ..filth import Filth
 from ..import utils
@@ -30,11 +30,37 @@ class Detector(object):
 
     You can also advertise a ``Detector`` as supporting a certain locale by defining the
     ```Detector.supported_local()``` function.
+
+    If the detector can only find Filth up to a certain length, set ``max_match_length`` so that it can be used with
+    ``Scrubber.clean_stream()``.
+
+    Detectors can declare cheap conditions that a text must meet before they could find anything in it, so that the
+    ``Scrubber`` can skip them for texts that can not contain their ``Filth``. ``required_literals`` is a tuple of
+    groups of case folded strings, where the case folded text must contain at least one string from every group, and
+    ``required_digits`` is the minimum number of digits that must be in the text:
+
+    .. code:: pycon
+
+        >>> import scrubadub
+        >>> class PasswordDetector(scrubadub.detectors.RegexDetector):
+        ...     name = 'password'
+        ...     regex = re.compile(r'(?:password|pw): \\S+', re.IGNORECASE)
+        ...     required_literals = (('password', 'pw'), )
+        >>> detector = PasswordDetector()
+        >>> detector.can_match(scrubadub.utils.TextFeatures("There is nothing to see here"))
+        False
     """
 
     filth_cls = Filth  # type: ClassVar[Type[Filth]]
     name = 'detector'  # type: str
     autoload = False  # type: bool
+    # The longest piece of text that this detector can match, plus any context that it needs to see around the
+    # match. This is used when streaming text through a ``Scrubber`` in windows (see ``Scrubber.clean_stream``), so
+    # that Filth is not lost at the edge of a window. ``None`` means the length is not bounded.
+    max_match_length = None  # type: Optional[int]
+    # Necessary conditions for the detector to find anything in a text, see ``Detector.can_match``
+    required_literals = ()  # type: Tuple[Tuple[str, ...], ...]
+    required_digits = 0  # type: int
 
     def __init__(self, name: Optional[str] = None, locale: str = 'en_US'):
         """Initialise the ``Detector``.
@@ -78,6 +104,25 @@ class Detector(object):
         """
         raise NotImplementedError('must be implemented in derived classes')
 
+    def can_match(self, features: utils.TextFeatures) -> bool:
+        """Returns false if this detector can not find any ``Filth`` in the text described by ``features``.
+
+        This checks the ``required_literals`` and ``required_digits`` of the detector, which should be cheap,
+        necessary conditions for a match. It must never return false for a text that the detector would find
+        ``Filth`` in.
+
+        :param features: The features of the text to check.
+        :type features: scrubadub.utils.TextFeatures
+        :return: ``False`` if the detector can be skipped for this text
+        :rtype: bool
+        """
+        if self.required_digits > 0 and not features.has_digits(self.required_digits):
+            return False
+        for literals in self.required_literals:
+            if not features.contains_any(literals):
+                return False
+        return True
+
     def iter_filth_documents(self, document_list: Sequence[str],
                              document_names: Sequence[Optional[str]]) -> Generator[Filth, None, None]:
         """Yields discovered filth in a list of documents.
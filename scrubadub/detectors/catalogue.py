@@ -8,6 +8,9 @@ if TYPE_CHECKING:
 
 detector_catalogue = catalogue.create('scrubadub', 'detectors', entry_points=True)
 
+# Incremented each time the catalogue changes, so that anything built from the catalogue knows to rebuild
+catalogue_version = 0
+
 
 def register_detector(detector: Type['Detector'], *, autoload: Optional[bool] = None) -> Type['Detector']:
     """Register a detector for use with the ``Scrubber`` class.
@@ -30,6 +33,8 @@ def register_detector(detector: Type['Detector'], *, autoload: Optional[bool] =
     :param autoload: Whether to automatically load this ``Detector`` on ``Scrubber`` initialisation.
     :type autoload: Optional[bool]
     """
+    global catalogue_version
+
     if not inspect.isclass(detector):
         raise ValueError("detector should be a class, not an instance.")
 
@@ -37,6 +42,7 @@ def register_detector(detector: Type['Detector'], *, autoload: Optional[bool] =
         detector.autoload = autoload
 
     detector_catalogue.register(detector.name, func=detector)
+    catalogue_version += 1
 
     return detector
 
@@ -58,13 +64,17 @@ def remove_detector(detector: Union[Type['Detector'], str]):
     :param autoload: Whether to automatically load this ``Detector`` on ``Scrubber`` initialisation.
     :type autoload: bool
     """
+    global catalogue_version
+
     if isinstance(detector, str):
         if detector in detector_catalogue:
             catalogue._remove((*detector_catalogue.namespace, detector))
+            catalogue_version += 1
 
     elif inspect.isclass(detector):
         if detector.name in detector_catalogue:
             catalogue._remove((*detector_catalogue.namespace, detector.name))
+            catalogue_version += 1
 
     else:
         raise ValueError("detector should be a class (not an instance) or a string.")
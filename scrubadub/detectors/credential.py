@@ -12,6 +12,9 @@ class CredentialDetector(RegexDetector):
     filth_cls = CredentialFilth
     name = 'credential'
     autoload = True
+    # the password runs until the end of the line, so lines longer than this may be cut at a window edge
+    max_match_length = 1024
+    required_literals = (('username', 'login', 'u:'), ('password', 'pw', 'p:'))
 
     # this regular expression searches for patterns like
     #     "username: root password: root"
@@ -14,6 +14,9 @@ class CreditCardDetector(RegexDetector):
     name = 'credit_card'
     filth_cls = CreditCardFilth
     autoload = True
+    max_match_length = 20
+    # The shortest card numbers that are matched have 13 digits
+    required_digits = 13
 
     # Regexes from:
     # http://www.regular-expressions.info/creditcard.html
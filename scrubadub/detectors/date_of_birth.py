@@ -10,7 +10,6 @@ Using 18+ years may not be suitable for all use cases; use with caution.
 """
 import re
 import logging
-from dateparser.search import search_dates
 from datetime import datetime
 
 from typing import Optional, List, Generator
@@ -87,6 +86,8 @@ class DateOfBirthDetector(Detector):
             self.context_words = context_words
 
         self.context_words = [word.lower() for word in self.context_words]
+        if self.require_context:
+            self.required_literals = (tuple(word.casefold() for word in self.context_words), )
 
     def iter_filth(self, text: str, document_name: Optional[str] = None) -> Generator[Filth, None, None]:
         """Search ``text`` for ``Filth`` and return a generator of ``Filth`` objects.
@@ -99,6 +100,8 @@ class DateOfBirthDetector(Detector):
         :rtype: Generator[Filth]
         """
 
+        from dateparser.search import search_dates
+
         # using the dateparser lib - locale can be set here
         try:
             date_picker = search_dates(text, languages=[self.language])
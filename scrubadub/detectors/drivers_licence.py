@@ -13,6 +13,8 @@ class DriversLicenceDetector(RegionLocalisedRegexDetector):
 
     name = 'drivers_licence'
     autoload = True
+    max_match_length = 64
+    required_digits = 8
     filth_cls = DriversLicenceFilth
 
     region_regex = {
@@ -1,10 +1,8 @@
 import re
 
-from typing import Optional, Generator
-
 from scrubadub.detectors.catalogue import register_detector
 from .base import RegexDetector
-from ..filth import EmailFilth, Filth
+from ..filth import EmailFilth
 
 
 @register_detector
@@ -16,6 +14,10 @@ class EmailDetector(RegexDetector):
     filth_cls = EmailFilth
     name = 'email'
     autoload = True
+    # 64 characters before the @ and at most 253 in the domain, with room for spelt out 'at' and 'dot'
+    max_match_length = 512
+    # An @ (or the word 'at') and a dot (or the word 'dot') are needed
+    required_literals = (('@', 'at'), ('.', 'dot'))
 
     # there may be better solutions than this out there and this certainly
     # doesn't do that great of a job with people that spell out the
@@ -36,20 +38,3 @@ class EmailDetector(RegexDetector):
         r"    [a-z0-9]"                               # domain has max 253 chars, ends with one of these
         r")+\b"
     ), re.VERBOSE | re.IGNORECASE)
-
-    at_matcher = re.compile(r"@|\sat\s", re.IGNORECASE)
-    dot_matcher = re.compile(r"\.|\sdot\s", re.IGNORECASE)
-
-    def iter_filth(self, text: str, document_name: Optional[str] = None) -> Generator[Filth, None, None]:
-        """Yields discovered filth in the provided ``text``.
-
-        :param text: The dirty text to clean.
-        :type text: str
-        :param document_name: The name of the document to clean.
-        :type document_name: str, optional
-        :return: An iterator to the discovered :class:`Filth`
-        :rtype: Iterator[:class:`Filth`]
-        """
-
-        if re.search(self.at_matcher, text) and re.search(self.dot_matcher, text):
-            yield from super().iter_filth(text=text, document_name=document_name)
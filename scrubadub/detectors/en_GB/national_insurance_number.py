@@ -12,6 +12,8 @@ class NationalInsuranceNumberDetector(RegionLocalisedRegexDetector):
     """
     name = 'national_insurance_number'
     autoload = True
+    max_match_length = 64
+    required_digits = 6
     filth_cls = NationalInsuranceNumberFilth
     # this regex is looking for NINO that does not begin with certain letters
     region_regex = {
@@ -13,6 +13,8 @@ class TaxReferenceNumberDetector(RegionLocalisedRegexDetector):
 
     name = 'tax_reference_number'
     autoload = True
+    max_match_length = 64
+    required_digits = 7
     filth_cls = TaxReferenceNumberFilth
     # this regex is looking for NINO that does not begin with certain letters
     region_regex = {
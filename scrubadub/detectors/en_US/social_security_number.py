@@ -14,6 +14,8 @@ class SocialSecurityNumberDetector(RegionLocalisedRegexDetector):
     filth_cls = SocialSecurityNumberFilth
     name = 'social_security_number'
     autoload = True
+    max_match_length = 16
+    required_digits = 9
     region_regex = {
         'US': re.compile((
             r"[0-9][0-9][0-9]"  # first three digits
@@ -1,6 +1,6 @@
-import phonenumbers
+import re
 
-from typing import Optional
+from typing import Optional, List, Tuple, Sequence, Dict
 
 from scrubadub.detectors.catalogue import register_detector
 from .base import Detector
@@ -16,10 +16,53 @@ class PhoneDetector(Detector):
     Set the locale on the scrubber or detector to set the region used to search for valid phone numbers.
     If the locale is set to 'en_CA' Canadian numbers will be searched for, while setting the local to 'en_GB' searches
     for British numbers.
+
+    To search for the phone numbers of several regions at once, pass their two letter region codes to the detector:
+
+    >>> import scrubadub
+    >>> scrubber = scrubadub.Scrubber(detector_list=[scrubadub.detectors.PhoneDetector(regions=['GB', 'US'])])
+    >>> scrubber.clean("Call 020 7946 0018 in London or (312) 515-2239 in Chicago")
+    'Call {{PHONE}} in London or {{PHONE}} in Chicago'
     """
     filth_cls = PhoneFilth
     name = 'phone'
     autoload = True
+    # libphonenumber rejects anything longer than this when parsing
+    max_match_length = 256
+    # libphonenumber needs at least two digits in the national number
+    required_digits = 2
+    # libphonenumber is slow to search long texts, but any phone number it finds is made of digits separated by a few
+    # punctuation characters, and it only looks a few characters either side of these. So only the windows of text
+    # within this many characters of a digit are searched, which are joined together when they overlap.
+    window_margin = 32
+
+    _digits_regex = re.compile(r'\d+')
+
+    def __init__(self, regions: Optional[Sequence[str]] = None, **kwargs):
+        """Initialise the ``Detector``.
+
+        :param regions: The two letter codes of the regions to search for phone numbers from, such as
+            ``['GB', 'US']``. Defaults to the region of the ``locale``.
+        :type regions: list of str, optional
+        :param name: Overrides the default name of the :class:``Detector``
+        :type name: str, optional
+        :param locale: The locale of the documents in the format: 2 letter lower-case language code followed by an
+                       underscore and the two letter upper-case country code, eg "en_GB" or "de_CH".
+        :type locale: str, optional
+        """
+        super().__init__(**kwargs)
+
+        if regions is None:
+            self.regions = [self.region]  # type: List[Optional[str]]
+        else:
+            import phonenumbers
+
+            self.regions = list(dict.fromkeys(region.upper() for region in regions))
+            for region in self.regions:
+                if region not in phonenumbers.SUPPORTED_REGIONS:
+                    raise ValueError("Phone numbers from the region '{}' are not supported.".format(region))
+            if len(self.regions) == 0:
+                raise ValueError('At least one region is needed to search for phone numbers.')
 
     def iter_filth(self, text, document_name: Optional[str] = None):
         """Yields discovered filth in the provided ``text``.
@@ -31,16 +74,50 @@ class PhoneDetector(Detector):
         :return: An iterator to the discovered :class:`Filth`
         :rtype: Iterator[:class:`Filth`]
         """
-        # create a copy of text to handle multiple phone numbers correctly
-        for match in phonenumbers.PhoneNumberMatcher(text, self.region):
-            yield PhoneFilth(
-                beg=match.start,
-                end=match.end,
-                text=match.raw_string,
-                detector_name=self.name,
-                document_name=document_name,
-                locale=self.locale,
-            )
+        import phonenumbers
+
+        # The windows are found once and searched for the numbers of each region, any number that is found for more
+        # than one region is only returned once
+        for window_beg, window_end in self._candidate_windows(text):
+            window = text[window_beg:window_end]
+            matches = {}  # type: Dict[Tuple[int, int], str]
+            for region in self.regions:
+                for match in phonenumbers.PhoneNumberMatcher(window, region):
+                    matches.setdefault((match.start, match.end), match.raw_string)
+
+            for (beg, end), raw_string in sorted(matches.items()):
+                yield PhoneFilth(
+                    beg=window_beg + beg,
+                    end=window_beg + end,
+                    text=raw_string,
+                    detector_name=self.name,
+                    document_name=document_name,
+                    locale=self.locale,
+                )
+
+    @classmethod
+    def _candidate_windows(cls, text: str) -> List[Tuple[int, int]]:
+        """Find the windows of the text that could contain a phone number, which are the runs of digits with
+        ``window_margin`` characters either side, joined together where they overlap.
+
+        :param text: The text to search
+        :type text: str
+        :return: The start and end of each window, in order
+        :rtype: List[Tuple[int, int]]
+        """
+        windows = []  # type: List[Tuple[int, int]]
+        digit_counts = []  # type: List[int]
+        for match in cls._digits_regex.finditer(text):
+            beg = max(0, match.start() - cls.window_margin)
+            end = min(len(text), match.end() + cls.window_margin)
+            if len(windows) > 0 and beg <= windows[-1][1]:
+                windows[-1] = (windows[-1][0], end)
+                digit_counts[-1] += match.end() - match.start()
+            else:
+                windows.append((beg, end))
+                digit_counts.append(match.end() - match.start())
+
+        return [window for window, digit_count in zip(windows, digit_counts) if digit_count >= cls.required_digits]
 
     @classmethod
     def supported_locale(cls, locale: str) -> bool:
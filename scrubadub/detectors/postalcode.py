@@ -11,6 +11,8 @@ class PostalCodeDetector(RegionLocalisedRegexDetector):
     filth_cls = PostalCodeFilth
     name = 'postalcode'
     autoload = True
+    max_match_length = 32
+    required_digits = 1
     region_regex = {
         # Informed by https://en.wikipedia.org/wiki/Postcodes_in_the_United_Kingdom#Validation
         # and validated against https://osdatahub.os.uk/downloads/open/CodePointOpen
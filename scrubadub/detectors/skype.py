@@ -1,19 +1,12 @@
 import re
-import nltk
-import textblob
-
-from textblob.blob import BaseBlob
-from textblob.en.taggers import PatternTagger
 
 from typing import Optional, Generator
 
 from scrubadub.detectors.catalogue import register_detector
 from .base import RegexDetector
+from .text_blob import load_textblob
 from ..filth import SkypeFilth, Filth
 
-# BaseBlob uses NLTKTagger as a pos_tagger, but it works wrong
-BaseBlob.pos_tagger = PatternTagger()
-
 
 @register_detector
 class SkypeDetector(RegexDetector):
@@ -33,6 +26,7 @@ class SkypeDetector(RegexDetector):
     autoload = False
 
     word_radius = 10
+    required_literals = (('skype', ), )
 
     # these two regular expressions are used to validate a skype usernames.
     # _TOKEN is the core regular expression that is used to chunk text into
@@ -56,10 +50,13 @@ class SkypeDetector(RegexDetector):
         :rtype: Iterator[:class:`Filth`]
         """
 
+        textblob = load_textblob()
+        from nltk.tokenize.regexp import RegexpTokenizer
+
         # find 'skype' in the text using a customized tokenizer. this makes
         # sure that all valid skype usernames are kept as tokens and not split
         # into different words
-        tokenizer = nltk.tokenize.regexp.RegexpTokenizer(
+        tokenizer = RegexpTokenizer(
             self.SKYPE_TOKEN
         )
         blob = textblob.TextBlob(text, tokenizer=tokenizer)
@@ -94,7 +91,10 @@ class SkypeDetector(RegexDetector):
 
         # replace all skype usernames
         if skype_usernames:
-            self.regex = re.compile('|'.join(skype_usernames))
-            yield from super(SkypeDetector, self).iter_filth(text, document_name=document_name)
+            # The regex is kept local (rather than set on self.regex) so that a detector can be shared between threads
+            regex = re.compile('|'.join(skype_usernames))
+            for match in regex.finditer(text):
+                yield self.filth_cls(match=match, detector_name=self.name, document_name=document_name,
+                                     locale=self.locale)
 
         return
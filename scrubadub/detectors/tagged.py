@@ -1,13 +1,19 @@
 import re
 import sys
+import csv
 import copy
+import json
+import array
+import bisect
+import itertools
 
-from typing import Optional, List, Generator
+from typing import Optional, List, Generator, Dict, Tuple, Iterable, Union, NamedTuple, Any
 
 from scrubadub.detectors.catalogue import register_detector
 from .base import Detector
 from ..filth.base import Filth
 from ..filth.tagged import TaggedEvaluationFilth
+from .. import utils
 
 if sys.version_info >= (3, 8):
     from typing import TypedDict  # pylint: disable=no-name-in-module
@@ -28,6 +34,32 @@ KnownFilthItem = TypedDict(
     total=False,
 )
 
+# The detector keeps each known filth item as one of these, with the default values filled in, as they use much less
+# memory than a dict and can be deduplicated in a dict
+_KnownItem = NamedTuple(
+    '_KnownItem',
+    [
+        ('match', str),
+        ('filth_type', str),
+        ('match_end', str),
+        ('limit', int),
+        ('ignore_case', bool),
+        ('ignore_whitespace', bool),
+        ('ignore_partial_word_matches', bool),
+    ],
+)
+
+# The items searched for by one automaton: the automaton, the first item that each pattern belongs to and any other
+# items that the patterns belong to
+_Automaton = NamedTuple(
+    '_Automaton',
+    [
+        ('matcher', Union[utils.AhoCorasick, utils.HashedLiteralMatcher]),
+        ('first_items', array.array),
+        ('more_items', Dict[int, List[int]]),
+    ],
+)
+
 
 @register_detector
 class TaggedEvaluationFilthDetector(Detector):
@@ -85,6 +117,9 @@ class TaggedEvaluationFilthDetector(Detector):
         * ``{'match': '012345', 'filth_type': 'phone', 'ignore_partial_word_matches': True}`` - will search for an
           exact match to 012345, ignoring any partial matches and return it as a ``PhoneFilth``
 
+    Long lists of known filth items can be loaded from a CSV file or a JSON lines file with ``from_csv(path)`` or
+    ``from_jsonl(path)``.
+
     This detector is not enabled by default (since you need to supply a list of known filths) and so you must always
     add it to your scrubber with a ``scrubber.add_detector(detector)`` call or by adding it to the ``detector_list``
     inialising a ``Scrubber``.
@@ -94,13 +129,30 @@ class TaggedEvaluationFilthDetector(Detector):
     name = 'tagged'
     autoload = False
 
-    def __init__(self, known_filth_items: List[KnownFilthItem], **kwargs):
+    # When there are at least this many known filth items with only a ``match``, they are all found in a single pass
+    # over the text with an Aho-Corasick automaton, instead of searching the text once for each item. This is read
+    # when the detector is created.
+    automaton_min_items = 20
+    # Building an Aho-Corasick automaton for more items than this takes longer than it saves, so a
+    # ``utils.HashedLiteralMatcher`` is used instead
+    automaton_max_items = 10000
+
+    _known_item_keys = frozenset([
+        'match', 'match_end', 'limit', 'filth_type', 'ignore_case', 'ignore_whitespace', 'ignore_partial_word_matches',
+    ])
+    _csv_true_values = frozenset(['1', 'true', 't', 'yes', 'y'])
+    _csv_false_values = frozenset(['0', 'false', 'f', 'no', 'n'])
+
+    _whitespace_regex = re.compile(r'\s+')
+
+    def __init__(self, known_filth_items: Iterable[KnownFilthItem], **kwargs):
         """Initialise the ``Detector``.
 
         :param known_filth_items: A list of dictionaries that describe items to be searched for in the dirty text.
             The keys `match` and `filth_type` are required, which give the text to be searched for and the type of
             filth that the `match` string represents.
-            See the class docstring for further details of available flags in this dictionary.
+            See the class docstring for further details of available flags in this dictionary. Any iterable of these
+            dictionaries can be given, which is read once.
         :type known_filth_items: list of dicts
         :param tagged_filth: Whether the filth has been tagged and should be used as truth when calculating filth
             finding accuracies.
@@ -113,37 +165,251 @@ class TaggedEvaluationFilthDetector(Detector):
         """
         super().__init__(**kwargs)
 
-        for item in known_filth_items:
-            if 'match' not in item or 'filth_type' not in item:
-                raise KeyError("Each known filth item (dict) needs both keys 'match' and 'filth_type'.")
-            if not isinstance(item['match'], str):
-                raise ValueError("The value of 'match' in each KnownItem should be a string. "
-                                 "Current value: " + item['match'].__repr__())
-            if not isinstance(item['filth_type'], str):
-                raise ValueError("The value of 'filth_type' in each KnownItem should be a string. "
-                                 "Current value: " + item['filth_type'].__repr__())
-            item['match'] = item['match'].strip()
-            item['filth_type'] = item['filth_type'].strip()
-            if 'match_end' in item:
-                if not isinstance(item['match_end'], str):
-                    raise ValueError("The value of 'match_end' in each KnownItem should be a string. "
-                                     "Current value: " + item['match_end'].__repr__())
-                item['match_end'] = item['match_end'].strip()
-
+        # Items that are the same once the default values are filled in are only kept once
+        self._known_filth_items = list(dict.fromkeys(
+            self._check_item(item) for item in known_filth_items
+        ))  # type: List[_KnownItem]
+        self.max_match_length = self._get_max_match_length(self._known_filth_items)
+        self._automata = self._build_automata(
+            self._known_filth_items, self.automaton_min_items, self.automaton_max_items
+        )  # type: Optional[Dict[Tuple[bool, bool], _Automaton]]
+        # The items that are searched for with a regex rather than with the automata
+        self._regex_items = [
+            i_item for i_item, item in enumerate(self._known_filth_items)
+            if self._automata is None or len(item.match_end) > 0 or len(item.match) == 0
+        ]  # type: List[int]
+
+    @classmethod
+    def _check_item(cls, item: KnownFilthItem) -> _KnownItem:
+        """Check that the known filth item is valid and return it as a ``_KnownItem``."""
+        if 'match' not in item or 'filth_type' not in item:
+            raise KeyError("Each known filth item (dict) needs both keys 'match' and 'filth_type'.")
+        if not isinstance(item['match'], str):
+            raise ValueError("The value of 'match' in each KnownItem should be a string. "
+                             "Current value: " + item['match'].__repr__())
+        if not isinstance(item['filth_type'], str):
+            raise ValueError("The value of 'filth_type' in each KnownItem should be a string. "
+                             "Current value: " + item['filth_type'].__repr__())
+        if 'match_end' in item and not isinstance(item['match_end'], str):
+            raise ValueError("The value of 'match_end' in each KnownItem should be a string. "
+                             "Current value: " + item['match_end'].__repr__())
+
+        if not cls._known_item_keys.issuperset(item.keys()):
             for key in item.keys():
-                if key not in ['match', 'match_end', 'limit', 'filth_type', 'ignore_case', 'ignore_whitespace',
-                               'ignore_partial_word_matches']:
+                if key not in cls._known_item_keys:
                     raise KeyError("Unexpected key '{}' in the known filth item.".format(key))
 
-        self._known_filth_items = self.dedup_dicts(known_filth_items)
+        # There are only a few filth types, so each is only kept in memory once
+        return _KnownItem(
+            item['match'].strip(),
+            sys.intern(item['filth_type'].strip()),
+            item.get('match_end', '').strip(),
+            int(item.get('limit', 150) or 150),
+            bool(item.get('ignore_case', False)),
+            bool(item.get('ignore_whitespace', False)),
+            bool(item.get('ignore_partial_word_matches', False)),
+        )
+
+    @classmethod
+    def from_csv(cls, path: str, encoding: str = 'utf-8', **kwargs) -> 'TaggedEvaluationFilthDetector':
+        """Create the detector from a CSV file of known filth items.
+
+        The first row of the file names the keys of the known filth items, such as ``match`` and ``filth_type``, and
+        each of the other rows is one known filth item. Empty values are left out of the item, and the
+        ``ignore_case``, ``ignore_whitespace`` and ``ignore_partial_word_matches`` columns can contain values such as
+        ``true``, ``false``, ``1`` or ``0``. The rows are read one at a time, so large files can be loaded.
+
+        :param path: The path to the CSV file
+        :type path: str
+        :param encoding: The encoding of the CSV file
+        :type encoding: str
+        :param kwargs: Any other arguments to pass to the detector, such as ``name`` or ``locale``
+        :return: The detector
+        :rtype: TaggedEvaluationFilthDetector
+        """
+        with open(path, newline='', encoding=encoding) as csv_file:
+            rows = csv.reader(csv_file)
+            keys = [key.strip() for key in next(rows, [])]
+            return cls(known_filth_items=(cls._csv_item(keys, row) for row in rows), **kwargs)
+
+    @classmethod
+    def from_jsonl(cls, path: str, encoding: str = 'utf-8', **kwargs) -> 'TaggedEvaluationFilthDetector':
+        """Create the detector from a file with a known filth item in JSON on each line, such as
+        ``{"match": "Anika", "filth_type": "name"}``.
+
+        The lines are read one at a time, so large files can be loaded. Empty lines are skipped.
+
+        :param path: The path to the JSON lines file
+        :type path: str
+        :param encoding: The encoding of the file
+        :type encoding: str
+        :param kwargs: Any other arguments to pass to the detector, such as ``name`` or ``locale``
+        :return: The detector
+        :rtype: TaggedEvaluationFilthDetector
+        """
+        with open(path, encoding=encoding) as jsonl_file:
+            return cls(known_filth_items=(json.loads(line) for line in jsonl_file if len(line.strip()) > 0), **kwargs)
+
+    @classmethod
+    def _csv_item(cls, keys: List[str], row: List[str]) -> KnownFilthItem:
+        """Turn a row read from a CSV file into a known filth item."""
+        item = {key: value for key, value in zip(keys, row) if len(value) > 0}  # type: Dict[str, Any]
+        if 'limit' in item:
+            item['limit'] = int(item['limit'])
+        for key in ('ignore_case', 'ignore_whitespace', 'ignore_partial_word_matches'):
+            if key not in item:
+                continue
+            value = item[key].strip().lower()
+            if value not in cls._csv_true_values and value not in cls._csv_false_values:
+                raise ValueError(
+                    "The value of '{}' should be true or false. Current value: {!r}".format(key, item[key])
+                )
+            item[key] = value in cls._csv_true_values
+        return item  # type: ignore
+
+    @staticmethod
+    def _get_max_match_length(known_filth_items: List[_KnownItem]) -> Optional[int]:
+        """Find the longest text that could be matched by the known filth items, which is unbounded if whitespace
+        is ignored."""
+        max_length = 0
+        for item in known_filth_items:
+            if item.ignore_whitespace:
+                return None
+            length = len(item.match)
+            if len(item.match_end) > 0:
+                length += item.limit + len(item.match_end)
+            max_length = max(max_length, length)
+        # One extra character each side for the word boundaries of ignore_partial_word_matches
+        return max_length + 2
 
     @staticmethod
-    def dedup_dicts(known_filth_items: List[KnownFilthItem]) -> List[KnownFilthItem]:
-        # It would be nicer to do this with a set, but sets and dictionaries dont work well together, plus this way
-        # we get to keep the typing info associated to these dicts.
+    def _build_automata(
+            known_filth_items: List[_KnownItem], min_items: int, max_items: int
+    ) -> Optional[Dict[Tuple[bool, bool], _Automaton]]:
+        """Build an automaton for each combination of the ``ignore_case`` and ``ignore_whitespace`` flags, that finds
+        all of the known filth items that have only a ``match``.
+
+        The automata are returned keyed by the flags. Patterns are lower case if ``ignore_case`` is set, and any
+        whitespace is a single space if ``ignore_whitespace`` is set. ``None`` is returned if there are fewer than
+        ``min_items`` items, and a ``utils.HashedLiteralMatcher`` is used if there are more than ``max_items``.
+        """
+        # The patterns of each automaton, the first item that each pattern belongs to and any other items
+        groups = {}  # type: Dict[Tuple[bool, bool], Tuple[Dict[str, int], array.array, Dict[int, List[int]]]]
+        n_items = 0
+        for i_item, item in enumerate(known_filth_items):
+            # Only the items that have just a ``match`` can be found with an automaton
+            if len(item.match_end) > 0 or len(item.match) == 0:
+                continue
+            n_items += 1
+
+            flags = (item.ignore_case, item.ignore_whitespace)
+            group = groups.get(flags, None)
+            if group is None:
+                group = groups[flags] = ({}, array.array('q'), {})
+            patterns, first_items, more_items = group
+
+            pattern = item.match.lower() if item.ignore_case else item.match
+            if item.ignore_whitespace:
+                pattern = ' '.join(pattern.split())
+            i_pattern = patterns.setdefault(pattern, len(patterns))
+            if i_pattern == len(first_items):
+                first_items.append(i_item)
+            else:
+                more_items.setdefault(i_pattern, []).append(i_item)
+
+        if n_items < max(1, min_items):
+            return None
+
+        matcher_cls = utils.AhoCorasick if n_items <= max_items else utils.HashedLiteralMatcher
+        return {
+            flags: _Automaton(matcher=matcher_cls(list(patterns.keys())), first_items=first_items,
+                              more_items=more_items)
+            for flags, (patterns, first_items, more_items) in groups.items()
+        }
+
+    @staticmethod
+    def _is_word_boundary(text: str, position: int) -> bool:
+        """Returns true if there is a word boundary (as matched by ``\\b`` in a regex) at ``position`` in ``text``."""
+        before = position > 0 and (text[position - 1].isalnum() or text[position - 1] == '_')
+        after = position < len(text) and (text[position].isalnum() or text[position] == '_')
+        return before != after
+
+    @classmethod
+    def _collapse_whitespace(cls, text: str) -> Tuple[str, List[int], List[int]]:
+        """Replace each run of whitespace in the text with a single space.
+
+        Returns the new text, and the positions in the new text and original text where each run and each piece of
+        text between the runs start, which are used to find the original position of any character in the new text.
+        """
+        new_positions = [0]
+        positions = [0]
+        shift = 0
+        for match in cls._whitespace_regex.finditer(text):
+            new_positions += [match.start() - shift, match.start() - shift + 1]
+            positions += [match.start(), match.end()]
+            shift += match.end() - match.start() - 1
+        return cls._whitespace_regex.sub(' ', text), new_positions, positions
+
+    def _find_all_with_automata(self, text: str, document_name: Optional[str]) -> Dict[int, List[Filth]]:
+        """Find the known filth items that are searched for with the automata, returning the filth found for each
+        item keyed by the index of the item. The filth is the same as would be found with ``_find_all``."""
+        found = {}  # type: Dict[int, List[Filth]]
+        if self._automata is None:
+            return found
+
+        for (ignore_case, ignore_whitespace), automaton in self._automata.items():
+            search_text = text.lower() if ignore_case else text
+            new_positions, positions = [0], [0]
+            if ignore_whitespace:
+                search_text, new_positions, positions = self._collapse_whitespace(search_text)
+
+            # Like re.finditer, each item can only be found again after the end of its last match
+            last_ends = {}  # type: Dict[int, int]
+            for start, i_pattern in automaton.matcher.iter_matches(search_text):
+                end = start + len(automaton.matcher.patterns[i_pattern])
+                pattern_items = [automaton.first_items[i_pattern]]
+                if i_pattern in automaton.more_items:
+                    pattern_items += automaton.more_items[i_pattern]
+                for i_item in pattern_items:
+                    if start < last_ends.get(i_item, 0):
+                        continue
+                    if self._known_filth_items[i_item].ignore_partial_word_matches and not (
+                            self._is_word_boundary(search_text, start) and self._is_word_boundary(search_text, end)
+                    ):
+                        continue
+                    last_ends[i_item] = end
+
+                    # Find the positions in the text before any whitespace was collapsed
+                    i_start = bisect.bisect_right(new_positions, start) - 1
+                    i_end = bisect.bisect_right(new_positions, end - 1) - 1
+                    beg = positions[i_start] + start - new_positions[i_start]
+                    beg_end = positions[i_end] + end - 1 - new_positions[i_end] + 1
+                    found.setdefault(i_item, []).append(self.create_filth(
+                        beg,
+                        beg_end,
+                        text[beg:beg_end],
+                        comparison_type=self._known_filth_items[i_item].filth_type,
+                        detector_name=self.name,
+                        document_name=document_name,
+                        locale=self.locale,
+                    ))
+        return found
+
+    @staticmethod
+    def dedup_dicts(known_filth_items: Iterable[KnownFilthItem]) -> List[KnownFilthItem]:
+        """Return the known filth items with any repeated items removed, keeping the first of each."""
         deduped = []  # type: List[KnownFilthItem]
+        seen = set()  # type: set
         for item in known_filth_items:
-            if item not in deduped:
+            try:
+                key = frozenset(item.items())
+            except TypeError:
+                # Items with values that can not be hashed are compared with each of the items kept so far
+                if item not in deduped:
+                    deduped.append(item)
+                continue
+            if key not in seen:
+                seen.add(key)
                 deduped.append(item)
 
         return deduped
@@ -260,36 +526,34 @@ class TaggedEvaluationFilthDetector(Detector):
         :return: An iterator to the discovered :class:`Filth`
         :rtype: Iterator[:class:`Filth`]
         """
-        for pii_item in self._known_filth_items:
+        automaton_filth = self._find_all_with_automata(text, document_name)
+        # The filth is yielded in the order of the known filth items, as it would be if each was searched for in turn
+        for i_item in sorted(itertools.chain(automaton_filth.keys(), self._regex_items)):
+            if i_item in automaton_filth:
+                yield from automaton_filth[i_item]
+                continue
+
             # could also implement other types in here too
-            ignore_case = pii_item.get('ignore_case', False)
-            ignore_whitespace = pii_item.get('ignore_whitespace', False)
-            ignore_partial_word_matches = pii_item.get('ignore_partial_word_matches', False)
-            if 'match' in pii_item and 'match_end' in pii_item and pii_item['match_end'] is not None \
-                    and len(pii_item['match_end']) > 0:
+            pii_item = self._known_filth_items[i_item]
+            if len(pii_item.match_end) > 0:
                 yield from self._find_all_between(
                         text,
-                        pii_item['match'],
-                        pii_item['match_end'],
-                        limit=int(pii_item.get('limit', 150) or 150),
-                        comparison_type=pii_item.get('filth_type', None),
+                        pii_item.match,
+                        pii_item.match_end,
+                        limit=pii_item.limit,
+                        comparison_type=pii_item.filth_type,
                         document_name=document_name,
-                        ignore_case=ignore_case,
-                        ignore_whitespace=ignore_whitespace,
-                        ignore_partial_word_matches=ignore_partial_word_matches,
+                        ignore_case=pii_item.ignore_case,
+                        ignore_whitespace=pii_item.ignore_whitespace,
+                        ignore_partial_word_matches=pii_item.ignore_partial_word_matches,
                 )
-            elif 'match' in pii_item:
+            else:
                 yield from self._find_all(
                         text,
-                        pii_item['match'],
-                        comparison_type=pii_item.get('filth_type', None),
+                        pii_item.match,
+                        comparison_type=pii_item.filth_type,
                         document_name=document_name,
-                        ignore_case=ignore_case,
-                        ignore_whitespace=ignore_whitespace,
-                        ignore_partial_word_matches=ignore_partial_word_matches,
-                )
-            else:
-                raise ValueError(
-                    "Unknown keys in predefined PII item: "
-                    "{}".format(pii_item.keys())
+                        ignore_case=pii_item.ignore_case,
+                        ignore_whitespace=pii_item.ignore_whitespace,
+                        ignore_partial_word_matches=pii_item.ignore_partial_word_matches,
                 )
@@ -1,8 +1,5 @@
 import re
-import textblob
-
-from textblob.blob import BaseBlob
-from textblob.en.taggers import PatternTagger
+import types
 
 from typing import Optional, Generator
 
@@ -11,8 +8,20 @@ from .base import RegexDetector
 from ..filth import NameFilth, Filth
 from ..utils import CanonicalStringSet
 
-# BaseBlob uses NLTKTagger as a pos_tagger, but it works wrong
-BaseBlob.pos_tagger = PatternTagger()
+
+def load_textblob() -> types.ModuleType:
+    """Import and return the ``textblob`` module.
+
+    textblob and nltk take a long time to import, so they are only imported when a detector that needs them is run.
+    """
+    import textblob
+    from textblob.blob import BaseBlob
+    from textblob.en.taggers import PatternTagger
+
+    # BaseBlob uses NLTKTagger as a pos_tagger, but it works wrong
+    if not isinstance(BaseBlob.pos_tagger, PatternTagger):
+        BaseBlob.pos_tagger = PatternTagger()
+    return textblob
 
 
 @register_detector
@@ -42,6 +51,8 @@ class TextBlobNameDetector(RegexDetector):
                 'NameDetector.disallowed_nouns must be CanonicalStringSet'
             )
 
+        textblob = load_textblob()
+
         # find the set of proper nouns using textblob.
         proper_nouns = set()
         blob = textblob.TextBlob(text)
@@ -57,8 +68,11 @@ class TextBlobNameDetector(RegexDetector):
             re_list = []
             for proper_noun in proper_nouns:
                 re_list.append(r'\b' + re.escape(str(proper_noun)) + r'\b')
-            self.regex = re.compile('|'.join(re_list))
-            yield from super(TextBlobNameDetector, self).iter_filth(text, document_name=document_name)
+            # The regex is kept local (rather than set on self.regex) so that a detector can be shared between threads
+            regex = re.compile('|'.join(re_list))
+            for match in regex.finditer(text):
+                yield self.filth_cls(match=match, detector_name=self.name, document_name=document_name,
+                                     locale=self.locale)
         return
 
     @classmethod
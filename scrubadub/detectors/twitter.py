@@ -13,6 +13,8 @@ class TwitterDetector(RegexDetector):
     filth_cls = TwitterFilth
     name = 'twitter'
     autoload = True
+    max_match_length = 17
+    required_literals = (('@', ), )
 
     # https://help.twitter.com/en/managing-your-account/twitter-username-rules#error
     # Twitter user names must be 15 or less charachtors and only contain a-zA-Z0-9_
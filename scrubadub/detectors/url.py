@@ -18,6 +18,10 @@ class UrlDetector(RegexDetector):
     filth_cls = UrlFilth
     name = 'url'
     autoload = True
+    # the path is not limited by the regex, so URLs longer than this may be cut at a window edge
+    max_match_length = 2048
+    # The regex is case sensitive and needs a protocol or a leading www.
+    required_literals = (('http', 'www.'), )
 
     # this regular expression is convenient for captures the domain name
     # and the path separately, which is useful for keeping the domain name
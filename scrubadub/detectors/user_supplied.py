@@ -1,8 +1,8 @@
 from typing import Optional
 
 from scrubadub.detectors.catalogue import register_detector
-from .. import filth as filth_module
 from ..filth.base import Filth
+from ..filth.catalogue import get_filth_class
 from .tagged import TaggedEvaluationFilthDetector
 
 
@@ -26,7 +26,8 @@ class UserSuppliedFilthDetector(TaggedEvaluationFilthDetector):
 
         * ``match`` (`str`) - a string value that will be searched for in the text
         * ``filth_type`` (`str`) - a string value that indicates the type of Filth, should be set to ``Filth.name``.
-          An example of these could be 'name' or 'phone' for name and phone filths respectively.
+          An example of these could be 'name' or 'phone' for name and phone filths respectively. Any ``Filth``
+          registered with ``scrubadub.filth.register_filth`` can be used.
 
     The known filth item dictionary may also optionally contain:
 
@@ -48,6 +49,9 @@ class UserSuppliedFilthDetector(TaggedEvaluationFilthDetector):
         * ``{'match': '012345', 'filth_type': 'phone', 'ignore_partial_word_matches': True}`` - will search for an
           exact match to 012345, ignoring any partial matches and return it as a ``PhoneFilth``
 
+    Long lists of known filth items can be loaded from a CSV file or a JSON lines file with ``from_csv(path)`` or
+    ``from_jsonl(path)``.
+
     This detector is not enabled by default (since you need to supply a list of known filths) and so you must always
     add it to your scrubber with a ``scrubber.add_detector(detector)`` call or by adding it to the ``detector_list``
     inialising a ``Scrubber``.
@@ -59,29 +63,11 @@ class UserSuppliedFilthDetector(TaggedEvaluationFilthDetector):
             self, start_location: int, end_location: int, text: str, comparison_type: Optional[str],
             detector_name: str, document_name: Optional[str], locale: str
     ) -> Filth:
-        for item_name in dir(filth_module):
-            try:
-                filth_cls = filth_module.__getattribute__(item_name)
-            except AttributeError:
-                continue
-
-            if not isinstance(filth_cls, type) or not issubclass(filth_cls, Filth):
-                continue
-
-            try:
-                filth_type = filth_cls.type
-            except AttributeError:
-                continue
-
-            if filth_type != comparison_type:
-                continue
-
-            return filth_cls(
-                start_location,
-                end_location,
-                text,
-                detector_name=detector_name,
-                document_name=document_name,
-                locale=locale,
-            )
-        raise KeyError(f"Unable to find filth '{comparison_type}'")
+        return get_filth_class(comparison_type or '')(
+            start_location,
+            end_location,
+            text,
+            detector_name=detector_name,
+            document_name=document_name,
+            locale=locale,
+        )
@@ -11,6 +11,8 @@ class VehicleLicencePlateDetector(RegionLocalisedRegexDetector):
     filth_cls = VehicleLicencePlateFilth
     name = 'vehicle_licence_plate'
     autoload = True
+    max_match_length = 16
+    required_digits = 1
 
     # Vehicle Registration Plates from:
     # https://gist.github.com/harry-jones/755501192139820eeb65e030fe878f75
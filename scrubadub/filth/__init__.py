@@ -1,3 +1,4 @@
+from .catalogue import filth_catalogue, register_filth, remove_filth
 from .base import Filth, MergedFilth, RegexFilth
 from .address import AddressFilth
 from .credential import CredentialFilth
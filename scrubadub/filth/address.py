@@ -1,13 +1,20 @@
 import string
 import random
 
-from faker import Faker
+from typing import TYPE_CHECKING
 
 from .base import Filth
+from .catalogue import register_filth
 
+if TYPE_CHECKING:
+    from faker import Faker
 
+
+@register_filth
 class AddressFilth(Filth):
+    __slots__ = ()
     type = 'address'
+    autoload = True
 
     @staticmethod
     def _randomise_seperators(address: str) -> str:
@@ -76,7 +83,7 @@ class AddressFilth(Filth):
         return address
 
     @staticmethod
-    def _randomise_building(address: str, faker: Faker) -> str:
+    def _randomise_building(address: str, faker: 'Faker') -> str:
         target = random.choice(["add_building", "no_change", "no_change", "no_change"])
         if target == "add_building":
             if bool(random.getrandbits(1)):
@@ -97,7 +104,7 @@ class AddressFilth(Filth):
         return address
 
     @staticmethod
-    def generate(faker: Faker) -> str:
+    def generate(faker: 'Faker') -> str:
         """Generates an example of this ``Filth`` type, usually using the faker python library.
 
         :param faker: The ``Faker`` class from the ``faker`` library
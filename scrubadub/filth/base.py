@@ -1,16 +1,93 @@
+import sys
 import warnings
-from faker import Faker
-from typing import Optional, ClassVar, Pattern, List, Match
+from typing import Optional, ClassVar, Pattern, List, Match, Dict, Tuple, Union, Any, Sequence, TYPE_CHECKING
 
 from .. import exceptions
 from .. import utils
+from .catalogue import register_filth
 
+if TYPE_CHECKING:
+    from faker import Faker
 
+
+_slot_names_cache = {}  # type: Dict[type, Tuple[str, ...]]
+
+
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """Return the names of the attributes kept in the ``__slots__`` of a class and its base classes."""
+    try:
+        return _slot_names_cache[cls]
+    except KeyError:
+        pass
+    names = []  # type: List[str]
+    for base_cls in reversed(cls.__mro__):
+        slots = base_cls.__dict__.get('__slots__', ())
+        for name in ((slots, ) if isinstance(slots, str) else slots):
+            if name not in ('__dict__', '__weakref__') and name not in names:
+                names.append(name)
+    _slot_names_cache[cls] = tuple(names)
+    return _slot_names_cache[cls]
+
+
+class DetachedMatch(object):
+    """A picklable stand-in for a ``re.Match`` object.
+
+    A ``re.Match`` can not be pickled and holds on to the whole text that was searched, so this keeps only the matched
+    text and the spans of the groups within it. The spans are relative to the start of the match, so that
+    ``match.string[match.start():match.end()]`` still returns the matched text.
+    """
+
+    __slots__ = ('string', 're', '_offset', '_regs')
+
+    def __init__(self, match: Match):
+        self.string = match.group(0)  # type: str
+        self.re = match.re  # type: Pattern
+        # The spans of the groups in the searched text, which are only moved to be relative to the match when used
+        self._offset = match.start()  # type: int
+        self._regs = match.regs  # type: Tuple[Tuple[int, int], ...]
+
+    def _group_index(self, group: Union[int, str]) -> int:
+        if isinstance(group, str):
+            return self.re.groupindex[group]
+        return group
+
+    def span(self, group: Union[int, str] = 0) -> Tuple[int, int]:
+        beg, end = self._regs[self._group_index(group)]
+        if beg < 0:
+            return -1, -1
+        return beg - self._offset, end - self._offset
+
+    def start(self, group: Union[int, str] = 0) -> int:
+        return self.span(group)[0]
+
+    def end(self, group: Union[int, str] = 0) -> int:
+        return self.span(group)[1]
+
+    def group(self, group: Union[int, str] = 0) -> Optional[str]:
+        beg, end = self.span(group)
+        if beg < 0:
+            return None
+        return self.string[beg:end]
+
+    def groupdict(self, default: Optional[str] = None) -> Dict[str, Optional[str]]:
+        return {
+            name: self.group(name) if self.start(name) >= 0 else default
+            for name in self.re.groupindex.keys()
+        }
+
+
+@register_filth
 class Filth(object):
     """This is the base class for all ``Filth`` that is detected in dirty dirty
     text.
+
+    The attributes of each ``Filth`` are kept in ``__slots__`` rather than in a ``__dict__``, as there can be millions
+    of them. Subclasses that add their own attributes should list them in ``__slots__`` too, although subclasses that
+    do not define ``__slots__`` still work as they are given a ``__dict__``.
     """
 
+    __slots__ = ('beg', 'end', 'text', 'match', 'detector_name', 'document_name', 'replacement_string', 'locale')
+
     # this allows people to customize the output, especially for placeholder
     # text and identifier replacements
     prefix = u'{{'  # type: ClassVar[str]
@@ -26,6 +103,13 @@ class Filth(object):
     # For backwards compatibility, but this is deprecated.
     regex = None  # type: Optional[Pattern[str]]
 
+    # A re.Match holds on to the whole document that was searched, so by default only a DetachedMatch with the
+    # positions of the groups is kept. Set this to True to keep the original re.Match.
+    retain_match = False  # type: ClassVar[bool]
+
+    # Whether scrubadub.comparison.make_fake_document() includes this type of filth by default, see register_filth
+    autoload = False  # type: ClassVar[bool]
+
     def __init__(self, beg: Optional[int] = None, end: Optional[int] = None, text: Optional[str] = None,
                  match: Optional[Match] = None, detector_name: Optional[str] = None,
                  document_name: Optional[str] = None, replacement_string: Optional[str] = None,
@@ -34,13 +118,12 @@ class Filth(object):
         self.beg = 0  # type: int
         self.end = 0  # type: int
         self.text = ''  # type: str
-        self.match = None  # type: Optional[Match]
+        self.match = None  # type: Optional[Union[Match, DetachedMatch]]
 
         if match is not None and isinstance(match, Match):
-            self.beg = match.start()
-            self.end = match.end()
-            self.text = match.string[match.start():match.end()]
-            self.match = match
+            self.beg, self.end = match.span()
+            self.text = match.group(0)
+            self.match = match if self.retain_match else DetachedMatch(match)
 
         if beg is not None:
             self.beg = beg
@@ -49,10 +132,11 @@ class Filth(object):
         if text is not None:
             self.text = text
 
-        self.detector_name = detector_name  # type: Optional[str]
+        # There are only a few different detector names and locales, so each Filth can share the same string
+        self.detector_name = sys.intern(detector_name) if detector_name is not None else None  # type: Optional[str]
         self.document_name = document_name  # type: Optional[str]
         self.replacement_string = replacement_string  # type: Optional[str]
-        self.locale = locale  # type: Optional[str]
+        self.locale = sys.intern(locale) if locale is not None else None  # type: Optional[str]
 
         if self.beg >= self.end:
             raise ValueError(
@@ -127,8 +211,26 @@ class Filth(object):
 
         return match
 
+    def __getstate__(self) -> Dict[str, Any]:
+        state = {
+            name: getattr(self, name)
+            for name in _slot_names(type(self))
+            if hasattr(self, name)
+        }  # type: Dict[str, Any]
+        state.update(getattr(self, '__dict__', {}))
+        # A re.Match can not be pickled, which is needed to send Filth between processes
+        if isinstance(state.get('match', None), Match):
+            state['match'] = DetachedMatch(state['match'])
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        for name, value in state.items():
+            if name in ('detector_name', 'locale') and value is not None:
+                value = sys.intern(value)
+            setattr(self, name, value)
+
     @staticmethod
-    def generate(faker: Faker) -> str:
+    def generate(faker: 'Faker') -> str:
         """Generates an example of this ``Filth`` type, usually using the faker python library.
 
         :param faker: The ``Faker`` class from the ``faker`` library
@@ -145,6 +247,8 @@ class Filth(object):
 class MergedFilth(Filth):
     """This class takes care of merging different types of filth"""
 
+    __slots__ = ('filths', )
+
     def __init__(self, a_filth: Filth, b_filth: Filth):
         super(MergedFilth, self).__init__(
             beg=a_filth.beg,
@@ -155,6 +259,50 @@ class MergedFilth(Filth):
         self.filths = [a_filth]
         self._update_content(b_filth)
 
+    @classmethod
+    def from_filths(cls, filth_list: Sequence[Filth]) -> 'MergedFilth':
+        """Merge several overlapping filths at once, which avoids building the text again for each of them.
+
+        :param filth_list: The filths to merge, sorted by their start position. Each must overlap or touch the
+            filths before it and be in the same document.
+        :type filth_list: Sequence[Filth]
+        :return: The merged filth
+        :rtype: MergedFilth
+        """
+        if len(filth_list) < 2:
+            raise exceptions.FilthMergeError("At least two filths are needed to make a MergedFilth")
+
+        first = filth_list[0]
+        end = first.end
+        text_parts = [first.text]
+        filths = []  # type: List[Filth]
+        for filth in filth_list:
+            if filth.document_name != first.document_name:
+                raise exceptions.FilthMergeError(
+                    "This MergedFilth is in document {}, but the Filth that is being merged is in another document {}"
+                    "".format(first.document_name.__repr__(), filth.document_name.__repr__())
+                )
+            if end < filth.beg or filth.beg < first.beg:
+                raise exceptions.FilthMergeError(
+                    "a_filth goes from [%s, %s) and b_filth goes from [%s, %s)" % (first.beg, end, filth.beg, filth.end)
+                )
+            if filth.end - filth.beg != len(filth.text):
+                raise exceptions.FilthMergeError("text length isn't consistent")
+            if filth.end > end:
+                text_parts.append(filth.text[end - filth.beg:])
+                end = filth.end
+            # Keep the filths flat rather than nesting MergedFilths
+            if isinstance(filth, MergedFilth):
+                filths.extend(filth.filths)
+            else:
+                filths.append(filth)
+
+        merged_filth = cls.__new__(cls)
+        Filth.__init__(merged_filth, beg=first.beg, end=end, text=''.join(text_parts),
+                       document_name=first.document_name)
+        merged_filth.filths = filths
+        return merged_filth
+
     def _update_content(self, other_filth: Filth):
         """this updates the bounds, text and placeholder for the merged
         filth
@@ -188,13 +336,12 @@ class MergedFilth(Filth):
         if self.end - self.beg != len(self.text):
             raise exceptions.FilthMergeError("text length isn't consistent")
 
-        # update the placeholder
         self.filths.append(other_filth)
-        self._placeholder = '+'.join([filth.type for filth in self.filths])
 
     @property
     def placeholder(self):
-        return self._placeholder.upper()
+        # This is only built when it is needed, as it would otherwise be rebuilt for each filth that is merged
+        return '+'.join([filth.type for filth in self.filths]).upper()
 
     def merge(self, other_filth: Filth) -> 'MergedFilth':
         """Be smart about merging filth in this case to avoid nesting merged
@@ -208,6 +355,8 @@ class MergedFilth(Filth):
 
 
 class RegexFilth(Filth):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         warnings.warn("Use of RegexFilth is depreciated, use Filth directly instead.", DeprecationWarning)
         super(RegexFilth, self).__init__(*args, **kwargs)
@@ -0,0 +1,115 @@
+import inspect
+import catalogue
+
+from typing import Type, Optional, Union, Dict, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from scrubadub.filth import Filth
+
+filth_catalogue = catalogue.create('scrubadub', 'filth', entry_points=True)
+
+# Incremented each time the catalogue changes, so that anything built from the catalogue knows to rebuild
+catalogue_version = 0
+
+_filth_classes = None  # type: Optional[Tuple[int, Dict[str, Type[Filth]]]]
+
+
+def register_filth(filth: Type['Filth'], *, autoload: Optional[bool] = None) -> Type['Filth']:
+    """Register a type of ``Filth``, so that it can be found from its ``Filth.type``.
+
+    The ``UserSuppliedFilthDetector`` uses this catalogue to create the ``Filth`` of each ``filth_type`` in its known
+    filth items. You can use ``register_filth(NewFilth)`` after your ``Filth`` definition to make it available.
+
+    The argument ``autoload`` decides whether ``scrubadub.comparison.make_fake_document()`` includes this ``Filth`` in
+    the documents it generates by default, which needs the ``Filth`` to implement ``Filth.generate()``.
+
+    .. code:: pycon
+
+        >>> import scrubadub
+        >>> class NewFilth(scrubadub.filth.Filth):
+        ...     type = 'new_filth'
+        >>> scrubadub.filth.register_filth(NewFilth)
+        <class 'scrubadub.filth.catalogue.NewFilth'>
+        >>> scrubadub.filth.catalogue.get_filth_class('new_filth')
+        <class 'scrubadub.filth.catalogue.NewFilth'>
+
+    :param filth: The ``Filth`` to register with the scrubadub filth configuration.
+    :type filth: Filth class
+    :param autoload: Whether to include this ``Filth`` in fake documents by default.
+    :type autoload: Optional[bool]
+    """
+    global catalogue_version
+
+    if not inspect.isclass(filth):
+        raise ValueError("filth should be a class, not an instance.")
+
+    if autoload is not None:
+        filth.autoload = autoload
+
+    filth_catalogue.register(filth.type, func=filth)
+    catalogue_version += 1
+
+    return filth
+
+
+def remove_filth(filth: Union[Type['Filth'], str]):
+    """Remove an already registered type of ``Filth``.
+
+    .. code:: pycon
+
+        >>> import scrubadub
+        >>> class NewFilth(scrubadub.filth.Filth):
+        ...     type = 'new_filth'
+        >>> scrubadub.filth.catalogue.register_filth(NewFilth)
+        <class 'scrubadub.filth.catalogue.NewFilth'>
+        >>> scrubadub.filth.catalogue.remove_filth(NewFilth)
+
+    :param filth: The ``Filth`` to remove from the scrubadub filth configuration, or its ``Filth.type``.
+    :type filth: Union[Type['Filth'], str]
+    """
+    global catalogue_version
+
+    if isinstance(filth, str):
+        if filth in filth_catalogue:
+            catalogue._remove((*filth_catalogue.namespace, filth))
+            catalogue_version += 1
+
+    elif inspect.isclass(filth):
+        if filth.type in filth_catalogue:
+            catalogue._remove((*filth_catalogue.namespace, filth.type))
+            catalogue_version += 1
+
+    else:
+        raise ValueError("filth should be a class (not an instance) or a string.")
+
+
+def get_filth_classes() -> Dict[str, Type['Filth']]:
+    """Return all of the registered types of ``Filth``, including those registered by other packages.
+
+    Reading the catalogue looks through the entry points of all installed packages, so the result is kept until the
+    catalogue next changes.
+
+    :return: The ``Filth`` classes, keyed by their ``Filth.type``
+    :rtype: Dict[str, Type[Filth]]
+    """
+    global _filth_classes
+
+    filth_classes = _filth_classes
+    if filth_classes is None or filth_classes[0] != catalogue_version:
+        filth_classes = (catalogue_version, filth_catalogue.get_all())
+        _filth_classes = filth_classes
+    return filth_classes[1]
+
+
+def get_filth_class(filth_type: str) -> Type['Filth']:
+    """Return the registered ``Filth`` class with the given ``Filth.type``.
+
+    :param filth_type: The ``Filth.type`` of the ``Filth``
+    :type filth_type: str
+    :return: The ``Filth`` class
+    :rtype: Type[Filth]
+    """
+    try:
+        return get_filth_classes()[filth_type]
+    except KeyError:
+        raise KeyError(f"Unable to find filth '{filth_type}'")
@@ -1,8 +1,11 @@
 from .base import Filth
+from .catalogue import register_filth
 from .. import exceptions
 
 
+@register_filth
 class CredentialFilth(Filth):
+    __slots__ = ()
     type = 'credential'
 
     # specify how the username/password are replaced
@@ -1,15 +1,20 @@
 import string
-import stdnum.luhn
-from faker import Faker
+from typing import TYPE_CHECKING
 
 from .base import Filth
+from .catalogue import register_filth
 
+if TYPE_CHECKING:
+    from faker import Faker
 
+
+@register_filth
 class CreditCardFilth(Filth):
+    __slots__ = ()
     type = 'credit_card'
 
     @staticmethod
-    def generate(faker: Faker) -> str:
+    def generate(faker: 'Faker') -> str:
         """Generates an example of this ``Filth`` type, usually using the faker python library.
 
         :param faker: The ``Faker`` class from the ``faker`` library
@@ -20,4 +25,6 @@ class CreditCardFilth(Filth):
         return faker.credit_card_number()
 
     def is_valid(self) -> bool:
+        import stdnum.luhn
+
         return stdnum.luhn.is_valid(''.join(char for char in self.text if char in string.digits))
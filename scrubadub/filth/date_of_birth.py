@@ -1,18 +1,23 @@
 import random
 import datetime
-import dateparser
-from faker import Faker
+from typing import TYPE_CHECKING
 
 from .base import Filth
+from .catalogue import register_filth
 
+if TYPE_CHECKING:
+    from faker import Faker
 
+
+@register_filth
 class DateOfBirthFilth(Filth):
+    __slots__ = ()
     type = 'date_of_birth'
     min_age_years = 18
     max_age_years = 100
 
     @staticmethod
-    def generate(faker: Faker) -> str:
+    def generate(faker: 'Faker') -> str:
         """Generates an example of this ``Filth`` type, usually using the faker python library.
 
         :param faker: The ``Faker`` class from the ``faker`` library
@@ -32,6 +37,8 @@ class DateOfBirthFilth(Filth):
 
     def is_valid(self) -> bool:
         """Check to see if the found filth is valid."""
+        import dateparser
+
         found_date = dateparser.parse(self.text)
         if found_date is None:
             return False
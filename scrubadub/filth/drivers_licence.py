@@ -1,5 +1,8 @@
 from .base import Filth
+from .catalogue import register_filth
 
 
+@register_filth
 class DriversLicenceFilth(Filth):
+    __slots__ = ()
     type = 'drivers_licence'
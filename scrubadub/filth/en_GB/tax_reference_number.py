@@ -1,5 +1,8 @@
 from scrubadub.filth.base import Filth
+from scrubadub.filth.catalogue import register_filth
 
 
+@register_filth
 class TaxReferenceNumberFilth(Filth):
+    __slots__ = ()
     type = 'tax_reference_number'
@@ -1,14 +1,20 @@
-from faker import Faker
-import stdnum.us.ssn
+from typing import TYPE_CHECKING
 
 from scrubadub.filth.base import Filth
+from scrubadub.filth.catalogue import register_filth
 
+if TYPE_CHECKING:
+    from faker import Faker
 
+
+@register_filth
 class SocialSecurityNumberFilth(Filth):
+    __slots__ = ()
     type = 'social_security_number'
+    autoload = True
 
     @staticmethod
-    def generate(faker: Faker) -> str:
+    def generate(faker: 'Faker') -> str:
         """Generates an example of this ``Filth`` type, usually using the faker python library.
 
         :param faker: The ``Faker`` class from the ``faker`` library
@@ -16,6 +22,8 @@ class SocialSecurityNumberFilth(Filth):
         :return: An example of this ``Filth``
         :rtype: str
         """
+        import stdnum.us.ssn
+
         ssn = ''
         if faker.locales == ['en_US']:
             while not stdnum.us.ssn.is_valid(ssn):
@@ -23,4 +31,6 @@ class SocialSecurityNumberFilth(Filth):
         return faker.ssn()
 
     def is_valid(self) -> bool:
+        import stdnum.us.ssn
+
         return stdnum.us.ssn.is_valid(''.join(char for char in self.text if char not in '. -'))
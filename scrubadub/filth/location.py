@@ -1,13 +1,19 @@
-from faker import Faker
+from typing import TYPE_CHECKING
 
 from .base import Filth
+from .catalogue import register_filth
 
+if TYPE_CHECKING:
+    from faker import Faker
 
+
+@register_filth
 class LocationFilth(Filth):
+    __slots__ = ()
     type = 'location'
 
     @staticmethod
-    def generate(faker: Faker) -> str:
+    def generate(faker: 'Faker') -> str:
         """Generates an example of this ``Filth`` type, usually using the faker python library.
 
         :param faker: The ``Faker`` class from the ``faker`` library
@@ -1,18 +1,23 @@
 import re
-import phonenumbers
 
-from faker import Faker
-from typing import List
+from typing import List, TYPE_CHECKING
 
 from .base import Filth
+from .catalogue import register_filth
 from .. import utils
 
+if TYPE_CHECKING:
+    from faker import Faker
 
+
+@register_filth
 class PhoneFilth(Filth):
+    __slots__ = ()
     type = 'phone'
+    autoload = True
 
     @staticmethod
-    def generate(faker: Faker) -> str:
+    def generate(faker: 'Faker') -> str:
         """Generates an example of this ``Filth`` type, usually using the faker python library.
 
         :param faker: The ``Faker`` class from the ``faker`` library
@@ -20,6 +25,8 @@ class PhoneFilth(Filth):
         :return: An example of this ``Filth``
         :rtype: str
         """
+        import phonenumbers
+
         phone_number = ''
         language, region = utils.locale_split(faker._locales[0])
         results = []  # type: List[phonenumbers.PhoneNumberMatch]
@@ -1,9 +1,12 @@
 from .base import Filth
+from .catalogue import register_filth
 
 import typing
 
 
+@register_filth
 class TaggedEvaluationFilth(Filth):
+    __slots__ = ('comparison_type', )
     type = 'tagged'
 
     def __init__(self, *args, comparison_type: typing.Optional[str] = None, **kwargs):
@@ -1,10 +1,17 @@
-from faker import Faker
+from typing import TYPE_CHECKING
 
 from .base import Filth
+from .catalogue import register_filth
 
+if TYPE_CHECKING:
+    from faker import Faker
 
+
+@register_filth
 class UrlFilth(Filth):
+    __slots__ = ()
     type = 'url'
+    autoload = True
 
     # This allows you to keep the domain
     keep_domain = False
@@ -20,7 +27,7 @@ class UrlFilth(Filth):
         return self.url_placeholder
 
     @staticmethod
-    def generate(faker: Faker) -> str:
+    def generate(faker: 'Faker') -> str:
         """Generates an example of this ``Filth`` type, usually using the faker python library.
 
         :param faker: The ``Faker`` class from the ``faker`` library
@@ -0,0 +1,220 @@
+"""Stores of the numbers that ``FilthReplacer(include_count=True)`` gives to each piece of ``Filth``.
+
+Each distinct text of each type of ``Filth`` is given the next number for its type, counting from zero, so that the
+same email address is replaced with the same ``EMAIL-<number>`` everywhere it is found. By default these numbers are
+kept in memory in a store that is shared by all ``FilthReplacer``\\ s and never forgets a number. A store can be
+passed to ``FilthReplacer(lookup_store=...)`` to limit its size, keep the numbers between runs or share the numbers
+between processes:
+
+.. code:: pycon
+
+    >>> import scrubadub, scrubadub.lookup
+    >>> scrubber = scrubadub.Scrubber(post_processor_list=[
+    ...     scrubadub.post_processors.FilthReplacer(
+    ...         include_count=True, lookup_store=scrubadub.lookup.MemoryLookupStore(max_entries=10000)
+    ...     ),
+    ... ])
+    >>> scrubber.clean("Contact me at joe@example.com or jane@example.com, joe@example.com is best")
+    'Contact me at EMAIL-0 or EMAIL-1, EMAIL-0 is best'
+
+When a store with ``max_entries`` is full the least recently used text is forgotten. The numbers of a type only ever
+increase, so a forgotten text that is found again is given a new number rather than one that is already in use.
+"""
+import sqlite3
+import threading
+import collections
+
+from typing import Optional, Dict, Tuple, Any
+
+from .utils import PicklableLockMixin
+from ._sqlite_lru import SqliteLRU
+
+
+class LookupStore(object):
+    """Base class for the stores that give a number to each distinct text of each type of ``Filth``.
+
+    ``store[filth_type][text]`` is the same as ``store.get_id(filth_type, text)``, as the stores replace the
+    ``defaultdict`` of ``utils.Lookup`` that was used before.
+    """
+
+    def get_id(self, filth_type: str, text: str) -> int:
+        """Return the number of ``text``, giving it the next number for ``filth_type`` if it does not have one.
+
+        :param filth_type: The type of the ``Filth``
+        :type filth_type: str
+        :param text: The text of the ``Filth``
+        :type text: str
+        :return: The number of the text
+        :rtype: int
+        """
+        raise NotImplementedError('must be implemented in derived classes')
+
+    def clear(self):
+        """Forget all of the numbers, so that each type counts from zero again."""
+        raise NotImplementedError('must be implemented in derived classes')
+
+    def __len__(self) -> int:
+        raise NotImplementedError('must be implemented in derived classes')
+
+    def __getitem__(self, filth_type: str) -> '_TypedLookup':
+        return _TypedLookup(self, filth_type)
+
+
+class _TypedLookup(object):
+    """The numbers of one type of ``Filth`` in a ``LookupStore``."""
+
+    def __init__(self, store: LookupStore, filth_type: str):
+        self.store = store
+        self.filth_type = filth_type
+
+    def __getitem__(self, text: str) -> int:
+        return self.store.get_id(self.filth_type, text)
+
+
+class MemoryLookupStore(PicklableLockMixin, LookupStore):
+    """Keeps the numbers in memory.
+
+    :param max_entries: The maximum number of texts to remember, no limit if ``None``.
+    :type max_entries: int, optional
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries
+        self._ids = collections.OrderedDict()  # type: collections.OrderedDict
+        self._next_ids = {}  # type: Dict[str, int]
+        self._lock = threading.Lock()
+
+    def get_id(self, filth_type: str, text: str) -> int:
+        key = (filth_type, text)
+        with self._lock:
+            identifier = self._ids.get(key, None)  # type: Optional[int]
+            if identifier is not None:
+                if self.max_entries is not None:
+                    self._ids.move_to_end(key)
+                return identifier
+
+            identifier = self._next_ids.get(filth_type, 0)
+            self._next_ids[filth_type] = identifier + 1
+            self._ids[key] = identifier
+            if self.max_entries is not None:
+                while len(self._ids) > max(1, self.max_entries):
+                    self._ids.popitem(last=False)
+            return identifier
+
+    def clear(self):
+        with self._lock:
+            self._ids.clear()
+            self._next_ids.clear()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class SqliteLookupStore(SqliteLRU, LookupStore):
+    """Keeps the numbers in an sqlite database, so that they are kept between runs.
+
+    The same database file can be used by several processes at the same time and they will all give the same number to
+    the same text. A ``FilthReplacer`` with this store that is sent to another process, such as by
+    ``Scrubber.clean_documents(workers=N)``, opens its own connection to the database.
+
+    :param path: The path of the sqlite database file.
+    :type path: str
+    :param max_entries: The maximum number of texts to remember, no limit if ``None``.
+    :type max_entries: int, optional
+    :param timeout: How long to wait, in seconds, when the database is locked by another process.
+    :type timeout: float
+    """
+
+    table = 'filth_lookup'
+    key_columns = ('filth_type', 'text')
+
+    def _create_tables(self, connection: sqlite3.Connection):
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS filth_lookup '
+            '(filth_type TEXT NOT NULL, text TEXT NOT NULL, id INTEGER NOT NULL, last_used INTEGER NOT NULL, '
+            'PRIMARY KEY (filth_type, text))'
+        )
+        connection.execute('CREATE INDEX IF NOT EXISTS filth_lookup_last_used ON filth_lookup (last_used)')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS filth_lookup_next_id (filth_type TEXT PRIMARY KEY, next_id INTEGER NOT NULL)'
+        )
+
+    def get_id(self, filth_type: str, text: str) -> int:
+        # The check for a number and the creation of a new one happen in one transaction, so that several processes
+        # using the database give the same number to the same text
+        with self._transaction() as connection:
+            row = connection.execute(
+                'SELECT id FROM filth_lookup WHERE filth_type = ? AND text = ?', (filth_type, text)
+            ).fetchone()
+            if row is not None:
+                self._touch((filth_type, text))
+                return int(row[0])
+
+            row = connection.execute(
+                'SELECT next_id FROM filth_lookup_next_id WHERE filth_type = ?', (filth_type, )
+            ).fetchone()
+            identifier = 0 if row is None else int(row[0])
+            connection.execute(
+                'INSERT OR REPLACE INTO filth_lookup_next_id (filth_type, next_id) VALUES (?, ?)',
+                (filth_type, identifier + 1),
+            )
+            connection.execute(
+                'INSERT INTO filth_lookup (filth_type, text, id, last_used) VALUES (?, ?, ?, ?)',
+                (filth_type, text, identifier, self._next_counter()),
+            )
+            self._added()
+            return identifier
+
+    def clear(self):
+        with self._transaction() as connection:
+            self._clear_rows()
+            connection.execute('DELETE FROM filth_lookup_next_id')
+
+
+class ManagerLookupStore(LookupStore):
+    """Keeps the numbers in a ``MemoryLookupStore`` in a server process, so that they are shared by all processes.
+
+    This is useful with ``Scrubber.clean_documents(workers=N)``, where each worker process would otherwise number the
+    ``Filth`` it finds by itself. Copies of this store sent to other processes use the server started by the original,
+    which is stopped by ``ManagerLookupStore.close()`` or when the original is garbage collected.
+
+    :param max_entries: The maximum number of texts to remember, no limit if ``None``.
+    :type max_entries: int, optional
+    :param address: The address of the server, see ``multiprocessing.managers.BaseManager``.
+    :type address: Tuple[str, int], optional
+    :param authkey: The key used to authenticate with the server, see ``multiprocessing.managers.BaseManager``.
+    :type authkey: bytes, optional
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, address: Optional[Tuple[str, int]] = None,
+                 authkey: Optional[bytes] = None):
+        # multiprocessing.managers is slow to import, so it is only imported when it is used
+        from ._lookup_manager import LookupManager
+
+        self._manager = LookupManager(address=address, authkey=authkey)  # type: Optional[LookupManager]
+        self._manager.start()
+        self._store = self._manager.MemoryLookupStore(max_entries=max_entries)  # type: ignore
+
+    def get_id(self, filth_type: str, text: str) -> int:
+        return self._store.get_id(filth_type, text)
+
+    def clear(self):
+        self._store.clear()
+
+    def close(self):
+        """Stop the server process, after which none of the copies of this store can be used."""
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+    def __len__(self) -> int:
+        return self._store.__len__()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The copies only get the connection to the store, the server is run by the original
+        state = self.__dict__.copy()
+        state['_manager'] = None
+        return state
+
+
+__all__ = ['LookupStore', 'MemoryLookupStore', 'SqliteLookupStore', 'ManagerLookupStore']
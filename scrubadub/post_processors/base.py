@@ -1,16 +1,45 @@
-from typing import Optional, Sequence
+from typing import Optional, Sequence, Iterable, Iterator
 
 from ..filth import Filth
 
 
 class PostProcessor(object):
+    """Base class for the post-processors, which alter the ``Filth`` found by the detectors.
+
+    A post-processor that needs to see all of the ``Filth`` at once only needs to implement ``process_filth``. One
+    that handles each ``Filth`` by itself can set ``requires_collation = False`` and implement
+    ``process_filth_iterator``, which lets the ``Scrubber`` stream the ``Filth`` through it without first collecting
+    the ``Filth`` into a list. A subclass that overrides ``process_filth`` needs collation unless it sets
+    ``requires_collation`` itself, as ``process_filth`` is only called when the ``Filth`` is collated.
+    """
     name = 'post_processor'  # type: str
     autoload = False  # type: bool
     index = 10000  # type: int
+    requires_collation = True  # type: bool
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'process_filth' in vars(cls) and 'requires_collation' not in vars(cls):
+            cls.requires_collation = True
 
     def __init__(self, name: Optional[str] = None):
         if name is not None:
             self.name = name
 
     def process_filth(self, filth_list: Sequence[Filth]) -> Sequence[Filth]:
+        # Post-processors that only implement process_filth_iterator can still be given a list of Filth
+        if type(self).process_filth_iterator is not PostProcessor.process_filth_iterator:
+            return list(self.process_filth_iterator(filth_list))
         raise NotImplementedError('must be overridden by base classes')
+
+    def process_filth_iterator(self, filth_iterator: Iterable[Filth]) -> Iterator[Filth]:
+        """Processes the filth as it is iterated over.
+
+        By default the ``Filth`` is collected into a list and passed to ``process_filth``.
+
+        :param filth_iterator: The filth to be processed
+        :type filth_iterator: Iterable[Filth]
+        :return: The processed filths
+        :rtype: Iterator[Filth]
+        """
+        yield from self.process_filth(list(filth_iterator))
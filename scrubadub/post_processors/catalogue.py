@@ -8,6 +8,9 @@ if TYPE_CHECKING:
 
 post_processor_catalogue = catalogue.create('scrubadub', 'post_processors', entry_points=True)
 
+# Incremented each time the catalogue changes, so that anything built from the catalogue knows to rebuild
+catalogue_version = 0
+
 
 def register_post_processor(post_processor: Type['PostProcessor'], autoload: Optional[bool] = None,
                             index: Optional[int] = None) -> None:
@@ -25,6 +28,8 @@ def register_post_processor(post_processor: Type['PostProcessor'], autoload: Opt
     :param index: The location/index in which this ``PostProcessor`` should be added.
     :type index: int
     """
+    global catalogue_version
+
     if not inspect.isclass(post_processor):
         raise ValueError("post_processor should be a class, not an instance.")
 
@@ -35,6 +40,7 @@ def register_post_processor(post_processor: Type['PostProcessor'], autoload: Opt
         post_processor.index = index
 
     post_processor_catalogue.register(post_processor.name, func=post_processor)
+    catalogue_version += 1
 
 
 def remove_post_processor(post_processor: Union[Type['PostProcessor'], str]) -> None:
@@ -43,13 +49,17 @@ def remove_post_processor(post_processor: Union[Type['PostProcessor'], str]) ->
     :param post_processor: The ``PostProcessor`` to register with the scrubadub post-processor configuration.
     :type post_processor: Union[Type['PostProcessor'], str]
     """
+    global catalogue_version
+
     if isinstance(post_processor, str):
         if post_processor in post_processor_catalogue:
             catalogue._remove((*post_processor_catalogue.namespace, post_processor))
+            catalogue_version += 1
 
     elif inspect.isclass(post_processor):
         if post_processor.name in post_processor_catalogue:
             catalogue._remove((*post_processor_catalogue.namespace, post_processor.name))
+            catalogue_version += 1
 
     else:
         raise ValueError("post-processor should be a class (not an instance) or a string.")
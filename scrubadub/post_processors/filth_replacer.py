@@ -1,18 +1,21 @@
 
 import os
+import hmac
 import math
 import hashlib
+import threading
+import collections
 
-from typing import Sequence, Optional, Union, Dict
-from collections import defaultdict
+from typing import Any, Optional, Union, Dict, Iterable, Iterator
 
 from scrubadub.filth import Filth, MergedFilth, TaggedEvaluationFilth
 from scrubadub.post_processors.base import PostProcessor
 from scrubadub.post_processors.catalogue import register_post_processor
-from scrubadub import utils
+from scrubadub.lookup import LookupStore, MemoryLookupStore
+from scrubadub.utils import PicklableLockMixin
 
 
-class FilthReplacer(PostProcessor):
+class FilthReplacer(PicklableLockMixin, PostProcessor):
     """Creates tokens that are used to replace the Filth found in the text of a document.
 
     This can be configured to include the filth type (eg phone, name, email, ...), a unique number for each piece of
@@ -30,6 +33,12 @@ class FilthReplacer(PostProcessor):
     >>> scrubber.clean("Contact me at 522-368-8530 or hernandezjenna@example.com")
     'Contact me at PHONE-7358BF44 or EMAIL-AC0B8AC3'
     >>> scrubber = scrubadub.Scrubber(post_processor_list=[
+    ...     scrubadub.post_processors.FilthReplacer(include_hash=True, hash_salt='example', hash_length=8,
+    ...                                             hash_method='blake2b'),
+    ... ])
+    >>> scrubber.clean("Contact me at 522-368-8530 or hernandezjenna@example.com")
+    'Contact me at PHONE-4923FBB0 or EMAIL-EB99CEE3'
+    >>> scrubber = scrubadub.Scrubber(post_processor_list=[
     ...     scrubadub.post_processors.FilthReplacer(include_count=True),
     ... ])
     >>> scrubber.clean("Contact me at taylordaniel@example.com or hernandezjenna@example.com, "
@@ -39,15 +48,27 @@ class FilthReplacer(PostProcessor):
     name = 'filth_replacer'  # type: str
     autoload = False
     index = 0
+    # Each Filth is labelled by itself. The numbers used by include_count are given in the order that the Filth
+    # arrives, which is the same whether or not the Filth is collated first.
+    requires_collation = False
 
-    # NOTE: this is not an efficient way to store this in memory. could
-    # alternatively hash the type and text and do away with the overhead
-    # bits of storing the tuple in the lookup
-    typed_lookup = defaultdict(lambda: utils.Lookup(), {})  # type: Dict[str, utils.Lookup]
+    # The numbers used by include_count, which are shared by all FilthReplacers that are not given a lookup_store
+    typed_lookup = MemoryLookupStore()  # type: LookupStore
+
+    # The hashing methods that can be used and the longest hash, in hexadecimal characters, that each can make
+    hash_methods = {
+        'pbkdf2': None,
+        'blake2b': 2 * hashlib.blake2b.MAX_DIGEST_SIZE,
+        'hmac_sha256': 2 * hashlib.sha256().digest_size,
+    }  # type: Dict[str, Optional[int]]
+
+    # How many of the most recently made hashes each FilthReplacer remembers
+    hash_cache_size = 4096  # type: int
 
     def __init__(self, include_type: bool = True, include_count: bool = False, include_hash: bool = False,
                  uppercase: bool = True, separator: Optional[str] = None, hash_length: Optional[int] = None,
-                 hash_salt: Optional[Union[str, bytes]] = None, **kwargs):
+                 hash_salt: Optional[Union[str, bytes]] = None, hash_method: str = 'pbkdf2',
+                 lookup_store: Optional[LookupStore] = None, **kwargs):
         """Initialise the FilthReplacer.
 
         :param include_type:
@@ -64,6 +85,16 @@ class FilthReplacer(PostProcessor):
         :type hash_length: Optional[int], default None
         :param hash_salt: The salt used in the hashing process
         :type hash_salt: Optional[Union[str, bytes]], default None
+        :param hash_method: How the hash is made. ``'pbkdf2'`` uses PBKDF2-HMAC-SHA256 with 100,000 iterations, which
+            is slow by design. ``'blake2b'`` (keyed BLAKE2b) and ``'hmac_sha256'`` are many thousands of times faster
+            and, as the salt is used as their secret key, are as hard to reverse as long as the salt is kept secret.
+            Each ``FilthReplacer`` remembers the text and hash of the last ``hash_cache_size`` ``Filth`` that it hashed,
+            so that repeated ``Filth`` is only hashed once. These are kept until the ``FilthReplacer`` is deleted or
+            ``clear_hash_cache()`` is called, and are not copied when it is pickled.
+        :type hash_method: str, default 'pbkdf2'
+        :param lookup_store: Where the numbers used by ``include_count`` are kept, see ``scrubadub.lookup``. If this is
+            not set, the numbers are kept in memory and are shared by all ``FilthReplacer``\\ s.
+        :type lookup_store: scrubadub.lookup.LookupStore, optional
         """
         super(FilthReplacer, self).__init__(**kwargs)
         self.include_type = include_type
@@ -73,15 +104,43 @@ class FilthReplacer(PostProcessor):
         self.separator = separator or '+'
         self.hash_length = hash_length or 16
 
+        if hash_method not in self.hash_methods:
+            raise ValueError("Unknown hash_method '{}', expected one of: {}".format(
+                hash_method, ', '.join(self.hash_methods.keys())
+            ))
+        max_hash_length = self.hash_methods[hash_method]
+        if max_hash_length is not None and self.hash_length > max_hash_length:
+            raise ValueError("The hash_length can be at most {} when using the hash_method '{}'".format(
+                max_hash_length, hash_method
+            ))
+        self.hash_method = hash_method
+
+        if lookup_store is not None:
+            self.typed_lookup = lookup_store
+
         if isinstance(hash_salt, str):
             self.hash_salt = hash_salt.encode('utf8')  # type: bytes
         else:
             self.hash_salt = os.urandom(128)
 
+        self._hashes = collections.OrderedDict()  # type: collections.OrderedDict
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The remembered hashes hold the text of the Filth, so they are not copied
+        state = super().__getstate__()
+        state['_hashes'] = collections.OrderedDict()
+        return state
+
+    def clear_hash_cache(self):
+        """Forget the hashes that this FilthReplacer has made."""
+        with self._lock:
+            self._hashes.clear()
+
     @classmethod
     def reset_lookup(cls):
-        """Reset the lookups that maintain a map of filth to a numeric ID."""
-        cls.typed_lookup = defaultdict(lambda: utils.Lookup(), {})
+        """Reset the shared lookup that maintains a map of filth to a numeric ID."""
+        cls.typed_lookup.clear()
 
     def filth_label(self, filth: Filth) -> str:
         """This function takes a filth and creates a label that can be used to replace the original text.
@@ -113,10 +172,10 @@ class FilthReplacer(PostProcessor):
                 replacement_pieces.append(filth_type)
 
             if self.include_count:
-                replacement_pieces.append(str(FilthReplacer.typed_lookup[filth_type][f.text.lower()]))
+                replacement_pieces.append(str(self.typed_lookup.get_id(filth_type, f.text.lower())))
 
             if self.include_hash:
-                replacement_pieces.append(FilthReplacer.get_hash(f.text.lower(), self.hash_salt, self.hash_length))
+                replacement_pieces.append(self._get_filth_hash(f.text.lower()))
 
             if len(replacement_pieces) == 0:
                 replacement_pieces = ['filth']
@@ -129,7 +188,7 @@ class FilthReplacer(PostProcessor):
         return label
 
     @staticmethod
-    def get_hash(text: str, salt: bytes, length: int) -> str:
+    def get_hash(text: str, salt: bytes, length: int, method: str = 'pbkdf2') -> str:
         """Get a hash of some text, that has been salted and truncated.
 
         :param text: The text to be hashed
@@ -138,29 +197,55 @@ class FilthReplacer(PostProcessor):
         :type salt: bytes
         :param length: The number of characters long that the hexadecimal hash should be
         :type length: int
+        :param method: The hashing method, one of the keys of ``FilthReplacer.hash_methods``
+        :type method: str, default 'pbkdf2'
         :return: The hash of the text
         :rtype: str
         """
-        return hashlib.pbkdf2_hmac(
-            hash_name='sha256',
-            password=text.encode('utf8'),
-            salt=salt,
-            iterations=100000,
-            dklen=math.ceil(length / 2),
-        ).hex()[:length]
-
-    def process_filth(self, filth_list: Sequence[Filth]) -> Sequence[Filth]:
-        """Processes the filth to replace the original text
-
-        :param filth_list: The text to be hashed
-        :type filth_list: Sequence[Filth]
+        if method == 'pbkdf2':
+            return hashlib.pbkdf2_hmac(
+                hash_name='sha256',
+                password=text.encode('utf8'),
+                salt=salt,
+                iterations=100000,
+                dklen=math.ceil(length / 2),
+            ).hex()[:length]
+        elif method == 'blake2b':
+            # BLAKE2b keys can be at most 64 bytes, so longer salts (such as the default random salt) are hashed first
+            if len(salt) > hashlib.blake2b.MAX_KEY_SIZE:
+                salt = hashlib.blake2b(salt).digest()
+            return hashlib.blake2b(text.encode('utf8'), key=salt).hexdigest()[:length]
+        elif method == 'hmac_sha256':
+            return hmac.new(salt, text.encode('utf8'), hashlib.sha256).hexdigest()[:length]
+        raise ValueError("Unknown hash method '{}'".format(method))
+
+    def _get_filth_hash(self, text: str) -> str:
+        """Hash the text with this FilthReplacer's settings, remembering the most recently made hashes."""
+        key = (text, self.hash_salt, self.hash_length, self.hash_method)
+        with self._lock:
+            text_hash = self._hashes.get(key, None)  # type: Optional[str]
+            if text_hash is not None:
+                self._hashes.move_to_end(key)
+                return text_hash
+
+        text_hash = FilthReplacer.get_hash(text, self.hash_salt, self.hash_length, method=self.hash_method)
+        with self._lock:
+            self._hashes[key] = text_hash
+            while len(self._hashes) > max(0, self.hash_cache_size):
+                self._hashes.popitem(last=False)
+        return text_hash
+
+    def process_filth_iterator(self, filth_iterator: Iterable[Filth]) -> Iterator[Filth]:
+        """Processes the filth to replace the original text, as it is iterated over
+
+        :param filth_iterator: The filth to be processed
+        :type filth_iterator: Iterable[Filth]
         :return: The processed filths
-        :rtype: Sequence[Filth]
+        :rtype: Iterator[Filth]
         """
-        for filth_item in filth_list:
+        for filth_item in filth_iterator:
             filth_item.replacement_string = self.filth_label(filth=filth_item)
-
-        return filth_list
+            yield filth_item
 
 
 register_post_processor(FilthReplacer)
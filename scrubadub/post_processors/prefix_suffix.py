@@ -1,4 +1,4 @@
-from typing import Optional, Sequence
+from typing import Optional, Iterable, Iterator
 
 from scrubadub.filth import Filth
 from scrubadub.post_processors.catalogue import register_post_processor
@@ -31,6 +31,7 @@ class PrefixSuffixReplacer(PostProcessor):
     name = 'prefix_suffix_replacer'  # type: str
     autoload = False
     index = 1
+    requires_collation = False
 
     def __init__(self, prefix: Optional[str] = '{{', suffix: Optional[str] = '}}', name: Optional[str] = None):
         super(PrefixSuffixReplacer, self).__init__(name=name)
@@ -38,15 +39,15 @@ class PrefixSuffixReplacer(PostProcessor):
         self.prefix = prefix
         self.suffix = suffix
 
-    def process_filth(self, filth_list: Sequence[Filth]) -> Sequence[Filth]:
-        """Processes the filth to add prefixes and suffixes to the replacement text
+    def process_filth_iterator(self, filth_iterator: Iterable[Filth]) -> Iterator[Filth]:
+        """Processes the filth to add prefixes and suffixes to the replacement text, as it is iterated over
 
-        :param filth_list: The text to be hashed
-        :type filth_list: Sequence[Filth]
+        :param filth_iterator: The filth to be processed
+        :type filth_iterator: Iterable[Filth]
         :return: The processed filths
-        :rtype: Sequence[Filth]
+        :rtype: Iterator[Filth]
         """
-        for filth_item in filth_list:
+        for filth_item in filth_iterator:
             if filth_item.replacement_string is None:
                 filth_item.replacement_string = filth_item.type.upper()
 
@@ -57,7 +58,7 @@ class PrefixSuffixReplacer(PostProcessor):
             elif self.suffix is not None:
                 filth_item.replacement_string = filth_item.replacement_string + self.suffix
 
-        return filth_list
+            yield filth_item
 
 
 register_post_processor(PrefixSuffixReplacer)
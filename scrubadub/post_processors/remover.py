@@ -1,4 +1,4 @@
-from typing import Sequence
+from typing import Iterable, Iterator
 
 from scrubadub.post_processors.catalogue import register_post_processor
 from scrubadub.filth import Filth
@@ -19,18 +19,19 @@ class FilthRemover(PostProcessor):
     name = 'filth_remover'  # type: str
     autoload = False
     index = 0
+    requires_collation = False
 
-    def process_filth(self, filth_list: Sequence[Filth]) -> Sequence[Filth]:
-        """Processes the filth to remove the filth
+    def process_filth_iterator(self, filth_iterator: Iterable[Filth]) -> Iterator[Filth]:
+        """Processes the filth to remove the filth, as it is iterated over
 
-        :param filth_list: The text to be hashed
-        :type filth_list: Sequence[Filth]
+        :param filth_iterator: The filth to be processed
+        :type filth_iterator: Iterable[Filth]
         :return: The processed filths
-        :rtype: Sequence[Filth]
+        :rtype: Iterator[Filth]
         """
-        for filth_item in filth_list:
+        for filth_item in filth_iterator:
             filth_item.replacement_string = ''
-        return filth_list
+            yield filth_item
 
 
 register_post_processor(FilthRemover)
@@ -1,11 +1,24 @@
+import os
+import math
+import mmap
+import codecs
+import pickle
+import contextlib
+import itertools
 import warnings
-from typing import Optional, Sequence, Generator, Dict, Type, Union, List
+import concurrent.futures
+from typing import Optional, Sequence, Generator, Dict, Type, Union, List, TextIO, Tuple, AsyncGenerator, Set, Iterable
+from typing import Iterator
 
 from . import detectors
 from . import post_processors
+from . import utils
 from .detectors import Detector
+from .cache import Cache
+from .stats import ComponentStats, ScrubberStats
+from .table import FilthTable
 from .post_processors import PostProcessor
-from .filth import Filth
+from .filth import Filth, MergedFilth
 
 
 class Scrubber:
@@ -17,7 +30,9 @@ class Scrubber:
 
     def __init__(self, detector_list: Optional[Sequence[Union[Type[Detector], Detector, str]]] = None,
                  post_processor_list: Optional[Sequence[Union[Type[PostProcessor], PostProcessor, str]]] = None,
-                 locale: Optional[str] = None):
+                 locale: Optional[str] = None, executor: Optional[concurrent.futures.Executor] = None,
+                 executor_batch_size: int = 100, cache: Optional[Cache] = None,
+                 stats: Optional[ScrubberStats] = None):
         """Create a ``Scrubber`` object.
 
         :param detector_list: The list of detectors to use in this scrubber.
@@ -27,9 +42,28 @@ class Scrubber:
         :param locale: The locale of the documents in the format: 2 letter lower-case language code followed by an
                        underscore and the two letter upper-case country code, eg "en_GB" or "de_CH".
         :type locale: str, optional
+        :param executor: An optional ``concurrent.futures.Executor`` (such as a ``ThreadPoolExecutor`` or a
+            ``ProcessPoolExecutor``) used to run the detectors in parallel. If this is not set, detectors are run one
+            after another in the current thread.
+        :type executor: concurrent.futures.Executor, optional
+        :param executor_batch_size: When an ``executor`` is set, the documents are split into batches of this many
+            documents and each detector runs on each batch as a separate task.
+        :type executor_batch_size: int, default 100
+        :param cache: A cache of the ``Filth`` found in texts that have been searched before, so that repeated texts
+            are not searched again. See ``scrubadub.cache`` for the available caches.
+        :type cache: scrubadub.cache.Cache, optional
+        :param stats: Collects the time spent in, and the ``Filth`` found by, each detector and post-processor. See
+            ``scrubadub.stats`` for details.
+        :type stats: scrubadub.stats.ScrubberStats, optional
         """
         super().__init__()
 
+        self.executor = executor  # type: Optional[concurrent.futures.Executor]
+        self.executor_batch_size = executor_batch_size  # type: int
+        self.cache = cache  # type: Optional[Cache]
+        self._cache_fingerprint = None  # type: Optional[str]
+        self.stats = stats  # type: Optional[ScrubberStats]
+
         # instantiate all of the detectors which, by default, uses all of the
         # detectors that are in the detectors.types dictionary
         self._detectors = {}  # type: Dict[str, Detector]
@@ -69,6 +103,15 @@ class Scrubber:
         for post_processor in post_processor_list:
             self.add_post_processor(post_processor)
 
+    def __getstate__(self) -> Dict:
+        # Executors can not be pickled, so a Scrubber that is sent to another process runs its detectors sequentially
+        state = self.__dict__.copy()
+        state['executor'] = None
+        # A copy in another process collects its own stats, which are sent back and added to the stats here
+        if state['stats'] is not None:
+            state['stats'] = ScrubberStats()
+        return state
+
     def add_detector(self, detector: Union[Detector, Type[Detector], str], warn: bool = True):
         """Add a ``Detector`` to Scrubber
 
@@ -131,6 +174,7 @@ class Scrubber:
             self._detectors.pop(detector.name)
         elif isinstance(detector, str):
             self._detectors.pop(detector)
+        self._cache_fingerprint = None
 
     def _check_and_add_detector(self, detector: Detector, warn: bool = False):
         """Check the types and add the detector to the scrubber"""
@@ -151,6 +195,7 @@ class Scrubber:
                 'Try removing it first.'
             ) % locals())
         self._detectors[name] = detector
+        self._cache_fingerprint = None
 
     def add_post_processor(self, post_processor: Union[PostProcessor, Type[PostProcessor], str], index: int = None):
         """Add a ``PostProcessor`` to a Scrubber
@@ -242,51 +287,333 @@ class Scrubber:
         if 'replace_with' in kwargs:
             warnings.warn("Use of replace_with is depreciated in favour of using PostProcessors", DeprecationWarning)
 
-        # We are collating all Filths so that they can all be passed to the post processing step together.
-        # This is needed for some operations within the PostProcesssors.
-        # It could be improved if we know which post processors need collated Filths.
-        filth_list = list(self.iter_filth(text, document_name=None))  # type: Sequence[Filth]
-        filth_list = self._post_process_filth_list(filth_list)
+        filth_list = list(self._iter_post_processed_filth(
+            self.iter_filth(text, document_name=None, run_post_processors=False)
+        ))
+        return self._replace_text(text=text, filth_list=filth_list, document_name=None, **kwargs)
+
+    async def aclean(self, text: str, executor: Optional[concurrent.futures.Executor] = None, **kwargs) -> str:
+        """The asyncio version of ``Scrubber.clean``, where the detectors are run in an executor so that the event
+        loop is not blocked while the ``text`` is searched.
+
+        :param text: The dirty text to clean.
+        :type text: str
+        :param executor: The executor used to run the detectors, defaults to the event loop's default executor. This
+            should not be the same thread pool as ``Scrubber.executor``, as both would wait on each other.
+        :type executor: concurrent.futures.Executor, optional
+        :return: The cleaned text
+        :rtype: str
+        """
+        if 'replace_with' in kwargs:
+            warnings.warn("Use of replace_with is depreciated in favour of using PostProcessors", DeprecationWarning)
+
+        loop = _running_loop()
+        found_filth, stats = await loop.run_in_executor(executor, _document_filth_list, self, None, text)
+        self._merge_stats(stats)
+        filth_list = self._post_process_filth_list(found_filth)
         return self._replace_text(text=text, filth_list=filth_list, document_name=None, **kwargs)
 
-    def clean_documents(self, documents: Union[Sequence[str], Dict[Optional[str], str]], **kwargs) -> \
-            Union[Dict[Optional[str], str], Sequence[str]]:
+    def clean_documents(self, documents: Union[Sequence[str], Dict[Optional[str], str]], workers: Optional[int] = None,
+                        **kwargs) -> Union[Dict[Optional[str], str], Sequence[str]]:
         """This is the master method that cleans all of the filth out of the
         dirty dirty ``text``. All keyword arguments to this function are passed
         through to the  ``Filth.replace_with`` method to fine-tune how the
         ``Filth`` is cleaned.
+
+        If ``workers`` is given, the documents are split into that many shards which are cleaned in separate
+        processes. Each process gets its own copy of this ``Scrubber``, so ``PostProcessor``\\ s only see the
+        ``Filth`` from the documents in their shard and any state they keep (such as the numbering used by
+        ``FilthReplacer(include_count=True)``) is not shared between processes.
+
+        :param documents: Documents containing possible PII that needs to be redacted in the form of a list of
+            documents or a dictonary with the key as the document name and the value as the document text
+        :type documents: `list` of `str` objects, `dict` of `str` objects
+        :param workers: The number of processes used to clean the documents, by default they are cleaned in the
+            current process
+        :type workers: int, optional
+        :return: Documents in the same format as input, but with `Filth` redacted
+        :rtype: `list` of `str` objects, `dict` of `str` objects; same as input
         """
         if 'replace_with' in kwargs:
             warnings.warn("Use of replace_with is depreciated in favour of using PostProcessors", DeprecationWarning)
 
-        # We are collating all Filths so that they can all be passed to the post processing step together.
-        # This is needed for some operations within the PostProcesssors.
-        # It could be improved if we know which post processors need collated Filths.
-        filth_list = []  # type: Sequence[Filth]
-        if isinstance(documents, (list, dict)):
-            filth_list = list(self.iter_filth_documents(documents=documents, run_post_processors=True))
-        else:
+        if not isinstance(documents, (list, dict)):
             raise TypeError(
                 'documents type should be one of: list of strings or a dict of strings with the key as the '
                 'document title.'
             )
 
+        if workers is not None and workers > 1 and len(documents) > 1:
+            return self._clean_documents_in_processes(documents, workers=workers, **kwargs)
+
+        if isinstance(documents, list):
+            document_texts = {
+                str(name): text for name, text in enumerate(documents)
+            }  # type: Dict[Optional[str], str]
+        else:
+            document_texts = documents
+
+        filth_iterator = self.iter_filth_documents(documents=documents, run_post_processors=True)
+        if self._can_stream_post_processors():
+            # The merged Filth is sorted by document and the post processors keep that order, so the Filth of each
+            # document can be taken from the stream without grouping all of it first
+            document_groups = itertools.groupby(
+                filth_iterator, key=lambda filth: filth.document_name
+            )  # type: Iterable[Tuple[Optional[str], Iterable[Filth]]]
+        else:
+            document_groups = self._group_filths_by_document(list(filth_iterator)).items()
+
+        clean_texts = {}  # type: Dict[Optional[str], str]
+        for name, document_filth in document_groups:
+            clean_texts[name] = self._replace_text(
+                text=document_texts[name], filth_list=list(document_filth), document_name=name, **kwargs
+            )
+
         if isinstance(documents, list):
             clean_documents = [
-                self._replace_text(text=text, filth_list=filth_list, document_name=str(name), **kwargs)
-                for name, text in enumerate(documents)
+                clean_texts.get(str(name), text) for name, text in enumerate(documents)
             ]  # type: Union[Dict[Optional[str], str], Sequence[str]]
-        elif isinstance(documents, dict):
-            clean_documents = {
-                name: self._replace_text(text=text, filth_list=filth_list, document_name=name, **kwargs)
-                for name, text in documents.items()
-            }
+        else:
+            clean_documents = {name: clean_texts.get(name, text) for name, text in documents.items()}
 
         return clean_documents
 
+    def _clean_documents_in_processes(self, documents: Union[List[str], Dict[Optional[str], str]], workers: int,
+                                      **kwargs) -> Union[Dict[Optional[str], str], Sequence[str]]:
+        """Split the documents into one shard per worker and clean each shard in its own process."""
+        shard_size = math.ceil(len(documents) / workers)
+
+        shards = []  # type: List[Union[List[str], Dict[Optional[str], str]]]
+        if isinstance(documents, list):
+            shards = [documents[i:i + shard_size] for i in range(0, len(documents), shard_size)]
+        else:
+            items = list(documents.items())
+            shards = [dict(items[i:i + shard_size]) for i in range(0, len(items), shard_size)]
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=len(shards)) as executor:
+            # The scrubber is pickled once for each shard, so each worker rebuilds its own copy of this scrubber
+            futures = [executor.submit(_clean_documents_shard, self, shard, kwargs) for shard in shards]
+            clean_shards = []  # type: List[Union[Dict[Optional[str], str], Sequence[str]]]
+            for future in futures:
+                clean_shard, stats = future.result()
+                self._merge_stats(stats)
+                clean_shards.append(clean_shard)
+
+        clean_list = []  # type: List[str]
+        clean_dict = {}  # type: Dict[Optional[str], str]
+        for clean_shard in clean_shards:
+            if isinstance(clean_shard, dict):
+                clean_dict.update(clean_shard)
+            else:
+                clean_list += clean_shard
+
+        if isinstance(documents, dict):
+            return clean_dict
+        return clean_list
+
+    def clean_stream(self, readable: TextIO, writable: TextIO, window_size: int = 1000000,
+                     overlap: Optional[int] = None, **kwargs) -> None:
+        """Clean text read from ``readable`` and write it to ``writable``, without needing the whole text in memory.
+
+        The text is read in windows of ``window_size`` characters. Neighbouring windows overlap by ``overlap``
+        characters so that ``Filth`` at the edge of one window is found in the next one, and the cleaned text is
+        written as soon as all of the ``Filth`` that could touch it has been found.
+
+        .. code:: pycon
+
+            >>> import io, scrubadub
+            >>> output = io.StringIO()
+            >>> scrubadub.Scrubber().clean_stream(io.StringIO("contact me at joe@example.com"), output)
+            >>> output.getvalue()
+            'contact me at {{EMAIL}}'
+
+        By default the overlap is the largest ``Detector.max_match_length`` of the detectors in this scrubber. Some
+        detectors (such as those that need to see the surrounding sentences) do not have a maximum length, in which
+        case the ``overlap`` needs to be given. ``PostProcessor``\\ s are run on each window of ``Filth`` separately.
+
+        :param readable: A file-like object with a ``read(size)`` method that returns ``str``
+        :type readable: TextIO
+        :param writable: A file-like object with a ``write(str)`` method
+        :type writable: TextIO
+        :param window_size: The number of characters read in each window, must be more than twice the overlap
+        :type window_size: int, default 1000000
+        :param overlap: The number of characters that neighbouring windows share
+        :type overlap: int, optional
+        """
+        if 'replace_with' in kwargs:
+            warnings.warn("Use of replace_with is depreciated in favour of using PostProcessors", DeprecationWarning)
+
+        chunk_iterator = self._iter_stream_chunks(readable, window_size=window_size, overlap=overlap)
+        for chunk, chunk_offset, filth_list in chunk_iterator:
+            writable.write(self._replace_text(
+                text=chunk, filth_list=filth_list, document_name=None, offset=chunk_offset, **kwargs
+            ))
+
+    def clean_file(self, path: str, out_path: str, window_size: int = 1000000, overlap: Optional[int] = None,
+                   **kwargs) -> None:
+        """Clean the UTF-8 text in the file at ``path``, writing the cleaned text to the file at ``out_path``.
+
+        The file is memory mapped and decoded a window at a time, as in ``Scrubber.clean_stream``, so the whole file
+        is never held in memory as a ``str``. The text between the ``Filth`` is copied to the output straight from the
+        mapped file, rather than being encoded again.
+
+        :param path: The path of the UTF-8 file to clean
+        :type path: str
+        :param out_path: The path of the file to write the cleaned text to, in UTF-8
+        :type out_path: str
+        :param window_size: The number of characters searched in each window, must be more than twice the overlap
+        :type window_size: int, default 1000000
+        :param overlap: The number of characters that neighbouring windows share, see ``Scrubber.clean_stream``
+        :type overlap: int, optional
+        """
+        if 'replace_with' in kwargs:
+            warnings.warn("Use of replace_with is depreciated in favour of using PostProcessors", DeprecationWarning)
+
+        with _map_file(path) as mapped, open(out_path, 'wb') as writable:
+            chunk_iterator = self._iter_stream_chunks(_MappedTextReader(mapped), window_size=window_size,
+                                                      overlap=overlap)
+            byte_offset = 0
+            for chunk, chunk_offset, filth_list in chunk_iterator:
+                filth_list = self._sort_filths(filth_list)
+                positions = [position - chunk_offset for filth in filth_list for position in (filth.beg, filth.end)]
+                byte_positions = utils.utf8_offsets(chunk, positions + [len(chunk)])
+
+                written = byte_offset
+                for i_filth, filth in enumerate(filth_list):
+                    writable.write(mapped[written:byte_offset + byte_positions[2 * i_filth]])
+                    writable.write(self._filth_replacement(filth, **kwargs).encode('utf-8'))
+                    written = byte_offset + byte_positions[2 * i_filth + 1]
+                byte_offset += byte_positions[-1]
+                writable.write(mapped[written:byte_offset])
+
+    def iter_filth_file(self, path: str, window_size: int = 1000000, overlap: Optional[int] = None,
+                        byte_offsets: bool = False) -> Generator[Filth, None, None]:
+        """Find the ``Filth`` in the UTF-8 text in the file at ``path``.
+
+        The file is memory mapped and decoded a window at a time, see ``Scrubber.clean_file``. The ``document_name`` of
+        the ``Filth`` is the ``path`` of the file.
+
+        :param path: The path of the UTF-8 file to search
+        :type path: str
+        :param window_size: The number of characters searched in each window, must be more than twice the overlap
+        :type window_size: int, default 1000000
+        :param overlap: The number of characters that neighbouring windows share, see ``Scrubber.clean_stream``
+        :type overlap: int, optional
+        :param byte_offsets: If true, ``Filth.beg`` and ``Filth.end`` are the positions of the ``Filth`` in the bytes
+            of the file rather than in the decoded text.
+        :type byte_offsets: bool, default False
+        """
+        with _map_file(path) as mapped:
+            chunk_iterator = self._iter_stream_chunks(_MappedTextReader(mapped), window_size=window_size,
+                                                      overlap=overlap)
+            byte_offset = 0
+            for chunk, chunk_offset, filth_list in chunk_iterator:
+                for filth in filth_list:
+                    self._set_filth_document_name(filth, path)
+
+                if byte_offsets:
+                    all_filth = [sub_filth for filth in filth_list for sub_filth in self._iter_sub_filth(filth)]
+                    positions = sorted(set(
+                        position - chunk_offset for filth in all_filth for position in (filth.beg, filth.end)
+                    ))
+                    byte_positions = dict(zip(positions, utils.utf8_offsets(chunk, positions)))
+                    for filth in all_filth:
+                        filth.beg = byte_offset + byte_positions[filth.beg - chunk_offset]
+                        filth.end = byte_offset + byte_positions[filth.end - chunk_offset]
+                    byte_offset += utils.utf8_offsets(chunk, [len(chunk)])[0]
+
+                yield from filth_list
+
+    @staticmethod
+    def _iter_sub_filth(filth: Filth) -> Generator[Filth, None, None]:
+        """Iterate over a Filth and any Filth that it was merged from."""
+        yield filth
+        if isinstance(filth, MergedFilth):
+            for sub_filth in filth.filths:
+                yield from Scrubber._iter_sub_filth(sub_filth)
+
+    def _stream_overlap(self) -> int:
+        """The overlap needed between windows so that none of the detectors miss any Filth."""
+        unbounded = [name for name, detector in self._detectors.items() if detector.max_match_length is None]
+        if len(unbounded) > 0:
+            raise ValueError(
+                "The detectors {} do not have a max_match_length, so the overlap between windows needs to be "
+                "set explicitly.".format(', '.join(unbounded))
+            )
+        return max([detector.max_match_length or 0 for detector in self._detectors.values()] + [1])
+
+    def _iter_stream_chunks(self, readable: Union[TextIO, '_MappedTextReader'], window_size: int,
+                            overlap: Optional[int]) -> Generator[Tuple[str, int, List[Filth]], None, None]:
+        """Read windows of text from ``readable``, yielding each piece of text once its Filth are final.
+
+        Each window is searched together with the ``overlap`` characters before it (so that detectors can see the
+        context before a match) and the ``overlap`` characters after it. Yields tuples containing the text, the
+        offset of that text in the stream and the post-processed Filth found in it. The Filth positions are relative
+        to the start of the stream.
+        """
+        if overlap is None:
+            overlap = self._stream_overlap()
+        if window_size <= 2 * overlap:
+            raise ValueError("The window_size ({}) must be more than twice the overlap ({}).".format(
+                window_size, overlap
+            ))
+
+        context = ''  # text that has already been written, but is needed as context for the detectors
+        pending = ''  # text that has been read, but not yet written
+        pending_offset = 0  # the position of the pending text in the stream
+        end_of_stream = False
+        while not end_of_stream:
+            text_read = readable.read(window_size)
+            end_of_stream = len(text_read) == 0
+            pending += text_read
+            if not end_of_stream and len(pending) < window_size:
+                continue
+            if end_of_stream and len(pending) == 0:
+                break
+
+            text = context + pending
+            filth_list = [
+                filth
+                for filth in self.iter_filth(text, document_name=None, run_post_processors=False)
+                if filth.beg >= len(context)
+            ]
+
+            # Only Filth that starts before the cut is final; anything after it could still grow (or be merged with
+            # other Filth) once the next window has been read. The cut is moved so that it does not split any Filth.
+            cut = len(text)
+            if not end_of_stream:
+                cut = len(text) - overlap
+                for filth in filth_list:
+                    if filth.beg < cut <= filth.end:
+                        cut = filth.beg
+
+            text_offset = pending_offset - len(context)
+            final_filth = []  # type: List[Filth]
+            for filth in filth_list:
+                if filth.beg < cut:
+                    self._shift_filth(filth, text_offset)
+                    final_filth.append(filth)
+
+            yield pending[:cut - len(context)], pending_offset, list(self._post_process_filth_list(final_filth))
+
+            context = text[max(0, cut - overlap):cut]
+            pending = text[cut:]
+            pending_offset = text_offset + cut
+
+    @staticmethod
+    def _shift_filth(filth: Filth, offset: int):
+        """Move a Filth (and any Filth that it was merged from) along the text by ``offset`` characters."""
+        filth.beg += offset
+        filth.end += offset
+        if isinstance(filth, MergedFilth):
+            for sub_filth in filth.filths:
+                Scrubber._shift_filth(sub_filth, offset)
+
     def _replace_text(
-            self, text: str, filth_list: Sequence[Filth], document_name: Optional[str], **kwargs
+            self, text: str, filth_list: Sequence[Filth], document_name: Optional[str], offset: int = 0, **kwargs
     ) -> str:
+        """Replace the Filth in the text, ``offset`` is the position of the text within the document that the
+        Filth positions refer to."""
         filth_list = [filth for filth in filth_list if filth.document_name == document_name]
         if len(filth_list) == 0:
             return text
@@ -295,25 +622,64 @@ class Scrubber:
         filth = None  # type: Optional[Filth]
         clean_chunks = []
         for next_filth in filth_list:
-            clean_chunks.append(text[(0 if filth is None else filth.end):next_filth.beg])
-            if next_filth.replacement_string is not None:
-                clean_chunks.append(next_filth.replacement_string)
-            else:
-                clean_chunks.append(next_filth.replace_with(**kwargs))
+            clean_chunks.append(text[(0 if filth is None else filth.end - offset):next_filth.beg - offset])
+            clean_chunks.append(self._filth_replacement(next_filth, **kwargs))
             filth = next_filth
         if filth is not None:
-            clean_chunks.append(text[filth.end:])
+            clean_chunks.append(text[filth.end - offset:])
         return u''.join(clean_chunks)
 
+    @staticmethod
+    def _filth_replacement(filth: Filth, **kwargs) -> str:
+        """The text that replaces the Filth in the cleaned text."""
+        if filth.replacement_string is not None:
+            return filth.replacement_string
+        return filth.replace_with(**kwargs)
+
+    def _can_stream_post_processors(self) -> bool:
+        """Returns true if the Filth can be passed through the post processors one at a time, which is the case when
+        none of them set ``PostProcessor.requires_collation``. Stats are recorded over the whole list of Filth, so
+        the Filth is always collated when they are being collected."""
+        return self.stats is None and not any(
+            post_processor.requires_collation for post_processor in self._post_processors
+        )
+
+    def _iter_post_processed_filth(self, filth_iterator: Iterable[Filth]) -> Iterator[Filth]:
+        """Run the post processors over the Filth, only collating it into a list if one of them needs that."""
+        if not self._can_stream_post_processors():
+            yield from self._post_process_filth_list(list(filth_iterator))
+            return
+
+        for post_processor in self._post_processors:
+            filth_iterator = post_processor.process_filth_iterator(filth_iterator)
+        yield from filth_iterator
+
     def _post_process_filth_list(self, filth_list: Sequence[Filth]) -> Sequence[Filth]:
-        # We are collating all Filths so that they can all be passed to the post processing step together.
-        # This is needed for some operations within the PostProcesssors.
-        # It could be improved if we know which post processors need collated Filths.
+        # All of the Filth is passed to each post processor together, as some of them need to see all of it.
+        # See Scrubber._iter_post_processed_filth for the version that streams the Filth when it can.
         for post_processor in self._post_processors:
-            filth_list = post_processor.process_filth(filth_list)
+            if self.stats is None:
+                filth_list = post_processor.process_filth(filth_list)
+                continue
+
+            run_stats = ComponentStats(filth_rejected=len(filth_list))
+            with run_stats.timed():
+                filth_list = post_processor.process_filth(filth_list)
+            run_stats.filth_found = len(filth_list)
+            run_stats.filth_rejected -= run_stats.filth_found
+            self.stats.record_post_processor(post_processor.name, run_stats)
 
         return filth_list
 
+    def _merge_stats(self, stats: Optional[ScrubberStats]):
+        """Add the stats collected by a copy of this scrubber in another process."""
+        if self.stats is not None and stats is not None and stats is not self.stats:
+            self.stats.merge(stats)
+
+    def _record_detector_stats(self, name: str, stats: ComponentStats):
+        if self.stats is not None:
+            self.stats.record_detector(name, stats)
+
     def iter_filth(
             self, text: str, document_name: Optional[str] = None, run_post_processors: bool = True
     ) -> Generator[Filth, None, None]:
@@ -325,6 +691,63 @@ class Scrubber:
         yield from self.iter_filth_documents(documents={document_name: text},
                                              run_post_processors=run_post_processors)
 
+    @staticmethod
+    def _detector_documents(detector: Detector, document_list: Sequence[str], document_names: Sequence[Optional[str]],
+                            document_features: Sequence[utils.TextFeatures]
+                            ) -> Tuple[Sequence[str], Sequence[Optional[str]]]:
+        """Return only the documents that the detector could find filth in."""
+        keep = [i for i, features in enumerate(document_features) if detector.can_match(features)]
+        if len(keep) == len(document_list):
+            return document_list, document_names
+        return [document_list[i] for i in keep], [document_names[i] for i in keep]
+
+    def _iter_detector_filth_lists(self, document_list: Sequence[str],
+                                   document_names: Sequence[Optional[str]]) -> Generator[List[Filth], None, None]:
+        """Run each detector over the documents, yielding a list of the valid Filth found by each detector (or by
+        each batch of documents when an executor is used). The lists are always yielded in the order of the
+        detectors, so that the results do not depend on which task finishes first.
+
+        Detectors are skipped for documents that they can not find anything in, see ``Detector.can_match``."""
+        document_features = [utils.TextFeatures(text) for text in document_list]
+
+        if self.executor is None:
+            for name, detector in self._detectors.items():
+                filth_list, stats = _detector_filth_list(detector, *self._detector_documents(
+                    detector, document_list, document_names, document_features
+                ))
+                self._record_detector_stats(name, stats)
+                yield filth_list
+            return
+
+        batch_size = max(1, self.executor_batch_size)
+        futures = []  # type: List[concurrent.futures.Future]
+        detector_futures = {}  # type: Dict[str, List[concurrent.futures.Future]]
+        try:
+            for name, detector in self._detectors.items():
+                detector_texts, detector_names = self._detector_documents(
+                    detector, document_list, document_names, document_features
+                )
+                detector_futures[name] = []
+                for i_start in range(0, len(detector_texts), batch_size):
+                    future = self.executor.submit(
+                        _detector_filth_list,
+                        detector,
+                        detector_texts[i_start:i_start + batch_size],
+                        detector_names[i_start:i_start + batch_size],
+                    )
+                    futures.append(future)
+                    detector_futures[name].append(future)
+
+            for name in self._detectors.keys():
+                for future in detector_futures[name]:
+                    filth_list, stats = future.result()
+                    self._record_detector_stats(name, stats)
+                    yield filth_list
+        finally:
+            # If anything went wrong, dont leave tasks running that no one will collect
+            for future in futures:
+                future.cancel()
+
     @staticmethod
     def _detector_iter_filth_iterator(detector: Detector, document_list: Sequence[str],
                                       document_names: Sequence[Optional[str]]) -> Generator[Filth, None, None]:
@@ -355,43 +778,199 @@ class Scrubber:
         # currently doing this by aggregating all_filths and then sorting
         # inline instead of with a Filth.__cmp__ method, which is apparently
         # much slower http://stackoverflow.com/a/988728/564709
-        #
-        # NOTE: we could probably do this in a more efficient way by iterating
-        # over all detectors simultaneously. just trying to get something
-        # working right now and we can worry about efficiency later
         filth_list = []  # type: List[Filth]
-        for name, detector in self._detectors.items():
-            try:
-                filth_iterator = detector.iter_filth_documents(
-                    document_list=document_texts,
-                    document_names=document_names,
-                )
-            except NotImplementedError:
-                filth_iterator = self._detector_iter_filth_iterator(
-                    detector=detector,
-                    document_list=document_texts,
-                    document_names=document_names,
-                )
+        cache_keys = []  # type: List[str]
+        duplicate_names = {}  # type: Dict[str, List[Optional[str]]]
+        if self.cache is not None:
+            filth_list, document_texts, document_names, cache_keys, duplicate_names = self._get_cached_filth(
+                document_texts, document_names
+            )
 
-            for filth in filth_iterator:
-                if not isinstance(filth, Filth):
-                    raise TypeError('iter_filth must always yield Filth')
-                if not filth.is_valid():
-                    continue
-                filth_list.append(filth)
+        for detector_filth_list in self._iter_detector_filth_lists(document_texts, document_names):
+            filth_list += detector_filth_list
+
+        merged_filths = self._merge_filths(filth_list)  # type: Iterable[Filth]
+        if self.cache is not None:
+            merged_filths = list(merged_filths)
+            duplicate_filths = self._set_cached_filth(merged_filths, document_names, cache_keys, duplicate_names)
+            if len(duplicate_filths) > 0:
+                merged_filths = list(self._merge_filths(merged_filths + duplicate_filths))
 
-        # This is split up so that we only have to use lists if we have to post_process Filth
         if run_post_processors:
-            all_filths = list(self._merge_filths(filth_list))
-            all_filths = list(self._post_process_filth_list(all_filths))
+            yield from self._iter_post_processed_filth(merged_filths)
+        else:
+            yield from merged_filths
+
+    def get_filth_table(
+            self,
+            documents: Union[Sequence[str], Dict[Optional[str], str]],
+            run_post_processors: bool = True
+    ) -> FilthTable:
+        """Find the filth in the documents, returning its positions and types in a columnar ``FilthTable`` rather than
+        as ``Filth`` objects. The returned table is much smaller than the list of ``Filth`` it is made from, although
+        all of the ``Filth`` is still found and merged in memory before the table is built.
+
+        :param documents: Documents containing possible PII in the form of a list of documents or a dictonary with
+            the key as the document name and the value as the document text
+        :type documents: `list` of `str` objects, `dict` of `str` objects
+        :param run_post_processors: Whether to run the post processors on the ``Filth`` before it is added
+        :type run_post_processors: bool
+        :return: A table of the ``Filth`` found in the documents
+        :rtype: FilthTable
+        """
+        return FilthTable.from_filth(
+            self.iter_filth_documents(documents=documents, run_post_processors=run_post_processors)
+        )
+
+    def _get_cache_fingerprint(self) -> str:
+        """Return the fingerprint of the detectors, which is only recalculated when detectors are added or removed.
+
+        Each detector is described by its class and its attributes, so that detectors that can not be pickled
+        (such as those defined in a function) can still be used."""
+        if self._cache_fingerprint is None:
+            self._cache_fingerprint = Cache.make_fingerprint((self._locale, [
+                (name, type(detector).__module__, type(detector).__qualname__, vars(detector))
+                for name, detector in self._detectors.items()
+            ]))
+        return self._cache_fingerprint
+
+    def _get_cached_filth(
+            self, document_texts: Sequence[str], document_names: Sequence[Optional[str]]
+    ) -> Tuple[List[Filth], List[str], List[Optional[str]], List[str], Dict[str, List[Optional[str]]]]:
+        """Look up each document in the cache.
+
+        This returns the cached ``Filth`` along with the texts, names and cache keys of the documents that still need
+        to be searched. Documents with the same text are only searched once, the names of the other documents with
+        that text are returned in a dictionary keyed by the cache key."""
+        if self.cache is None:
+            raise ValueError('This Scrubber does not have a cache.')
+
+        fingerprint = self._get_cache_fingerprint()
+        cached_filths = []  # type: List[Filth]
+        search_texts = []  # type: List[str]
+        search_names = []  # type: List[Optional[str]]
+        cache_keys = []  # type: List[str]
+        duplicate_names = {}  # type: Dict[str, List[Optional[str]]]
+        for document_name, text in zip(document_names, document_texts):
+            filth_list = None  # type: Optional[List[Filth]]
+            cache_key = ''
+            # Anything other than a string is passed on to the detectors, which will complain about it
+            if isinstance(text, str):
+                cache_key = Cache.make_key(text, fingerprint)
+                if cache_key in duplicate_names:
+                    duplicate_names[cache_key].append(document_name)
+                    continue
+                filth_list = self.cache.get(cache_key)
+            if filth_list is None:
+                search_texts.append(text)
+                search_names.append(document_name)
+                cache_keys.append(cache_key)
+                duplicate_names[cache_key] = []
+                continue
+            for filth in filth_list:
+                self._set_filth_document_name(filth, document_name)
+                cached_filths.append(filth)
+        return cached_filths, search_texts, search_names, cache_keys, duplicate_names
+
+    def _set_cached_filth(self, filth_list: Sequence[Filth], document_names: Sequence[Optional[str]],
+                          cache_keys: Sequence[str], duplicate_names: Dict[str, List[Optional[str]]]) -> List[Filth]:
+        """Store the ``Filth`` found in each of the searched documents in the cache, returning copies of that
+        ``Filth`` for the other documents that had the same text."""
+        if self.cache is None:
+            raise ValueError('This Scrubber does not have a cache.')
+
+        duplicate_filths = []  # type: List[Filth]
+        document_filths = self._group_filths_by_document(filth_list)
+        for document_name, cache_key in zip(document_names, cache_keys):
+            self.cache.set(cache_key, document_filths.get(document_name, []))
+            for duplicate_name in duplicate_names.get(cache_key, []):
+                for filth in pickle.loads(pickle.dumps(document_filths.get(document_name, []))):
+                    self._set_filth_document_name(filth, duplicate_name)
+                    duplicate_filths.append(filth)
+        return duplicate_filths
+
+    @staticmethod
+    def _set_filth_document_name(filth: Filth, document_name: Optional[str]):
+        """Set the document name of Filth loaded from the cache, which may have come from another document."""
+        filth.document_name = document_name
+        if isinstance(filth, MergedFilth):
+            for sub_filth in filth.filths:
+                Scrubber._set_filth_document_name(sub_filth, document_name)
+
+    async def aiter_filth_documents(
+            self,
+            documents: Union[Sequence[str], Dict[Optional[str], str]],
+            run_post_processors: bool = True,
+            executor: Optional[concurrent.futures.Executor] = None,
+            max_concurrency: int = 10,
+    ) -> AsyncGenerator[Filth, None]:
+        """The asyncio version of ``Scrubber.iter_filth_documents``.
 
-            # Here we loop over a list of Filth...
-            for filth in all_filths:
-                yield filth
+        Each document is searched as a separate task in an executor, so that the event loop is not blocked. The
+        ``Filth`` from a document is yielded as soon as that document has been searched, so the ``Filth`` of a slow
+        document does not hold up the documents after it. This means that the ``Filth`` is grouped by document, but
+        the documents come in the order that they finish.
+
+        ``PostProcessor``\\ s are run on the ``Filth`` of each document separately, in the event loop's thread.
+
+        .. code:: pycon
+
+            >>> import asyncio, scrubadub
+            >>> async def find_filth(documents):
+            ...     scrubber = scrubadub.Scrubber(detector_list=['email'])
+            ...     return [filth async for filth in scrubber.aiter_filth_documents(documents)]
+            >>> loop = asyncio.new_event_loop()
+            >>> loop.run_until_complete(find_filth({'first.txt': 'Email me at example@example.com'}))
+            [<EmailFilth text='example@example.com' document_name='first.txt' beg=12 end=31 ...>]
+            >>> loop.close()
+
+        :param documents: Documents containing possible PII in the form of a list of documents or a dictonary with
+            the key as the document name and the value as the document text
+        :type documents: `list` of `str` objects, `dict` of `str` objects
+        :param run_post_processors: Whether the ``PostProcessor``\\ s should be run on the ``Filth``
+        :type run_post_processors: bool, default True
+        :param executor: The executor used to run the detectors, defaults to the event loop's default executor. This
+            should not be the same thread pool as ``Scrubber.executor``, as both would wait on each other.
+        :type executor: concurrent.futures.Executor, optional
+        :param max_concurrency: The maximum number of documents that are searched at the same time
+        :type max_concurrency: int, default 10
+        :return: An asynchronous iterator over the found ``Filth``
+        :rtype: AsyncGenerator[Filth]
+        """
+        if isinstance(documents, dict):
+            document_items = list(documents.items())  # type: List[Tuple[Optional[str], str]]
+        elif isinstance(documents, list):
+            document_items = [(str(i_document), text) for i_document, text in enumerate(documents)]
         else:
-            # ... but here, we're using a generator. If we try to use the same variable it would have two types and
-            # fail static typing in mypy
-            yield from self._merge_filths(filth_list)
+            raise TypeError('documents must be one of a list of strings or dict of strings.')
+
+        import asyncio
+
+        loop = _running_loop()
+        document_iterator = iter(document_items)
+        pending = set()  # type: Set[asyncio.Future]
+        try:
+            while True:
+                # Only start as many documents as we are allowed to search at the same time
+                for document_name, text in document_iterator:
+                    pending.add(loop.run_in_executor(executor, _document_filth_list, self, document_name, text))
+                    if len(pending) >= max(1, max_concurrency):
+                        break
+                if len(pending) == 0:
+                    break
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    filth_list, stats = future.result()
+                    self._merge_stats(stats)
+                    if run_post_processors:
+                        filth_list = self._post_process_filth_list(filth_list)
+                    for filth in filth_list:
+                        yield filth
+        finally:
+            # If we were cancelled or the caller stopped iterating, dont start any documents that are still waiting
+            for future in pending:
+                future.cancel()
 
     @staticmethod
     def _sort_filths(filth_list: Sequence[Filth]) -> List[Filth]:
@@ -404,31 +983,143 @@ class Scrubber:
         ))
         return filth_list
 
+    @staticmethod
+    def _group_filths_by_document(filth_list: Sequence[Filth]) -> Dict[Optional[str], List[Filth]]:
+        """Split a list of Filth into a list for each document in a single pass, keeping the original order."""
+        document_filths = {}  # type: Dict[Optional[str], List[Filth]]
+        for filth in filth_list:
+            try:
+                document_filths[filth.document_name].append(filth)
+            except KeyError:
+                document_filths[filth.document_name] = [filth]
+        return document_filths
+
     @staticmethod
     def _merge_filths(filth_list: Sequence[Filth]) -> Generator[Filth, None, None]:
         """This is where the Scrubber does its hard work and merges any
         overlapping filths.
+
+        The filths are sorted once by document (with filth that has no document first), start position and then the
+        longer filth first, and then merged in a single sweep.
         """
         if not filth_list:
             return
 
-        document_name_set = {f.document_name for f in filth_list}
-        document_names = []  # type: Sequence[Optional[str]]
-        if None in document_name_set:
-            list_with_none = [None]  # type: Sequence[Optional[str]]
-            list_with_others = sorted([x for x in document_name_set if x is not None])  # type: Sequence[Optional[str]]
-            document_names = list(list_with_none) + list(list_with_others)
-        else:
-            document_names = sorted([x for x in document_name_set if x is not None])
-
-        for document_name in document_names:
-            document_filth_list = Scrubber._sort_filths([f for f in filth_list if f.document_name == document_name])
-
-            filth = document_filth_list[0]
-            for next_filth in document_filth_list[1:]:
-                if filth.end < next_filth.beg:
-                    yield filth
-                    filth = next_filth
-                else:
-                    filth = filth.merge(next_filth)
-            yield filth
+        sorted_filths = iter(sorted(filth_list, key=lambda f: (
+            f.document_name is not None, f.document_name or '', f.beg, -f.end
+        )))
+        group = [next(sorted_filths)]
+        group_end = group[0].end
+        for next_filth in sorted_filths:
+            if group_end < next_filth.beg or next_filth.document_name != group[0].document_name:
+                yield group[0] if len(group) == 1 else MergedFilth.from_filths(group)
+                group = [next_filth]
+                group_end = next_filth.end
+            else:
+                group.append(next_filth)
+                group_end = max(group_end, next_filth.end)
+        yield group[0] if len(group) == 1 else MergedFilth.from_filths(group)
+
+
+def _running_loop():
+    """Return the event loop of the running coroutine."""
+    # asyncio is only imported when needed, as it slows down importing scrubadub
+    import asyncio
+
+    # get_running_loop was added in python 3.7, before that get_event_loop returns the running loop inside a coroutine
+    if hasattr(asyncio, 'get_running_loop'):
+        return asyncio.get_running_loop()
+    return asyncio.get_event_loop()
+
+
+def _clean_documents_shard(
+        scrubber: Scrubber, documents: Union[List[str], Dict[Optional[str], str]], kwargs: Dict
+) -> Tuple[Union[Dict[Optional[str], str], Sequence[str]], Optional[ScrubberStats]]:
+    """Clean a shard of documents, this is a module level function so that it can be sent to a process pool."""
+    return scrubber.clean_documents(documents, **kwargs), scrubber.stats
+
+
+def _document_filth_list(scrubber: Scrubber, document_name: Optional[str],
+                         text: str) -> Tuple[List[Filth], Optional[ScrubberStats]]:
+    """Find the merged but not post processed Filth in a document, this is a module level function so that it can be
+    sent to a process pool."""
+    return list(scrubber.iter_filth_documents({document_name: text}, run_post_processors=False)), scrubber.stats
+
+
+def _detector_filth_list(detector: Detector, document_list: Sequence[str],
+                         document_names: Sequence[Optional[str]]) -> Tuple[List[Filth], ComponentStats]:
+    """Run one detector over a set of documents and return the valid Filth that it found, along with how long that
+    took.
+
+    This is a module level function so that it can be pickled and sent to a ``ProcessPoolExecutor``.
+    """
+    run_stats = ComponentStats(
+        documents=len(document_list),
+        characters=sum(len(text) for text in document_list if isinstance(text, str)),
+    )
+    with run_stats.timed():
+        filth_list = _find_detector_filth(detector, document_list, document_names, run_stats)
+    return filth_list, run_stats
+
+
+def _find_detector_filth(detector: Detector, document_list: Sequence[str], document_names: Sequence[Optional[str]],
+                         run_stats: ComponentStats) -> List[Filth]:
+    try:
+        filth_iterator = detector.iter_filth_documents(
+            document_list=document_list,
+            document_names=document_names,
+        )
+    except NotImplementedError:
+        filth_iterator = Scrubber._detector_iter_filth_iterator(
+            detector=detector,
+            document_list=document_list,
+            document_names=document_names,
+        )
+
+    filth_list = []  # type: List[Filth]
+    for filth in filth_iterator:
+        if not isinstance(filth, Filth):
+            raise TypeError('iter_filth must always yield Filth')
+        if not filth.is_valid():
+            run_stats.filth_rejected += 1
+            continue
+        filth_list.append(filth)
+    run_stats.filth_found = len(filth_list)
+    return filth_list
+
+
+@contextlib.contextmanager
+def _map_file(path: str) -> Generator[Union[mmap.mmap, bytes], None, None]:
+    """Memory map a file for reading. Empty files can not be mapped, so they are given as empty bytes."""
+    with open(path, 'rb') as readable:
+        if os.fstat(readable.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(readable.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+class _MappedTextReader(object):
+    """Decodes the UTF-8 text of a memory mapped file a piece at a time, with the ``read(size)`` method of a file.
+
+    The regex detectors work on ``str`` rather than ``bytes``, as their patterns use unicode character classes and
+    the ``Filth`` they find needs the decoded text, so each window of the file is decoded before it is searched.
+    """
+
+    def __init__(self, mapped: Union[mmap.mmap, bytes]):
+        self.mapped = mapped
+        self.position = 0
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+
+    def read(self, size: int) -> str:
+        # There are fewer characters than bytes when the text is not all ASCII, so pieces of the file are decoded
+        # until there are ``size`` characters. A piece can end part way through a character, which the decoder keeps
+        # until the next piece.
+        pieces = []  # type: List[str]
+        length = 0
+        while length < size and self.position < len(self.mapped):
+            data = self.mapped[self.position:self.position + size - length]
+            self.position += len(data)
+            pieces.append(self.decoder.decode(data, final=self.position >= len(self.mapped)))
+            length += len(pieces[-1])
+        return ''.join(pieces)
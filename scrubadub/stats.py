@@ -0,0 +1,173 @@
+"""Timing and counters for the detectors and post-processors that a ``Scrubber`` runs.
+
+Pass a ``ScrubberStats`` to a ``Scrubber`` to find out which detectors are using up the time:
+
+.. code:: pycon
+
+    >>> import scrubadub, scrubadub.stats
+    >>> scrubber = scrubadub.Scrubber(detector_list=['email'], stats=scrubadub.stats.ScrubberStats())
+    >>> scrubber.clean("contact me at joe@example.com")
+    'contact me at {{EMAIL}}'
+    >>> scrubber.stats.as_dict()['detectors']['email']['filth_found']
+    1
+"""
+import time
+import threading
+import contextlib
+
+from typing import Dict, Any, Generator, Tuple
+
+from .utils import PicklableLockMixin
+
+# time.thread_time is only available from python 3.7
+_cpu_time = getattr(time, 'thread_time', time.process_time)
+
+
+class ComponentStats(object):
+    """The counters and timings of one detector or post-processor.
+
+    For detectors, ``filth_found`` counts the valid ``Filth`` found and ``filth_rejected`` counts the ``Filth`` that
+    was rejected by ``Filth.is_valid()``. For post-processors, ``filth_found`` counts the ``Filth`` that was returned
+    and ``filth_rejected`` counts the ``Filth`` that was removed.
+    """
+
+    fields = ('calls', 'wall_time', 'cpu_time', 'documents', 'characters', 'filth_found', 'filth_rejected')
+
+    def __init__(self, calls: int = 0, wall_time: float = 0.0, cpu_time: float = 0.0, documents: int = 0,
+                 characters: int = 0, filth_found: int = 0, filth_rejected: int = 0):
+        self.calls = calls
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+        self.documents = documents
+        self.characters = characters
+        self.filth_found = filth_found
+        self.filth_rejected = filth_rejected
+
+    @contextlib.contextmanager
+    def timed(self) -> Generator['ComponentStats', None, None]:
+        """Add the wall and CPU time spent in the ``with`` block to these stats, counting it as one call."""
+        wall_start = time.perf_counter()
+        cpu_start = _cpu_time()
+        try:
+            yield self
+        finally:
+            self.wall_time += time.perf_counter() - wall_start
+            self.cpu_time += _cpu_time() - cpu_start
+            self.calls += 1
+
+    def add(self, other: 'ComponentStats'):
+        """Add the counts and timings of ``other`` to these stats."""
+        for field in self.fields:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self.fields}
+
+    def __repr__(self) -> str:
+        return '<ComponentStats {}>'.format(' '.join('{}={!r}'.format(k, v) for k, v in self.as_dict().items()))
+
+
+class ScrubberStats(PicklableLockMixin):
+    """Collects the ``ComponentStats`` of each detector and post-processor run by a ``Scrubber``.
+
+    Recording is thread safe, and the stats found in other processes (such as with
+    ``Scrubber.clean_documents(workers=N)``) are added to the stats of the ``Scrubber`` that started them.
+    """
+
+    # The metric name suffix, the ComponentStats field and the help text of each Prometheus metric
+    prometheus_metrics = (
+        ('calls_total', 'calls', 'Number of times the {} was run'),
+        ('wall_seconds_total', 'wall_time', 'Wall clock time spent in the {}'),
+        ('cpu_seconds_total', 'cpu_time', 'CPU time spent in the {}'),
+        ('documents_total', 'documents', 'Number of documents searched by the {}'),
+        ('characters_total', 'characters', 'Number of characters searched by the {}'),
+        ('filth_found_total', 'filth_found', 'Number of Filth returned by the {}'),
+        ('filth_rejected_total', 'filth_rejected', 'Number of Filth rejected or removed by the {}'),
+    )
+
+    def __init__(self):
+        self.detectors = {}  # type: Dict[str, ComponentStats]
+        self.post_processors = {}  # type: Dict[str, ComponentStats]
+        self._lock = threading.Lock()
+
+    def record_detector(self, name: str, stats: ComponentStats):
+        """Add ``stats`` to the stats of the detector called ``name``."""
+        with self._lock:
+            self.detectors.setdefault(name, ComponentStats()).add(stats)
+
+    def record_post_processor(self, name: str, stats: ComponentStats):
+        """Add ``stats`` to the stats of the post-processor called ``name``."""
+        with self._lock:
+            self.post_processors.setdefault(name, ComponentStats()).add(stats)
+
+    def merge(self, other: 'ScrubberStats'):
+        """Add all of the stats collected in ``other`` to these stats."""
+        for name, stats in list(other.detectors.items()):
+            self.record_detector(name, stats)
+        for name, stats in list(other.post_processors.items()):
+            self.record_post_processor(name, stats)
+
+    def reset(self):
+        """Forget all of the collected stats."""
+        with self._lock:
+            self.detectors = {}
+            self.post_processors = {}
+
+    def as_dict(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Return the collected stats as a dictionary.
+
+        :return: A dictionary with the keys ``detectors`` and ``post_processors``, each containing a dictionary of
+            ``ComponentStats.as_dict()`` keyed by name.
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                'detectors': {name: stats.as_dict() for name, stats in self.detectors.items()},
+                'post_processors': {name: stats.as_dict() for name, stats in self.post_processors.items()},
+            }
+
+    @staticmethod
+    def _prometheus_label(value: str) -> str:
+        return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    def to_prometheus(self, prefix: str = 'scrubadub') -> str:
+        """Return the collected stats in the Prometheus text exposition format.
+
+        .. code:: pycon
+
+            >>> import scrubadub.stats
+            >>> stats = scrubadub.stats.ScrubberStats()
+            >>> stats.record_detector('email', scrubadub.stats.ComponentStats(calls=1, documents=2))
+            >>> for line in stats.to_prometheus().splitlines()[:3]:
+            ...     print(line)
+            # HELP scrubadub_detector_calls_total Number of times the detector was run
+            # TYPE scrubadub_detector_calls_total counter
+            scrubadub_detector_calls_total{detector="email"} 1
+
+        :param prefix: The prefix of the metric names
+        :type prefix: str
+        :return: The metrics, one per line
+        :rtype: str
+        """
+        with self._lock:
+            components = (
+                ('detector', list(self.detectors.items())),
+                ('post_processor', list(self.post_processors.items())),
+            )  # type: Tuple[Tuple[str, Any], ...]
+
+        lines = []
+        for component, component_stats in components:
+            if len(component_stats) == 0:
+                continue
+            for suffix, field, help_text in self.prometheus_metrics:
+                metric = '{}_{}_{}'.format(prefix, component, suffix)
+                lines.append('# HELP {} {}'.format(metric, help_text.format(component.replace('_', '-'))))
+                lines.append('# TYPE {} counter'.format(metric))
+                for name, stats in component_stats:
+                    lines.append('{}{{{}="{}"}} {}'.format(
+                        metric, component, self._prometheus_label(name), getattr(stats, field)
+                    ))
+        return '\n'.join(lines) + '\n'
+
+
+__all__ = ['ComponentStats', 'ScrubberStats']
@@ -0,0 +1,234 @@
+"""A columnar table of the ``Filth`` found in a batch of documents.
+
+When only the positions and types of the ``Filth`` are needed, such as when analysing the ``Filth`` found in many
+documents, a ``FilthTable`` keeps them in NumPy arrays rather than as a list of ``Filth`` objects:
+
+.. code:: pycon
+
+    >>> import scrubadub
+    >>> scrubber = scrubadub.Scrubber(detector_list=['email', 'url'])
+    >>> table = scrubber.get_filth_table(["contact me at joe@example.com", 'or at https://example.com/joe'])
+    >>> len(table)
+    2
+    >>> table.beg, table.end
+    (array([14,  6]), array([29, 29]))
+    >>> table.names(table.type_id)
+    array(['email', 'url'], dtype=object)
+    >>> len(table.filter_types(['url']))
+    1
+
+NumPy is only imported when a ``FilthTable`` is created, and pandas only by ``FilthTable.to_dataframe()``.
+"""
+import array
+
+from typing import Optional, List, Dict, Iterable, Sequence, Union, Tuple, Any, TYPE_CHECKING
+
+from .filth import Filth, MergedFilth
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+class FilthTable(object):
+    """The positions and types of ``Filth``, with one NumPy array for each column.
+
+    Each row is one ``Filth`` found by a detector. The rows that were merged together into one ``MergedFilth`` share
+    the same ``group_id``. The ``document_id``, ``type_id``, ``detector_id`` and ``locale_id`` columns are indexes
+    into the ``strings`` table, with ``-1`` used for ``None``; ``FilthTable.names()`` turns them back into strings.
+
+    :param strings: The document names, ``Filth`` types, detector names and locales that the id columns refer to.
+    :type strings: Sequence[str]
+    """
+
+    columns = ('group_id', 'document_id', 'beg', 'end', 'type_id', 'detector_id', 'locale_id')
+
+    def __init__(self, strings: Sequence[str], group_id: Any = (), document_id: Any = (), beg: Any = (),
+                 end: Any = (), type_id: Any = (), detector_id: Any = (), locale_id: Any = ()):
+        import numpy as np
+
+        self.strings = list(strings)  # type: List[str]
+        self.group_id = np.asarray(group_id, dtype=np.int64)  # type: np.ndarray
+        self.document_id = np.asarray(document_id, dtype=np.int32)  # type: np.ndarray
+        self.beg = np.asarray(beg, dtype=np.int64)  # type: np.ndarray
+        self.end = np.asarray(end, dtype=np.int64)  # type: np.ndarray
+        self.type_id = np.asarray(type_id, dtype=np.int32)  # type: np.ndarray
+        self.detector_id = np.asarray(detector_id, dtype=np.int32)  # type: np.ndarray
+        self.locale_id = np.asarray(locale_id, dtype=np.int32)  # type: np.ndarray
+
+        if len(set(len(getattr(self, column)) for column in self.columns)) > 1:
+            raise ValueError('All of the columns of a FilthTable must be the same length.')
+
+    @classmethod
+    def from_filth(cls, filth_iterable: Iterable[Filth]) -> 'FilthTable':
+        """Build a table from ``Filth``, which is read one at a time so that it does not need to be kept in a list.
+
+        :param filth_iterable: The ``Filth`` to store, such as from ``Scrubber.iter_filth_documents()``
+        :type filth_iterable: Iterable[Filth]
+        :return: The table with a row for each ``Filth``, or for each of the ``Filth`` in a ``MergedFilth``
+        :rtype: FilthTable
+        """
+        import numpy as np
+
+        strings = []  # type: List[str]
+        string_ids = {}  # type: Dict[str, int]
+
+        def string_id(value: Optional[str]) -> int:
+            if value is None:
+                return -1
+            try:
+                return string_ids[value]
+            except KeyError:
+                string_ids[value] = len(strings)
+                strings.append(value)
+                return string_ids[value]
+
+        # array.array stores the values compactly until they are copied into NumPy arrays at the end
+        columns = {column: array.array('q') for column in cls.columns}  # type: Dict[str, array.array]
+        for group_id, filth in enumerate(filth_iterable):
+            sub_filths = filth.filths if isinstance(filth, MergedFilth) else [filth]
+            for sub_filth in sub_filths:
+                columns['group_id'].append(group_id)
+                columns['document_id'].append(string_id(sub_filth.document_name))
+                columns['beg'].append(sub_filth.beg)
+                columns['end'].append(sub_filth.end)
+                columns['type_id'].append(string_id(sub_filth.type))
+                columns['detector_id'].append(string_id(sub_filth.detector_name))
+                columns['locale_id'].append(string_id(sub_filth.locale))
+
+        return cls(strings=strings, **{column: np.array(values, dtype=np.int64) for column, values in columns.items()})
+
+    def __len__(self) -> int:
+        return len(self.beg)
+
+    def __repr__(self) -> str:
+        return '<FilthTable rows={} groups={}>'.format(len(self), len(set(self.group_id.tolist())))
+
+    def names(self, ids: 'np.ndarray') -> 'np.ndarray':
+        """Return the strings that an id column refers to.
+
+        :param ids: The values of one of the ``document_id``, ``type_id``, ``detector_id`` or ``locale_id`` columns
+        :type ids: np.ndarray
+        :return: An array of the strings, with ``None`` where the id is ``-1``
+        :rtype: np.ndarray
+        """
+        import numpy as np
+
+        # The extra None at the end of the table is where an id of -1 points to
+        return np.array(self.strings + [None], dtype=object)[ids]
+
+    def select(self, rows: Union['np.ndarray', slice]) -> 'FilthTable':
+        """Return a table containing only some of the rows of this table.
+
+        :param rows: A boolean mask, indexes or a slice of the rows to keep
+        :type rows: np.ndarray or slice
+        :return: A new table with the selected rows
+        :rtype: FilthTable
+        """
+        return FilthTable(strings=self.strings, **{column: getattr(self, column)[rows] for column in self.columns})
+
+    def filter_types(self, filth_types: Iterable[str]) -> 'FilthTable':
+        """Return a table containing only the ``Filth`` of the given types.
+
+        :param filth_types: The ``Filth.type`` of each type of ``Filth`` to keep
+        :type filth_types: Iterable[str]
+        :return: A new table with only the rows of these types
+        :rtype: FilthTable
+        """
+        import numpy as np
+
+        type_ids = [self.strings.index(filth_type) for filth_type in filth_types if filth_type in self.strings]
+        return self.select(np.isin(self.type_id, type_ids))
+
+    def merge(self) -> 'FilthTable':
+        """Return a table where overlapping ``Filth`` in the same document share a ``group_id``.
+
+        This groups the rows in the same way that ``Scrubber`` merges overlapping ``Filth`` into a ``MergedFilth``, and
+        can be used on a table of ``Filth`` that has been filtered or that was found without merging. The rows are
+        sorted by document name, then by position with the longer ``Filth`` first.
+
+        :return: A new table with the merged groups
+        :rtype: FilthTable
+        """
+        import numpy as np
+
+        if len(self) == 0:
+            return self.select(slice(None))
+
+        # Order the documents by name as the Scrubber does, with the Filth that has no document first
+        document_ids = sorted(
+            set(self.document_id.tolist()), key=lambda i: (i >= 0, self.strings[i] if i >= 0 else '')
+        )
+        document_ranks = np.zeros(len(self.strings) + 1, dtype=np.int64)
+        document_ranks[np.array(document_ids) + 1] = np.arange(len(document_ids))
+        ranks = document_ranks[self.document_id + 1]
+
+        order = np.lexsort((-self.end, self.beg, ranks))
+        table = self.select(order)
+
+        # Place the documents one after another with a gap between them, so that a single running maximum of the
+        # ends finds the overlaps in all documents at once
+        document_length = int(table.end.max()) + 2
+        offsets = ranks[order] * document_length
+        begs = table.beg + offsets
+        ends = np.maximum.accumulate(table.end + offsets)
+
+        new_group = np.ones(len(table), dtype=bool)
+        new_group[1:] = begs[1:] > ends[:-1]
+        table.group_id = np.cumsum(new_group) - 1
+        return table
+
+    def spans(self) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+        """Return the document id, start and end of each group of ``Filth``, ordered by ``group_id``.
+
+        :return: The ``document_id``, ``beg`` and ``end`` arrays of the groups
+        :rtype: Tuple[np.ndarray, np.ndarray, np.ndarray]
+        """
+        import numpy as np
+
+        if len(self) == 0:
+            return self.document_id[:0], self.beg[:0], self.end[:0]
+
+        order = np.argsort(self.group_id, kind='stable')
+        group_ids = self.group_id[order]
+        starts = np.flatnonzero(np.concatenate(([True], group_ids[1:] != group_ids[:-1])))
+        return (
+            self.document_id[order][starts],
+            np.minimum.reduceat(self.beg[order], starts),
+            np.maximum.reduceat(self.end[order], starts),
+        )
+
+    def to_dataframe(self, documents: Optional[Union[Sequence[str], Dict[Optional[str], str]]] = None
+                     ) -> 'pd.DataFrame':
+        """Return the table as a pandas ``DataFrame``, with the ids replaced by their strings.
+
+        :param documents: The documents that the ``Filth`` was found in. If given, the text of each ``Filth`` is
+            included in a ``text`` column.
+        :type documents: `list` of `str` objects, `dict` of `str` objects, optional
+        :return: A ``DataFrame`` with a row for each row of the table
+        :rtype: pd.DataFrame
+        """
+        import pandas as pd
+
+        data = {
+            'group_id': self.group_id,
+            'document_name': self.names(self.document_id),
+            'filth_type': self.names(self.type_id),
+            'detector_name': self.names(self.detector_id),
+            'locale': self.names(self.locale_id),
+            'beg': self.beg,
+            'end': self.end,
+        }  # type: Dict[str, Any]
+        if documents is not None:
+            if isinstance(documents, dict):
+                document_texts = documents  # type: Dict[Any, str]
+            else:
+                document_texts = {str(name): text for name, text in enumerate(documents)}
+            data['text'] = [
+                document_texts[document_name][beg:end]
+                for document_name, beg, end in zip(data['document_name'], self.beg.tolist(), self.end.tolist())
+            ]
+        return pd.DataFrame(data)
+
+
+__all__ = ['FilthTable']
@@ -1,7 +1,10 @@
 import re
+import functools
+import threading
+import collections
 import locale as locale_module
 
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Iterator, Match, Sequence, Iterable, Dict, Any
 
 try:
     unicode  # type: ignore  # tell mypy to ignore the fact that this doesnt exist in python3
@@ -65,6 +68,59 @@ class Lookup(object):
             return self.table[key]
 
 
+class TextFeatures(object):
+    """Cheap features of a text that are worked out once and shared between detectors, so that detectors that can
+    not possibly match a text can be skipped. Each feature is only calculated when it is first needed.
+    """
+
+    _digit_regex = re.compile(r'\d')
+
+    def __init__(self, text: str):
+        if not isinstance(text, str):
+            raise TypeError('TextFeatures can only be found for a str, not {}'.format(type(text)))
+        self.text = text
+        self._folded = None  # type: Optional[str]
+        self._digit_iterator = None  # type: Optional[Iterator[Match]]
+        self._digits_seen = 0
+
+    @property
+    def folded(self) -> str:
+        """The case folded text, used to search for case folded literals."""
+        if self._folded is None:
+            # A case insensitive regex also matches the dotless i to an i, which case folding does not do
+            self._folded = self.text.casefold().replace('\u0131', 'i')
+        return self._folded
+
+    def contains_any(self, literals: Sequence[str]) -> bool:
+        """Returns true if any of the case folded ``literals`` are in the case folded text."""
+        folded = self.folded
+        return any(literal in folded for literal in literals)
+
+    def has_digits(self, count: int) -> bool:
+        """Returns true if the text has at least ``count`` digits. The text is only searched as far as needed."""
+        if self._digits_seen >= count:
+            return True
+        if self._digit_iterator is None:
+            self._digit_iterator = self._digit_regex.finditer(self.text)
+        for _ in self._digit_iterator:
+            self._digits_seen += 1
+            if self._digits_seen >= count:
+                return True
+        return False
+
+
+# The normalised locales that python knows about
+_known_locales = frozenset(locale_module.locale_alias.values())
+
+_locale_regex = re.compile(
+    r'(?P<language>[0-9a-zA-Z]+)(_(?P<region>[0-9a-zA-Z]+))?'
+    r'(\.(?P<charset>[0-9a-zA-Z-]+)(@(?P<charset2>[0-9a-zA-Z]+))?)?'
+)
+
+
+# Locales are transformed each time a detector is created or asked if it supports a locale, and there are only a
+# handful of distinct locales in use, so the results are cached
+@functools.lru_cache(maxsize=256)
 def locale_transform(locale: str) -> str:
     """Normalise the locale string, e.g. 'fr' -> 'fr_FR'.
 
@@ -75,11 +131,12 @@ def locale_transform(locale: str) -> str:
     :rtype: str
     """
     normalised = locale_module.normalize(locale.lower())
-    if normalised not in locale_module.locale_alias.values():
+    if normalised not in _known_locales:
         raise ValueError("Unknown locale '{}', not in locale.locale_alias".format(locale))
     return normalised
 
 
+@functools.lru_cache(maxsize=256)
 def locale_split(locale: str) -> Tuple[Optional[str], Optional[str]]:
     """Split the locale string into the language and region.
 
@@ -91,15 +148,217 @@ def locale_split(locale: str) -> Tuple[Optional[str], Optional[str]]:
     """
     locale = locale_transform(locale)
 
-    regex = r'(?P<language>[0-9a-zA-Z]+)(_(?P<region>[0-9a-zA-Z]+))?' \
-            r'(\.(?P<charset>[0-9a-zA-Z-]+)(@(?P<charset2>[0-9a-zA-Z]+))?)?'
-    match = re.match(regex, locale)
+    match = _locale_regex.match(locale)
     if match is None:
         raise ValueError('Locale does not match expected format.')
 
     return match.group('language').lower(), match.group('region').upper()
 
 
+def _isascii(text: str) -> bool:
+    # str.isascii is only available from python 3.7
+    return len(text.encode('utf-8')) == len(text)
+
+
+isascii = getattr(str, 'isascii', _isascii)
+
+
+def utf8_offsets(text: str, positions: Iterable[int]) -> List[int]:
+    """Convert character positions in ``text`` to the positions of the same characters in its UTF-8 encoding.
+
+    Only the text between neighbouring positions is encoded, and text that is all ASCII is not encoded at all.
+
+    :param text: The text that the positions are in
+    :type text: str
+    :param positions: The character positions, in ascending order
+    :type positions: Iterable[int]
+    :return: The byte position of each of the character positions
+    :rtype: List[int]
+    """
+    if isascii(text):
+        return list(positions)
+
+    offsets = []  # type: List[int]
+    char_position = 0
+    byte_position = 0
+    for position in positions:
+        byte_position += len(text[char_position:position].encode('utf-8'))
+        char_position = position
+        offsets.append(byte_position)
+    return offsets
+
+
+class AhoCorasick(object):
+    """Finds every occurrence of many strings in a text with a single pass over the text.
+
+    This is an Aho-Corasick automaton, which is built once from the strings and then used to search any number of
+    texts. The time taken to search a text depends on the length of the text and the number of occurrences found,
+    but not on the number of strings being searched for.
+
+    >>> import scrubadub.utils
+    >>> automaton = scrubadub.utils.AhoCorasick(['he', 'she', 'hers'])
+    >>> list(automaton.iter_matches('ushers'))
+    [(1, 1), (2, 0), (2, 2)]
+
+    :param patterns: The strings to search for, which must not be empty
+    :type patterns: Sequence[str]
+    """
+
+    # The transitions are stored in one dictionary keyed by the state and the character, which uses much less memory
+    # than a dictionary for each state. Characters fit into 21 bits.
+    _char_bits = 21
+
+    def __init__(self, patterns: Sequence[str]):
+        self.patterns = list(patterns)  # type: List[str]
+        self._build()
+
+    def _build(self):
+        char_bits = self._char_bits
+        self._goto = {}  # type: Dict[int, int]
+        self._fail = [0]  # type: List[int]
+        # The patterns that end at each state, and the next state along the fail links that has any
+        self._output = [[]]  # type: List[List[int]]
+        self._output_link = [0]  # type: List[int]
+        children = [[]]  # type: List[List[Tuple[int, int]]]
+
+        for i_pattern, pattern in enumerate(self.patterns):
+            if len(pattern) == 0:
+                raise ValueError('The patterns searched for by an AhoCorasick automaton must not be empty.')
+            state = 0
+            for char in pattern:
+                key = (state << char_bits) | ord(char)
+                next_state = self._goto.get(key, None)
+                if next_state is None:
+                    next_state = len(self._fail)
+                    self._goto[key] = next_state
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._output_link.append(0)
+                    children.append([])
+                    children[state].append((ord(char), next_state))
+                state = next_state
+            self._output[state].append(i_pattern)
+
+        # Find the fail links in breadth first order, so that the states closer to the root are done first
+        queue = collections.deque(child for _, child in children[0])
+        while queue:
+            state = queue.popleft()
+            for char_ord, child in children[state]:
+                queue.append(child)
+                fail = self._fail[state]
+                while fail != 0 and ((fail << char_bits) | char_ord) not in self._goto:
+                    fail = self._fail[fail]
+                fail = self._goto.get((fail << char_bits) | char_ord, 0)
+                self._fail[child] = fail
+                self._output_link[child] = fail if len(self._output[fail]) > 0 else self._output_link[fail]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Find all occurrences of the patterns in the text, including those that overlap.
+
+        :param text: The text to search
+        :type text: str
+        :return: Tuples of the start position of each occurrence and the index of the pattern, in order of the
+            position where each occurrence ends
+        :rtype: Iterator[Tuple[int, int]]
+        """
+        char_bits = self._char_bits
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        output_link = self._output_link
+        patterns = self.patterns
+
+        state = 0
+        for position, char in enumerate(text):
+            char_ord = ord(char)
+            next_state = goto.get((state << char_bits) | char_ord, None)
+            while next_state is None and state != 0:
+                state = fail[state]
+                next_state = goto.get((state << char_bits) | char_ord, None)
+            state = next_state or 0
+
+            output_state = state if len(output[state]) > 0 else output_link[state]
+            while output_state != 0:
+                for i_pattern in output[output_state]:
+                    yield position + 1 - len(patterns[i_pattern]), i_pattern
+                output_state = output_link[output_state]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The automaton is quicker to build again than to pickle
+        return {'patterns': self.patterns}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.patterns = state['patterns']
+        self._build()
+
+
+class HashedLiteralMatcher(object):
+    """Finds every occurrence of many strings in a text by looking up each piece of the text in a dictionary.
+
+    This is built much more quickly than an ``AhoCorasick`` automaton and uses much less memory, which makes it suited
+    to hundreds of thousands of strings. At each position in the text the first few characters are looked up to find
+    the lengths of the strings that start with them, and then the text of each of those lengths is looked up.
+    Searching is slower than with an ``AhoCorasick`` automaton when many strings of different lengths start with
+    the same characters.
+
+    >>> import scrubadub.utils
+    >>> matcher = scrubadub.utils.HashedLiteralMatcher(['he', 'she', 'hers'])
+    >>> list(matcher.iter_matches('ushers'))
+    [(1, 1), (2, 0), (2, 2)]
+
+    :param patterns: The strings to search for, which must not be empty or repeated
+    :type patterns: Sequence[str]
+    """
+
+    # The number of characters looked up at each position before looking for any of the strings
+    max_prefix_length = 4
+
+    def __init__(self, patterns: Sequence[str]):
+        self.patterns = list(patterns)  # type: List[str]
+        self._prefix_length = min([len(pattern) for pattern in self.patterns] + [self.max_prefix_length])
+        self._indexes = {}  # type: Dict[str, int]
+
+        prefix_lengths = {}  # type: Dict[str, set]
+        for i_pattern, pattern in enumerate(self.patterns):
+            if len(pattern) == 0:
+                raise ValueError('The patterns searched for by a HashedLiteralMatcher must not be empty.')
+            if self._indexes.setdefault(pattern, i_pattern) != i_pattern:
+                raise ValueError('The patterns searched for by a HashedLiteralMatcher must not be repeated.')
+            prefix_lengths.setdefault(pattern[:self._prefix_length], set()).add(len(pattern))
+
+        # Many prefixes have the same lengths, these share a single tuple
+        lengths_tuples = {}  # type: Dict[Tuple[int, ...], Tuple[int, ...]]
+        self._prefix_lengths = {}  # type: Dict[str, Tuple[int, ...]]
+        for prefix, lengths in prefix_lengths.items():
+            lengths_tuple = tuple(sorted(lengths))
+            self._prefix_lengths[prefix] = lengths_tuples.setdefault(lengths_tuple, lengths_tuple)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Find all occurrences of the patterns in the text, including those that overlap.
+
+        :param text: The text to search
+        :type text: str
+        :return: Tuples of the start position of each occurrence and the index of the pattern, in order of the
+            position where each occurrence starts and then of their lengths
+        :rtype: Iterator[Tuple[int, int]]
+        """
+        prefix_length = self._prefix_length
+        prefix_lengths = self._prefix_lengths
+        indexes = self._indexes
+        text_length = len(text)
+
+        for start in range(text_length - prefix_length + 1):
+            lengths = prefix_lengths.get(text[start:start + prefix_length], None)
+            if lengths is None:
+                continue
+            for length in lengths:
+                if start + length > text_length:
+                    break
+                i_pattern = indexes.get(text[start:start + length], None)
+                if i_pattern is not None:
+                    yield start, i_pattern
+
+
 class ToStringMixin(object):
     def _to_string(self, attributes: List[str]) -> str:
         item_attributes = [
@@ -108,3 +367,19 @@ class ToStringMixin(object):
             if getattr(self, item, None) is not None
         ]
         return "<{} {}>".format(self.__class__.__name__, " ".join(item_attributes))
+
+
+class PicklableLockMixin(object):
+    """For objects that guard their state with a ``threading.Lock`` in ``self._lock``.
+
+    Locks can not be pickled, so the lock is left out when the object is pickled and each copy gets a new one.
+    """
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop('_lock', None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
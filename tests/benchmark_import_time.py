@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+import sys
+import statistics
+import subprocess
+
+# These take seconds to import, and should only be imported when a detector or filth that needs them is used
+HEAVY_MODULES = ['dateparser', 'faker', 'nltk', 'numpy', 'pandas', 'phonenumbers', 'sklearn', 'textblob']
+
+IMPORT_CMD = (
+    'import time, sys; start = time.perf_counter(); import scrubadub; elapsed = time.perf_counter() - start; '
+    'print(elapsed); print(",".join(m for m in {!r} if m in sys.modules))'.format(HEAVY_MODULES)
+)
+
+
+def time_import():
+    """Import scrubadub in a fresh interpreter, returning the time taken and the heavy modules that were loaded"""
+    output = subprocess.check_output([sys.executable, '-c', IMPORT_CMD], universal_newlines=True)
+    elapsed, loaded_modules = output.splitlines()[-2:]
+    return float(elapsed), [module for module in loaded_modules.split(',') if module]
+
+
+def main():
+    print("Timing 'import scrubadub':")
+    repeats = 10
+    times = []
+    loaded_modules = set()
+    for _ in range(repeats):
+        elapsed, modules = time_import()
+        times.append(elapsed)
+        loaded_modules.update(modules)
+
+    print("{: >8.4f}s median import time".format(statistics.median(times)))
+    print("{: >8.4f}s fastest import time".format(min(times)))
+
+    if len(loaded_modules) > 0:
+        print("These modules should not be imported by 'import scrubadub': {}".format(', '.join(sorted(loaded_modules))))
+        sys.exit(1)
+
+    if statistics.median(times) > 0.5:
+        print("Usual import times are around 0.1s.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
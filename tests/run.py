@@ -13,6 +13,7 @@ tests = [
     'if python3 --version | grep -Evq "Python (3\\.5\\.)" ; then nosetests --with-doctest --doctest-extension=rst ./tests/ ./scrubadub/ ./docs/ ; else nosetests ; fi',
     "python3 ./tests/benchmark_accuracy.py --fast",
     "python3 ./tests/benchmark_time.py",
+    "python3 ./tests/benchmark_import_time.py",
     'if python3 --version | grep -Evq "Python (3\\.5\\.)" ; then cd docs && make html && cd - ; fi',
 ]
 
@@ -1,4 +1,10 @@
+import ast
+import re
+import sys
 import unittest
+import subprocess
+import concurrent.futures
+
 import scrubadub
 
 
@@ -64,3 +70,65 @@ class APITestCase(unittest.TestCase):
             'My cat can be contacted on {{EMAIL}}, or {{PHONE}}',
             scrubadub.clean(text),
         )
+
+    def test_lazy_imports(self):
+        """Test that importing scrubadub does not import the slow optional dependencies"""
+        heavy_modules = ['dateparser', 'faker', 'nltk', 'pandas', 'phonenumbers', 'sklearn', 'textblob']
+        output = subprocess.check_output(
+            [sys.executable, '-c', 'import sys, scrubadub; print(sorted(sys.modules))'], universal_newlines=True,
+        )
+        loaded_modules = set(module.split('.')[0] for module in ast.literal_eval(output))
+        self.assertEqual([], [module for module in heavy_modules if module in loaded_modules])
+
+        # They are imported when they are used
+        self.assertEqual(['{{PHONE}}'], [scrubadub.clean('+33 4 41 26 62 36')])
+        self.assertIn('phonenumbers', sys.modules)
+
+    def test_default_scrubbers_are_reused(self):
+        """Test that the top level api reuses a scrubber for each locale"""
+        scrubadub.reset_default_scrubbers()
+        self.assertEqual(len(scrubadub._default_scrubbers), 0)
+        scrubadub.clean("contact me at joe@example.com")
+        scrubadub.list_filth("contact me at joe@example.com")
+        scrubadub.clean("contact me at joe@example.com", locale='en_GB')
+        self.assertEqual(sorted(scrubadub._default_scrubbers.keys(), key=str), [None, 'en_GB'])
+
+        scrubber = scrubadub._default_scrubbers[None]
+        scrubadub.clean_documents(["contact me at joe@example.com"])
+        self.assertIs(scrubber, scrubadub._default_scrubbers[None])
+
+        scrubadub.reset_default_scrubbers()
+        self.assertEqual(len(scrubadub._default_scrubbers), 0)
+
+    def test_default_scrubbers_follow_catalogue(self):
+        """Test that the shared scrubbers are rebuilt when the default detectors change"""
+        class HelloFilth(scrubadub.filth.Filth):
+            type = 'hello'
+
+        class HelloDetector(scrubadub.detectors.RegexDetector):
+            name = 'hello_detector'
+            filth_cls = HelloFilth
+            regex = re.compile('hello')
+
+        self.assertEqual(scrubadub.clean("hello world"), "hello world")
+
+        scrubadub.detectors.register_detector(HelloDetector, autoload=True)
+        try:
+            self.assertEqual(scrubadub.clean("hello world"), "{{HELLO}} world")
+            HelloDetector.autoload = False
+            self.assertEqual(scrubadub.clean("hello world"), "hello world")
+            HelloDetector.autoload = True
+            self.assertEqual(scrubadub.clean("hello world"), "{{HELLO}} world")
+        finally:
+            scrubadub.detectors.remove_detector(HelloDetector)
+
+        self.assertEqual(scrubadub.clean("hello world"), "hello world")
+
+    def test_default_scrubbers_threads(self):
+        """Test that the top level api can be used from several threads"""
+        scrubadub.reset_default_scrubbers()
+        texts = ["contact me at joe{}@example.com".format(i) for i in range(50)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(scrubadub.clean, texts))
+        self.assertEqual(results, ["contact me at {{EMAIL}}"] * 50)
+        self.assertEqual(list(scrubadub._default_scrubbers.keys()), [None])
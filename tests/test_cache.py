@@ -0,0 +1,165 @@
+import os
+import pickle
+import sqlite3
+import tempfile
+import unittest
+
+import scrubadub
+import scrubadub.cache
+from scrubadub.filth import Filth, EmailFilth
+
+
+class CacheTestCase(unittest.TestCase):
+
+    def _filth(self, text='a@example.com'):
+        return [EmailFilth(beg=0, end=len(text), text=text, detector_name='email', document_name='doc')]
+
+    def test_memory_cache_lru(self):
+        """Test that the least recently used entries are removed from the memory cache"""
+        cache = scrubadub.cache.MemoryCache(max_entries=2)
+        cache.set('a', self._filth())
+        cache.set('b', self._filth())
+        self.assertEqual(self._filth(), cache.get('a'))
+        cache.set('c', self._filth())
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNotNone(cache.get('c'))
+
+        cache.clear()
+        self.assertEqual(0, len(cache))
+
+    def test_memory_cache_bytes(self):
+        """Test that the memory cache is limited by size"""
+        size = len(pickle.dumps(self._filth(), protocol=scrubadub.cache.PICKLE_PROTOCOL))
+        cache = scrubadub.cache.MemoryCache(max_entries=None, max_bytes=int(2.5 * size))
+        for key in 'abcd':
+            cache.set(key, self._filth())
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('d'))
+
+    def test_memory_cache_copies(self):
+        """Test that changing the filth from the cache does not change the cached filth"""
+        cache = scrubadub.cache.MemoryCache()
+        cache.set('a', self._filth())
+        cache.get('a')[0].replacement_string = 'changed'
+        self.assertIsNone(cache.get('a')[0].replacement_string)
+
+        copied_cache = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(self._filth(), copied_cache.get('a'))
+
+    def test_sqlite_cache(self):
+        """Test that the sqlite cache keeps its contents between connections"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache.sqlite')
+            cache = scrubadub.cache.SqliteCache(path, max_entries=2)
+            cache.set('a', self._filth())
+            cache.set('b', self._filth('b@example.com'))
+            self.assertEqual(self._filth(), cache.get('a'))
+            cache.set('c', self._filth())
+            self.assertEqual(2, len(cache))
+            self.assertIsNone(cache.get('b'))
+            cache.close()
+
+            cache = scrubadub.cache.SqliteCache(path)
+            self.assertEqual(self._filth(), cache.get('a'))
+            copied_cache = pickle.loads(pickle.dumps(cache))
+            self.assertEqual(self._filth(), copied_cache.get('c'))
+            copied_cache.clear()
+            self.assertEqual(0, len(cache))
+            cache.close()
+            copied_cache.close()
+
+    def test_sqlite_cache_entries(self):
+        """Test that the sqlite cache keeps count of its entries between connections and only removes the oldest"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache.sqlite')
+
+            # A database made before the entries were counted
+            connection = sqlite3.connect(path)
+            with connection:
+                connection.execute(
+                    'CREATE TABLE filth_cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, last_used INTEGER NOT NULL)'
+                )
+                connection.executemany(
+                    'INSERT INTO filth_cache (key, value, last_used) VALUES (?, ?, ?)',
+                    [('old{}'.format(i), pickle.dumps(self._filth()), i + 1) for i in range(5)],
+                )
+            connection.close()
+
+            cache = scrubadub.cache.SqliteCache(path, max_entries=10)
+            self.assertEqual(5, len(cache))
+            for i in range(20):
+                cache.set('key{}'.format(i), self._filth())
+                cache.set('key{}'.format(i), self._filth('b@example.com'))
+                self.assertEqual(min(10, 6 + i), len(cache))
+            self.assertIsNone(cache.get('old4'))
+            self.assertIsNone(cache.get('key9'))
+            self.assertEqual(self._filth('b@example.com'), cache.get('key10'))
+            cache.close()
+
+            cache = scrubadub.cache.SqliteCache(path)
+            self.assertEqual(10, len(cache))
+            cache.set('unlimited', self._filth())
+            self.assertEqual(11, len(cache))
+            cache.close()
+
+            cache = scrubadub.cache.SqliteCache(path, max_entries=3)
+            cache.set('limited', self._filth())
+            self.assertEqual(3, len(cache))
+            self.assertEqual(['key10', 'limited', 'unlimited'], sorted(
+                row[0] for row in cache._connection.execute('SELECT key FROM filth_cache')
+            ))
+            cache.close()
+
+    def test_scrubber_cache(self):
+        """Test that a scrubber with a cache gives the same result without searching text again"""
+        searched = []
+
+        class CountingEmailDetector(scrubadub.detectors.EmailDetector):
+            def iter_filth(self, text, document_name=None):
+                searched.append(document_name)
+                yield from super().iter_filth(text, document_name=document_name)
+
+        docs = {
+            "first.txt": "This is a test message for example@example.com",
+            "second.txt": "Hello @Jane, nothing to see here.",
+            "third.txt": "This is a test message for example@example.com",
+        }
+        post_processors = [
+            scrubadub.post_processors.FilthReplacer(include_count=True),
+            scrubadub.post_processors.PrefixSuffixReplacer(),
+        ]
+        scrubber = scrubadub.Scrubber(detector_list=[CountingEmailDetector()], post_processor_list=post_processors)
+        cached_scrubber = scrubadub.Scrubber(detector_list=[CountingEmailDetector()],
+                                             post_processor_list=post_processors,
+                                             cache=scrubadub.cache.MemoryCache())
+
+        expected = scrubber.clean_documents(docs)
+        expected_filth = list(scrubber.iter_filth_documents(docs, run_post_processors=False))
+        searched.clear()
+
+        self.assertEqual(expected, cached_scrubber.clean_documents(docs))
+        self.assertEqual(['first.txt', 'second.txt'], searched)
+        self.assertEqual(2, len(cached_scrubber.cache))
+
+        self.assertEqual(expected, cached_scrubber.clean_documents(docs))
+        self.assertEqual(
+            expected_filth,
+            list(cached_scrubber.iter_filth_documents(docs, run_post_processors=False)),
+        )
+        self.assertEqual(expected['first.txt'], cached_scrubber.clean(docs['first.txt']))
+        self.assertEqual(['first.txt', 'second.txt'], searched)
+
+        # Changing the detectors means the text needs to be searched again
+        cached_scrubber.add_detector('url')
+        cached_scrubber.clean(docs['first.txt'])
+        self.assertEqual(['first.txt', 'second.txt', None], searched)
+        self.assertEqual(3, len(cached_scrubber.cache))
+
+    def test_scrubber_cache_wrong_type(self):
+        """Test that the usual error is raised for documents that are not strings"""
+        scrubber = scrubadub.Scrubber(cache=scrubadub.cache.MemoryCache())
+        with self.assertRaises(TypeError):
+            scrubber.clean_documents([0, 1, 2, '3'])
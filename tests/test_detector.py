@@ -7,6 +7,7 @@ from scrubadub.detectors.url import UrlDetector
 from scrubadub.detectors.email import EmailDetector
 from scrubadub.filth.base import Filth
 from scrubadub.exceptions import UnexpectedFilth
+from scrubadub.utils import TextFeatures
 import scrubadub
 
 
@@ -87,3 +88,17 @@ class DetectorTestCase(unittest.TestCase):
 
         with self.assertRaises(catalogue.RegistryError):
             scrubadub.detectors.catalogue.detector_catalogue.get(Temp.name)
+
+    def test_can_match(self):
+        """Test that a detector can be skipped based on its required literals and digits"""
+        class Temp(scrubadub.detectors.base.Detector):
+            name = "temp"
+            required_literals = (('password', 'pw'), ('user', ))
+            required_digits = 2
+
+        detector = Temp()
+        self.assertTrue(detector.can_match(TextFeatures('User 12 PW')))
+        self.assertFalse(detector.can_match(TextFeatures('User 1 PW')))
+        self.assertFalse(detector.can_match(TextFeatures('Someone 12 PW')))
+        self.assertFalse(detector.can_match(TextFeatures('User 12')))
+        self.assertTrue(Detector().can_match(TextFeatures('')))
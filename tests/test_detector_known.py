@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 
 import scrubadub
@@ -200,3 +202,100 @@ class PredefinedTestCase(unittest.TestCase):
             str(filth),
             "<TaggedEvaluationFilth text='hello' document_name='hello.txt' beg=0 end=5 comparison_type='greeting'>"
         )
+
+    def test_automaton(self):
+        """make sure the automaton finds the same filth as searching for each item with a regex"""
+        text = (
+            "Hello Joe Bloggs, JOE BLOGGS and joe\n\t bloggs live at 10 Downing Street. Joe Bloggsworth does not. "
+            "Call aaaa or a a a a on 0123 456 789, or e-mail joe_bloggs@example.com."
+        )
+        items = [
+            {'match': 'joe bloggs', 'filth_type': 'name'},
+            {'match': 'Joe Bloggs', 'filth_type': 'name', 'ignore_partial_word_matches': True},
+            {'match': 'joe bloggs', 'filth_type': 'name', 'ignore_case': True, 'ignore_whitespace': True},
+            {'match': 'joe   bloggs', 'filth_type': 'name', 'ignore_whitespace': True,
+             'ignore_partial_word_matches': True},
+            {'match': 'BLOGGS', 'filth_type': 'name', 'ignore_case': True, 'ignore_partial_word_matches': True},
+            {'match': 'aa', 'filth_type': 'name'},
+            {'match': 'a a', 'filth_type': 'name', 'ignore_whitespace': True},
+            {'match': '0123 456', 'filth_type': 'phone', 'ignore_whitespace': True},
+            {'match': '456 789', 'filth_type': 'phone'},
+            {'match': 'Downing', 'filth_type': 'address', 'match_end': 'Street'},
+            {'match': 'unknown', 'filth_type': 'name'},
+        ]
+
+        class RegexDetector(scrubadub.detectors.TaggedEvaluationFilthDetector):
+            automaton_min_items = len(items) + 1
+
+        class AutomatonDetector(scrubadub.detectors.TaggedEvaluationFilthDetector):
+            automaton_min_items = 1
+
+        class HashedDetector(scrubadub.detectors.TaggedEvaluationFilthDetector):
+            automaton_min_items = 1
+            automaton_max_items = 1
+
+        regex_detector = RegexDetector([dict(item) for item in items])
+        automaton_detector = AutomatonDetector([dict(item) for item in items])
+        hashed_detector = HashedDetector([dict(item) for item in items])
+        self.assertIsNone(regex_detector._automata)
+        self.assertIsInstance(automaton_detector._automata[(False, False)].matcher, scrubadub.utils.AhoCorasick)
+        self.assertIsInstance(hashed_detector._automata[(False, False)].matcher, scrubadub.utils.HashedLiteralMatcher)
+
+        def spans(detector):
+            return [(filth.beg, filth.end, filth.text, filth.comparison_type) for filth in detector.iter_filth(text)]
+
+        self.assertEqual(spans(regex_detector), spans(automaton_detector))
+        self.assertEqual(spans(regex_detector), spans(hashed_detector))
+        self.assertIn((18, 28, 'JOE BLOGGS', 'name'), spans(automaton_detector))
+        self.assertIn((33, 45, 'joe\n\t bloggs', 'name'), spans(automaton_detector))
+
+    def test_dedup(self):
+        """test that repeated items are only searched for once"""
+        detector = scrubadub.detectors.TaggedEvaluationFilthDetector([
+            {'match': 'test', 'filth_type': 'test'},
+            {'match': ' test ', 'filth_type': 'test', 'ignore_case': False},
+            {'match': 'test', 'filth_type': 'other'},
+        ])
+        self.assertEqual(['test', 'other'], [filth.comparison_type for filth in detector.iter_filth('a test')])
+
+        self.assertEqual(
+            [{'match': 'a', 'filth_type': 'name'}, {'match': 'b', 'filth_type': 'name'}],
+            scrubadub.detectors.TaggedEvaluationFilthDetector.dedup_dicts([
+                {'match': 'a', 'filth_type': 'name'},
+                {'match': 'b', 'filth_type': 'name'},
+                {'filth_type': 'name', 'match': 'a'},
+            ])
+        )
+
+    def test_load_files(self):
+        """test loading the known filth items from csv and json lines files"""
+        text = 'Hello Joe Bloggs, call me on 0123 456 789'
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, 'known.csv')
+            with open(csv_path, 'w') as csv_file:
+                csv_file.write(
+                    'match,filth_type,ignore_case,limit,match_end\n'
+                    'joe bloggs,name,true,,\n'
+                    '0123,phone,0,20,789\n'
+                )
+            jsonl_path = os.path.join(directory, 'known.jsonl')
+            with open(jsonl_path, 'w') as jsonl_file:
+                jsonl_file.write(
+                    '{"match": "joe bloggs", "filth_type": "name", "ignore_case": true}\n'
+                    '\n'
+                    '{"match": "0123", "filth_type": "phone", "match_end": "789", "limit": 20}\n'
+                )
+
+            for detector in [
+                scrubadub.detectors.TaggedEvaluationFilthDetector.from_csv(csv_path),
+                scrubadub.detectors.TaggedEvaluationFilthDetector.from_jsonl(jsonl_path, name='loaded'),
+            ]:
+                self.assertEqual(
+                    [('Joe Bloggs', 'name'), ('0123 456 789', 'phone')],
+                    [(filth.text, filth.comparison_type) for filth in detector.iter_filth(text)]
+                )
+
+            with open(csv_path, 'w') as csv_file:
+                csv_file.write('match,filth_type,ignore_case\njoe,name,maybe\n')
+            with self.assertRaises(ValueError):
+                scrubadub.detectors.TaggedEvaluationFilthDetector.from_csv(csv_path)
@@ -58,3 +58,45 @@ class PhoneNumberTestCase(unittest.TestCase, BaseTestCase):
             u'Call me on my cell {{PHONE}} or in my office {{PHONE}}',
             'problem with multiple phone numbers: \n %s' % result,
         )
+
+    def test_candidate_windows(self):
+        """test that only the text around digits is searched, with the same results as searching the whole text"""
+        import phonenumbers
+        import scrubadub
+
+        detector = scrubadub.detectors.PhoneDetector(locale='en_US')
+        text = (
+            'No numbers here. ' * 10 + 'Call 312-515-2239 ext. 12 at 12:30 on 10/12/2020, ' + 'or not. ' * 10 +
+            'Page 7 of (312) 515-2239, p. 12-15 (3' + ' nothing' * 10 + ' 773.415.7432'
+        )
+        self.assertEqual([(143, 250), (273, 369), (386, 430)], detector._candidate_windows(text))
+        self.assertEqual(430, len(text))
+        self.assertEqual(
+            [(match.start, match.end, match.raw_string) for match in phonenumbers.PhoneNumberMatcher(text, 'US')],
+            [(filth.beg, filth.end, filth.text) for filth in detector.iter_filth(text)],
+        )
+        self.assertEqual([], detector._candidate_windows('one 1 digit'))
+
+    def test_regions(self):
+        """test that the numbers of several regions are found in one detector, and each only once"""
+        import scrubadub
+
+        text = 'Call 020 7946 0018 in London, (312) 515-2239 in Chicago or +49 30 901820 in Berlin'
+        us_detector = scrubadub.detectors.PhoneDetector(locale='en_US')
+        self.assertEqual(['US'], us_detector.regions)
+        self.assertEqual(
+            ['(312) 515-2239', '+49 30 901820'],
+            [filth.text for filth in us_detector.iter_filth(text)],
+        )
+
+        detector = scrubadub.detectors.PhoneDetector(regions=['gb', 'US', 'DE', 'GB'])
+        self.assertEqual(['GB', 'US', 'DE'], detector.regions)
+        self.assertEqual(
+            [(5, 18, '020 7946 0018'), (30, 44, '(312) 515-2239'), (59, 72, '+49 30 901820')],
+            [(filth.beg, filth.end, filth.text) for filth in detector.iter_filth(text)],
+        )
+
+        with self.assertRaises(ValueError):
+            scrubadub.detectors.PhoneDetector(regions=['XX'])
+        with self.assertRaises(ValueError):
+            scrubadub.detectors.PhoneDetector(regions=[])
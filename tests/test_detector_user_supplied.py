@@ -26,3 +26,42 @@ class UserDefinedTestCase(unittest.TestCase):
 
         with self.assertRaises(KeyError):
             list(detector.iter_filth(test_str))
+
+    def test_unknown_filth(self):
+        """test that the 'unknown' filth type gives the base Filth"""
+
+        test_str = 'this is a test string'
+        detector = scrubadub.detectors.UserSuppliedFilthDetector([
+            {'match': 'test', 'filth_type': 'unknown'},
+        ])
+
+        matches = list(detector.iter_filth(test_str))
+        self.assertEqual(type(matches[0]), scrubadub.filth.Filth)
+        self.assertEqual(matches[0].type, 'unknown')
+        self.assertFalse(scrubadub.filth.Filth.autoload)
+
+    def test_registered_filth(self):
+        """test that filth registered by other packages can be used"""
+
+        class FruitFilth(scrubadub.filth.Filth):
+            type = 'fruit'
+
+        test_str = 'this is a test string'
+        detector = scrubadub.detectors.UserSuppliedFilthDetector([
+            {'match': 'test', 'filth_type': 'fruit'},
+            {'match': 'string', 'filth_type': 'name'},
+        ])
+
+        with self.assertRaises(KeyError):
+            list(detector.iter_filth(test_str))
+
+        scrubadub.filth.register_filth(FruitFilth)
+        try:
+            matches = list(detector.iter_filth(test_str))
+            self.assertIsInstance(matches[0], FruitFilth)
+            self.assertIsInstance(matches[1], scrubadub.filth.NameFilth)
+        finally:
+            scrubadub.filth.remove_filth('fruit')
+
+        with self.assertRaises(KeyError):
+            list(detector.iter_filth(test_str))
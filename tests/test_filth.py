@@ -1,9 +1,17 @@
 import re
+import pickle
 import unittest
 
-from scrubadub.filth import Filth, MergedFilth
+import scrubadub.filth
+from scrubadub.filth import Filth, MergedFilth, EmailFilth, TaggedEvaluationFilth, UrlFilth
+from scrubadub.filth.base import DetachedMatch
 from scrubadub.exceptions import InvalidReplaceWith, FilthMergeError
 
+
+class UnslottedFilth(Filth):
+    type = 'unslotted'
+
+
 class FilthTestCase(unittest.TestCase):
 
     def test_disallowed_replace_with(self):
@@ -159,4 +167,60 @@ class FilthTestCase(unittest.TestCase):
         self.assertTrue(
             Filth(beg=0, end=5, text='hello', document_name='test', detector_name='tester') !=
             Filth(beg=0, end=5, text='hello', document_name='another_test', detector_name='tester')
-        )
\ No newline at end of file
+        )
+
+    def test_slots(self):
+        """Filth keeps its attributes in slots, while subclasses without slots can still add attributes"""
+        # Build the strings at runtime, so that they are not already interned by the compiler
+        filth = EmailFilth(
+            beg=0, end=5, text='e@e.c', detector_name=''.join(['em', 'ail']), locale='_'.join(['en', 'GB'])
+        )
+        self.assertFalse(hasattr(filth, '__dict__'))
+        with self.assertRaises(AttributeError):
+            filth.something = 1
+        self.assertIs(filth.detector_name, 'email')
+        self.assertIs(filth.locale, 'en_GB')
+
+        some_filth = UnslottedFilth(beg=0, end=3, text='the', detector_name='some')
+        some_filth.something = 1
+
+        tagged_filth = TaggedEvaluationFilth(beg=4, end=7, text='end', comparison_type='name')
+        merged_filth = filth.merge(EmailFilth(beg=3, end=7, text='.com'))
+
+        for original in [filth, some_filth, tagged_filth, merged_filth]:
+            copied = pickle.loads(pickle.dumps(original))
+            self.assertEqual(type(copied), type(original))
+            self.assertEqual(copied, original)
+            self.assertEqual(repr(copied), repr(original))
+
+        self.assertEqual(pickle.loads(pickle.dumps(some_filth)).something, 1)
+        self.assertIs(pickle.loads(pickle.dumps(filth)).locale, 'en_GB')
+        self.assertEqual(pickle.loads(pickle.dumps(merged_filth)).placeholder, 'EMAIL+EMAIL')
+
+        for filth_cls in vars(scrubadub.filth).values():
+            if isinstance(filth_cls, type) and issubclass(filth_cls, Filth):
+                self.assertIn('__slots__', vars(filth_cls), filth_cls)
+
+    def test_detached_match(self):
+        """Filth only keeps the positions of a match, rather than the whole document"""
+        document = 'a long document ' * 100 + 'https://example.com/path/to/page'
+        match = re.search(r'(?P<domain>https?://[^/]+/)(?P<path>\S+)?', document)
+        filth = UrlFilth(match=match)
+        self.assertIsInstance(filth.match, DetachedMatch)
+        self.assertEqual(filth.match.string, 'https://example.com/path/to/page')
+        self.assertEqual((filth.beg, filth.end), match.span())
+        self.assertEqual(filth.match.span('path'), (20, 32))
+        self.assertEqual(filth.match.group('domain'), 'https://example.com/')
+        self.assertEqual(filth.match.groupdict(), match.groupdict())
+
+        match = re.search(r'(?P<domain>https?://[^/]+/)(?P<path>\S+)?', 'see https://example.com/')
+        filth = UrlFilth(match=match)
+        self.assertEqual(filth.match.span('path'), (-1, -1))
+        self.assertIsNone(filth.match.group('path'))
+
+        class RetainedFilth(Filth):
+            retain_match = True
+
+        filth = RetainedFilth(match=match)
+        self.assertIs(filth.match, match)
+        self.assertIsInstance(pickle.loads(pickle.dumps(EmailFilth(match=match))).match, DetachedMatch)
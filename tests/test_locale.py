@@ -84,4 +84,15 @@ class LocaleTestCase(unittest.TestCase):
         self.assertEqual(
             scrubadub.utils.locale_transform('zh'),
             'zh_CN.eucCN',
-        )
\ No newline at end of file
+        )
+
+    def test_locale_cache(self):
+        """Test that repeated locales give the same results from the cache, and that unknown locales still fail"""
+        scrubadub.utils.locale_split.cache_clear()
+        self.assertEqual(scrubadub.utils.locale_split('en_GB'), ('en', 'GB'))
+        self.assertEqual(scrubadub.utils.locale_split('en_GB'), ('en', 'GB'))
+        self.assertEqual(scrubadub.utils.locale_split.cache_info().hits, 1)
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                scrubadub.utils.locale_split('non_existant')
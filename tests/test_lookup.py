@@ -0,0 +1,89 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+import scrubadub
+import scrubadub.lookup
+from scrubadub.post_processors import FilthReplacer
+
+
+class LookupStoreTestCase(unittest.TestCase):
+
+    def _check_numbering(self, store):
+        self.assertEqual(0, store.get_id('email', 'a@example.com'))
+        self.assertEqual(1, store.get_id('email', 'b@example.com'))
+        self.assertEqual(0, store.get_id('phone', '0123'))
+        self.assertEqual(0, store['email']['a@example.com'])
+        self.assertEqual(3, len(store))
+
+    def test_memory_store(self):
+        """Test that the memory store numbers each type separately and forgets the least recently used text"""
+        store = scrubadub.lookup.MemoryLookupStore(max_entries=3)
+        self._check_numbering(store)
+
+        self.assertEqual(2, store.get_id('email', 'c@example.com'))
+        self.assertEqual(3, len(store))
+        # b@example.com was forgotten, and is given a new number rather than reusing an old one
+        self.assertEqual(3, store.get_id('email', 'b@example.com'))
+
+        copied_store = pickle.loads(pickle.dumps(store))
+        self.assertEqual(2, copied_store.get_id('email', 'c@example.com'))
+
+        store.clear()
+        self.assertEqual(0, len(store))
+        self.assertEqual(0, store.get_id('email', 'c@example.com'))
+
+    def test_sqlite_store(self):
+        """Test that the sqlite store keeps its numbers between connections"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'lookup.sqlite')
+            store = scrubadub.lookup.SqliteLookupStore(path, max_entries=3)
+            self._check_numbering(store)
+            self.assertEqual(2, store.get_id('email', 'c@example.com'))
+            self.assertEqual(3, len(store))
+            store.close()
+
+            store = scrubadub.lookup.SqliteLookupStore(path, max_entries=3)
+            self.assertEqual(0, store.get_id('email', 'a@example.com'))
+            self.assertEqual(3, store.get_id('email', 'b@example.com'))
+
+            copied_store = pickle.loads(pickle.dumps(store))
+            self.assertEqual(2, copied_store.get_id('email', 'c@example.com'))
+            copied_store.close()
+
+            store.clear()
+            self.assertEqual(0, len(store))
+            store.close()
+
+    def test_manager_store(self):
+        """Test that the manager store is shared by its copies"""
+        store = scrubadub.lookup.ManagerLookupStore()
+        try:
+            self._check_numbering(store)
+            copied_store = pickle.loads(pickle.dumps(store))
+            self.assertEqual(2, copied_store.get_id('email', 'c@example.com'))
+            self.assertEqual(4, len(store))
+        finally:
+            store.close()
+
+    def test_filth_replacer(self):
+        """Test that the FilthReplacer numbers filth with the given store, even in other processes"""
+        text = "Contact me at joe@example.com or jane@example.com, joe@example.com is best"
+        with tempfile.TemporaryDirectory() as directory:
+            store = scrubadub.lookup.SqliteLookupStore(os.path.join(directory, 'lookup.sqlite'))
+            scrubber = scrubadub.Scrubber(post_processor_list=[
+                FilthReplacer(include_count=True, lookup_store=store),
+            ])
+            self.assertEqual('Contact me at EMAIL-0 or EMAIL-1, EMAIL-0 is best', scrubber.clean(text))
+            self.assertEqual(
+                ['Contact me at EMAIL-0 or EMAIL-1, EMAIL-0 is best', 'Hello EMAIL-2 and EMAIL-1'],
+                scrubber.clean_documents([text, 'Hello alex@example.com and jane@example.com'], workers=2),
+            )
+            store.close()
+
+        # FilthReplacers without a store share the default one
+        FilthReplacer.reset_lookup()
+        self.assertEqual('EMAIL-0', FilthReplacer(include_count=True).filth_label(scrubadub.filth.EmailFilth(0, 1, 'a')))
+        self.assertEqual('EMAIL-1', FilthReplacer(include_count=True).filth_label(scrubadub.filth.EmailFilth(0, 1, 'b')))
+        FilthReplacer.reset_lookup()
@@ -23,3 +23,87 @@ class PostProcessorTestCase(unittest.TestCase):
         """make sure adding an initialised detector works"""
         with self.assertRaises(NotImplementedError):
             scrubadub.post_processors.PostProcessor().process_filth([])
+
+    def test_post_processor_streaming(self):
+        """make sure post processors that dont need collation see the filth one at a time"""
+        seen = []
+
+        class CollatingPostProcessor(scrubadub.post_processors.PostProcessor):
+            name = 'collating'
+
+            def process_filth(self, filth_list):
+                seen.append(len(filth_list))
+                return filth_list
+
+        class StreamingPostProcessor(scrubadub.post_processors.PostProcessor):
+            name = 'streaming'
+            requires_collation = False
+
+            def process_filth_iterator(self, filth_iterator):
+                for filth in filth_iterator:
+                    seen.append(filth.document_name)
+                    yield filth
+
+        streaming = StreamingPostProcessor()
+        self.assertEqual(list(streaming.process_filth_iterator(iter([]))), [])
+        self.assertEqual(list(CollatingPostProcessor().process_filth_iterator(iter([]))), [])
+        self.assertEqual(seen, [0])
+        del seen[:]
+
+        documents = ['a@example.com and b@example.com', 'nothing here', 'c@example.com']
+        scrubber = scrubadub.Scrubber(detector_list=['email'], post_processor_list=[
+            streaming,
+            scrubadub.post_processors.FilthReplacer(include_count=True),
+            scrubadub.post_processors.PrefixSuffixReplacer(),
+        ])
+        self.assertTrue(scrubber._can_stream_post_processors())
+        scrubadub.post_processors.FilthReplacer.reset_lookup()
+        self.assertEqual(
+            scrubber.clean_documents(documents),
+            ['{{EMAIL-0}} and {{EMAIL-1}}', 'nothing here', '{{EMAIL-2}}'],
+        )
+        self.assertEqual(seen, ['0', '0', '2'])
+        del seen[:]
+
+        # A post processor that needs all of the filth makes the scrubber collate it
+        scrubber.add_post_processor(CollatingPostProcessor())
+        self.assertFalse(scrubber._can_stream_post_processors())
+        self.assertEqual(
+            scrubber.clean_documents({'x': documents[0], 'y': documents[1]}),
+            {'x': '{{EMAIL-0}} and {{EMAIL-1}}', 'y': 'nothing here'},
+        )
+        self.assertEqual(seen, ['x', 'x', 2])
+        scrubadub.post_processors.FilthReplacer.reset_lookup()
+
+    def test_post_processor_requires_collation(self):
+        """make sure the built in per-filth post processors stream"""
+        for post_processor in [
+            scrubadub.post_processors.FilthRemover(),
+            scrubadub.post_processors.FilthReplacer(include_count=True),
+            scrubadub.post_processors.PrefixSuffixReplacer(),
+        ]:
+            self.assertFalse(post_processor.requires_collation)
+            filths = [EmailFilth(beg=0, end=5, text='e@e.c')]
+            self.assertEqual(list(post_processor.process_filth_iterator(iter(filths))), filths)
+        self.assertTrue(scrubadub.post_processors.PostProcessor.requires_collation)
+
+    def test_post_processor_subclass_process_filth(self):
+        """make sure subclasses of the streaming post processors that override process_filth are still run"""
+        class ShoutingReplacer(scrubadub.post_processors.FilthReplacer):
+            def process_filth(self, filth_list):
+                filth_list = super().process_filth(filth_list)
+                for filth in filth_list:
+                    filth.replacement_string = filth.replacement_string.upper() + '!'
+                return filth_list
+
+        class ShoutingStreamingReplacer(ShoutingReplacer):
+            requires_collation = False
+
+        self.assertTrue(ShoutingReplacer.requires_collation)
+        self.assertFalse(ShoutingStreamingReplacer.requires_collation)
+        self.assertFalse(scrubadub.post_processors.FilthReplacer.requires_collation)
+
+        scrubber = scrubadub.Scrubber(detector_list=['email'], post_processor_list=[ShoutingReplacer()])
+        self.assertFalse(scrubber._can_stream_post_processors())
+        self.assertEqual(scrubber.clean('mail a@example.com'), 'mail EMAIL!')
+        self.assertEqual(scrubber.clean_documents(['mail a@example.com']), ['mail EMAIL!'])
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 import scrubadub.filth
@@ -112,6 +113,57 @@ class FilthTypeReplacerTestCase(unittest.TestCase):
         self.assertEqual(filths[0].replacement_string, '87BB6F7ED5FE49C4EA43D95A41F843D4FBB66D15C5AA41A7F7')
         self.assertEqual(len(filths[0].replacement_string), 50)
 
+    def test_hash_methods(self):
+        """Test the hashing methods and the cache of hashes"""
+        filths = [EmailFilth(0, 19, 'example@example.com')]
+
+        post_proc = FilthReplacer(hash_salt='example', include_type=False, include_hash=True, hash_method='blake2b')
+        filths = post_proc.process_filth(filths)
+        self.assertEqual(filths[0].replacement_string, '28A41109760E259F')
+
+        post_proc = FilthReplacer(hash_salt='example', include_type=False, include_hash=True,
+                                  hash_method='hmac_sha256')
+        filths = post_proc.process_filth(filths)
+        self.assertEqual(filths[0].replacement_string, '2AB824D8FC335686')
+
+        # Shorter hashes are the start of the longer ones
+        post_proc = FilthReplacer(hash_salt='example', include_type=False, include_hash=True, hash_method='blake2b',
+                                  hash_length=128)
+        filths = post_proc.process_filth(filths)
+        self.assertEqual(len(filths[0].replacement_string), 128)
+        self.assertTrue(filths[0].replacement_string.startswith('28A41109760E259F'))
+
+        # The default salt is longer than a BLAKE2b key
+        post_proc = FilthReplacer(include_type=False, include_hash=True, hash_method='blake2b')
+        filths = post_proc.process_filth(filths)
+        self.assertEqual(len(filths[0].replacement_string), 16)
+
+        with self.assertRaises(ValueError):
+            FilthReplacer(include_hash=True, hash_method='md5')
+        with self.assertRaises(ValueError):
+            FilthReplacer(include_hash=True, hash_method='hmac_sha256', hash_length=65)
+
+    def test_hash_cache(self):
+        """Test that each FilthReplacer remembers its own recent hashes"""
+        post_proc = FilthReplacer(include_type=False, include_hash=True, hash_salt='example', hash_method='blake2b')
+        post_proc.hash_cache_size = 2
+        labels = [post_proc.filth_label(EmailFilth(0, 13, text)) for text in ['a@example.com', 'b@example.com']]
+        self.assertEqual(['a@example.com', 'b@example.com'], [key[0] for key in post_proc._hashes])
+
+        # Using a hash again makes it the most recent, so the least recently used one is forgotten first
+        self.assertEqual(labels[0], post_proc.filth_label(EmailFilth(0, 13, 'A@example.com')))
+        post_proc.filth_label(EmailFilth(0, 13, 'c@example.com'))
+        self.assertEqual(['a@example.com', 'c@example.com'], [key[0] for key in post_proc._hashes])
+
+        # The remembered hashes are not shared or pickled
+        self.assertEqual(0, len(FilthReplacer(include_hash=True)._hashes))
+        copied = pickle.loads(pickle.dumps(post_proc))
+        self.assertEqual(0, len(copied._hashes))
+        self.assertEqual(labels[1], copied.filth_label(EmailFilth(0, 13, 'b@example.com')))
+
+        post_proc.clear_hash_cache()
+        self.assertEqual(0, len(post_proc._hashes))
+
     def test_bad_filth(self):
         """Test making labels from a filth without a type"""
         class TestFilth(Filth):
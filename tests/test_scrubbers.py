@@ -1,7 +1,15 @@
+import io
+import os
+import time
+import asyncio
+import re
 import copy
+import pickle
+import tempfile
 import warnings
 import unittest
 import catalogue
+import concurrent.futures
 
 import scrubadub
 import scrubadub.detectors.catalogue
@@ -350,6 +358,42 @@ class ScrubberTestCase(unittest.TestCase):
             [(None, 5, 8), ('a', 0, 1), ('b', 0, 3), ('b', 4, 5)]
         )
 
+    def test_merging_chain(self):
+        """Ensure that a long chain of overlapping filth is merged into one flat MergedFilth"""
+        text = 'abcdefghij' * 1000
+        filths = [
+            Filth(beg=i, end=min(i + 20, len(text)), text=text[i:i + 20], document_name='a')
+            for i in range(0, len(text), 10)
+        ]
+        merged = list(scrubadub.Scrubber._merge_filths(filths[::-1]))
+        self.assertEqual(1, len(merged))
+        self.assertEqual((0, len(text)), (merged[0].beg, merged[0].end))
+        self.assertEqual(text, merged[0].text)
+        self.assertEqual(filths, merged[0].filths)
+        self.assertEqual('+'.join(['UNKNOWN'] * len(filths)), merged[0].placeholder)
+
+        # Merging a MergedFilth again keeps the filths flat, as happens when cached filth is merged
+        extra = Filth(beg=len(text) - 5, end=len(text), text=text[-5:], document_name='a')
+        remerged = list(scrubadub.Scrubber._merge_filths([merged[0], extra]))
+        self.assertEqual(filths + [extra], remerged[0].filths)
+        self.assertEqual(merged[0].text, remerged[0].text)
+
+    def test_group_filths_by_document(self):
+        """Ensure that each document gets exactly its own filth, in the original order"""
+        document_names = [None] + ['doc{}'.format(i) for i in range(200)]
+        filths = [
+            Filth(beg=i, end=i + 1, text='x', document_name=document_names[(i * 7) % len(document_names)])
+            for i in range(5000)
+        ]
+        grouped = scrubadub.Scrubber._group_filths_by_document(filths)
+        self.assertEqual(set(document_names), set(grouped.keys()))
+        for document_name in document_names:
+            self.assertEqual(
+                [filth for filth in filths if filth.document_name == document_name],
+                grouped[document_name],
+            )
+        self.assertEqual({}, scrubadub.Scrubber._group_filths_by_document([]))
+
     def test_list_filth_documents_dict(self):
         """Test the iter_filth_documents funtion with a dict"""
         scrubber = scrubadub.Scrubber(post_processor_list=[scrubadub.post_processors.FilthReplacer()])
@@ -455,3 +499,227 @@ class ScrubberTestCase(unittest.TestCase):
             self.assertEqual(1, len(scrubber._detectors))
         finally:
             catalogue.REGISTRY = orig_catalogue
+
+    def test_executor(self):
+        """Test that running the detectors in a thread or process pool gives the same filth"""
+        docs = {
+            "first.txt": "This is a test message for example@example.com",
+            "second.txt": "Hello @Jane call me on +33 4 41 26 62 36.",
+            "third.txt": "username: jane password: 123456 or https://example.com/jane",
+        }
+        scrubber = scrubadub.Scrubber()
+        expected_filth = list(scrubber.iter_filth_documents(docs))
+        expected_clean = scrubber.clean_documents(docs)
+
+        for executor_cls in [concurrent.futures.ThreadPoolExecutor, concurrent.futures.ProcessPoolExecutor]:
+            with executor_cls(max_workers=2) as executor:
+                scrubber = scrubadub.Scrubber(executor=executor, executor_batch_size=2)
+                self.assertEqual(expected_filth, list(scrubber.iter_filth_documents(docs)))
+                self.assertEqual(expected_clean, scrubber.clean_documents(docs))
+
+    def test_executor_error(self):
+        """Test that errors raised by detectors in an executor are passed on"""
+        class BadDetector(scrubadub.detectors.Detector):
+            name = 'bad_detector'
+            def iter_filth(self, text, **kwargs):
+                yield 'Non-filth'
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            scrubber = scrubadub.Scrubber(detector_list=[BadDetector()], executor=executor)
+            with self.assertRaises(TypeError):
+                list(scrubber.iter_filth('A fake document with no pii'))
+
+    def test_pickle_filth(self):
+        """Test that filth found with a regex can be pickled"""
+        filths = list(scrubadub.Scrubber().iter_filth("username: jane password: 123456"))
+        self.assertEqual(1, len(filths))
+        unpickled = pickle.loads(pickle.dumps(filths[0]))
+        self.assertEqual(filths[0], unpickled)
+        self.assertEqual(filths[0].placeholder, unpickled.placeholder)
+        self.assertEqual(filths[0].match.group('password'), unpickled.match.group('password'))
+
+    def test_clean_documents_workers(self):
+        """Test that cleaning documents in several processes gives the same result"""
+        docs = [
+            "This is a test message for example@example.com",
+            "Hello @Jane call me on +33 4 41 26 62 36.",
+            "username: jane password: 123456 or https://example.com/jane",
+        ]
+        scrubber = scrubadub.Scrubber(post_processor_list=[
+            scrubadub.post_processors.FilthReplacer(include_hash=True, hash_salt='example'),
+            scrubadub.post_processors.PrefixSuffixReplacer(),
+        ])
+        self.assertEqual(scrubber.clean_documents(docs), scrubber.clean_documents(docs, workers=2))
+
+        docs_dict = {str(i) + '.txt': doc for i, doc in enumerate(docs)}
+        self.assertEqual(scrubber.clean_documents(docs_dict), scrubber.clean_documents(docs_dict, workers=2))
+        self.assertEqual(list(docs_dict.keys()), list(scrubber.clean_documents(docs_dict, workers=2).keys()))
+
+    def test_pickle_scrubber(self):
+        """Test that a scrubber can be pickled, and that its executor is dropped"""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            scrubber = scrubadub.Scrubber(
+                post_processor_list=[scrubadub.post_processors.FilthReplacer(include_count=True)],
+                executor=executor,
+            )
+            unpickled = pickle.loads(pickle.dumps(scrubber))
+            self.assertIsNone(unpickled.executor)
+            self.assertEqual(list(scrubber._detectors.keys()), list(unpickled._detectors.keys()))
+            self.assertEqual(
+                scrubber.clean("contact me at jane@example.com"),
+                unpickled.clean("contact me at jane@example.com"),
+            )
+
+    def test_clean_stream(self):
+        """Test that cleaning a stream in windows gives the same result as cleaning the whole text"""
+        scrubber = scrubadub.Scrubber(detector_list=['email', 'url', 'twitter', 'credit_card'])
+        text = (
+            "hi joe@example.com and @jane see https://example.com/abc joe@example.comhttps://example.org "
+            "4111111111111111 ok "
+        ) * 6
+        expected = scrubber.clean(text)
+        for window_size in range(121, 400, 7):
+            output = io.StringIO()
+            scrubber.clean_stream(io.StringIO(text), output, window_size=window_size, overlap=60)
+            self.assertEqual(expected, output.getvalue())
+
+        output = io.StringIO()
+        scrubber.clean_stream(io.StringIO(text), output)
+        self.assertEqual(expected, output.getvalue())
+
+        output = io.StringIO()
+        scrubber.clean_stream(io.StringIO(''), output)
+        self.assertEqual('', output.getvalue())
+
+        output = io.StringIO()
+        scrubber.clean_stream(io.StringIO('contact me at joe@example.com'), output)
+        self.assertEqual('contact me at {{EMAIL}}', output.getvalue())
+
+    def test_clean_file(self):
+        """Test that cleaning a memory mapped file gives the same result as cleaning the whole text"""
+        scrubber = scrubadub.Scrubber(detector_list=['email', 'url', 'twitter', 'credit_card'])
+        text = (
+            "hi joe@example.com and @jane sée https://example.com/abc joe@example.comhttps://example.org "
+            "4111111111111111 ok 🙂 "
+        ) * 6
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'in.txt')
+            out_path = os.path.join(directory, 'out.txt')
+            with open(path, 'w', encoding='utf-8') as handle:
+                handle.write(text)
+
+            expected = scrubber.clean(text)
+            for window_size in range(121, 400, 31):
+                scrubber.clean_file(path, out_path, window_size=window_size, overlap=60)
+                with open(out_path, encoding='utf-8') as handle:
+                    self.assertEqual(expected, handle.read())
+
+            expected_filth = list(scrubber.iter_filth(text))
+            filth_list = list(scrubber.iter_filth_file(path, window_size=200, overlap=60))
+            self.assertEqual([(f.beg, f.end, f.text) for f in expected_filth],
+                             [(f.beg, f.end, f.text) for f in filth_list])
+            self.assertEqual({path}, set(f.document_name for f in filth_list))
+
+            encoded = text.encode('utf-8')
+            for filth in scrubber.iter_filth_file(path, window_size=200, overlap=60, byte_offsets=True):
+                self.assertEqual(filth.text, encoded[filth.beg:filth.end].decode('utf-8'))
+
+            with open(path, 'w', encoding='utf-8') as handle:
+                pass
+            scrubber.clean_file(path, out_path)
+            with open(out_path, encoding='utf-8') as handle:
+                self.assertEqual('', handle.read())
+            self.assertEqual([], list(scrubber.iter_filth_file(path)))
+
+    def test_clean_stream_overlap(self):
+        """Test that the overlap is checked when streaming"""
+        scrubber = scrubadub.Scrubber(detector_list=['email'])
+        with self.assertRaises(ValueError):
+            scrubber.clean_stream(io.StringIO('text'), io.StringIO(), window_size=100, overlap=50)
+
+        scrubber.add_detector(scrubadub.detectors.SkypeDetector)
+        with self.assertRaises(ValueError):
+            scrubber.clean_stream(io.StringIO('text'), io.StringIO())
+
+    def test_detectors_skipped(self):
+        """Test that detectors are only run on documents that they could find filth in"""
+        searched = []
+
+        class PasswordFilth(Filth):
+            type = 'password'
+
+        class PasswordDetector(scrubadub.detectors.RegexDetector):
+            name = 'password_detector'
+            filth_cls = PasswordFilth
+            regex = re.compile(r'password: \S+', re.IGNORECASE)
+            required_literals = (('password', ), )
+
+            def iter_filth(self, text, document_name=None):
+                searched.append(document_name)
+                yield from super().iter_filth(text, document_name=document_name)
+
+        docs = {
+            "first.txt": "Nothing to see here",
+            "second.txt": "My Password: hunter2",
+        }
+        scrubber = scrubadub.Scrubber(detector_list=[PasswordDetector()])
+        self.assertEqual(
+            {"first.txt": "Nothing to see here", "second.txt": "My {{PASSWORD}}"},
+            scrubber.clean_documents(docs),
+        )
+        self.assertEqual(["second.txt"], searched)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            scrubber.executor = executor
+            self.assertEqual("Nothing to see here", scrubber.clean("Nothing to see here"))
+        self.assertEqual(["second.txt"], searched)
+
+    def test_aclean(self):
+        """Test that cleaning text with asyncio gives the same result"""
+        text = "Hello @Jane call me on +33 4 41 26 62 36 or example@example.com"
+        scrubber = scrubadub.Scrubber()
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertEqual(scrubber.clean(text), loop.run_until_complete(scrubber.aclean(text)))
+        finally:
+            loop.close()
+
+    def test_aiter_filth_documents(self):
+        """Test that filth is streamed from each document as it is searched"""
+        class SlowDetector(scrubadub.detectors.Detector):
+            name = 'slow'
+
+            def iter_filth(self, text, document_name=None):
+                if text.startswith('slow'):
+                    time.sleep(0.5)
+                yield Filth(beg=0, end=4, text=text[:4], document_name=document_name, detector_name=self.name)
+
+        async def find_filth(scrubber, documents, **kwargs):
+            return [filth async for filth in scrubber.aiter_filth_documents(documents, **kwargs)]
+
+        docs = {
+            "first.txt": "slow document",
+            "second.txt": "fast document",
+            "third.txt": "fast document and example@example.com",
+        }
+        scrubber = scrubadub.Scrubber(detector_list=[SlowDetector(), 'email'])
+        loop = asyncio.new_event_loop()
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                filths = loop.run_until_complete(find_filth(scrubber, docs, executor=executor, max_concurrency=2))
+            self.assertEqual(
+                ['second.txt', 'third.txt', 'third.txt', 'first.txt'],
+                [filth.document_name for filth in filths],
+            )
+            self.assertEqual(
+                sorted(scrubber.iter_filth_documents(docs), key=lambda f: (f.document_name, f.beg)),
+                sorted(filths, key=lambda f: (f.document_name, f.beg)),
+            )
+
+            filths = loop.run_until_complete(find_filth(scrubber, list(docs.values()), max_concurrency=1))
+            self.assertEqual(['0', '1', '2', '2'], [filth.document_name for filth in filths])
+
+            with self.assertRaises(TypeError):
+                loop.run_until_complete(find_filth(scrubber, 'A string'))
+        finally:
+            loop.close()
@@ -0,0 +1,120 @@
+import unittest
+import concurrent.futures
+
+import scrubadub
+import scrubadub.stats
+from scrubadub.filth import Filth
+
+
+class InvalidFilth(Filth):
+    type = 'invalid'
+
+    def is_valid(self):
+        return self.text != 'bad'
+
+
+class InvalidDetector(scrubadub.detectors.RegexDetector):
+    name = 'invalid_detector'
+    filth_cls = InvalidFilth
+    regex = scrubadub.detectors.email.re.compile(r'bad|good')
+
+
+class StatsTestCase(unittest.TestCase):
+
+    docs = {
+        "first.txt": "This is a good test message for example@example.com",
+        "second.txt": "Hello @Jane, this is bad.",
+        "third.txt": "username: jane password: 123456",
+    }
+
+    def _make_scrubber(self, **kwargs):
+        return scrubadub.Scrubber(
+            detector_list=['email', 'twitter', 'credential', InvalidDetector()],
+            post_processor_list=[
+                scrubadub.post_processors.FilthReplacer(),
+                scrubadub.post_processors.PrefixSuffixReplacer(),
+            ],
+            stats=scrubadub.stats.ScrubberStats(),
+            **kwargs
+        )
+
+    def test_detector_stats(self):
+        """Test that the documents, characters and filth of each detector are counted"""
+        scrubber = self._make_scrubber()
+        scrubber.clean_documents(self.docs)
+        stats = scrubber.stats.as_dict()
+
+        self.assertEqual(['email', 'twitter', 'credential', 'invalid_detector'], list(stats['detectors'].keys()))
+        self.assertEqual(2, stats['detectors']['email']['documents'])
+        self.assertEqual(len(self.docs['first.txt']) + len(self.docs['second.txt']),
+                         stats['detectors']['email']['characters'])
+        self.assertEqual(1, stats['detectors']['email']['filth_found'])
+        self.assertEqual(1, stats['detectors']['email']['calls'])
+        self.assertEqual(1, stats['detectors']['credential']['documents'])
+        self.assertEqual(1, stats['detectors']['invalid_detector']['filth_found'])
+        self.assertEqual(1, stats['detectors']['invalid_detector']['filth_rejected'])
+        self.assertEqual(3, stats['detectors']['invalid_detector']['documents'])
+        self.assertGreater(stats['detectors']['invalid_detector']['wall_time'], 0)
+
+        self.assertEqual(['filth_replacer', 'prefix_suffix_replacer'], list(stats['post_processors'].keys()))
+        self.assertEqual(4, stats['post_processors']['filth_replacer']['filth_found'])
+        self.assertEqual(0, stats['post_processors']['filth_replacer']['filth_rejected'])
+
+        scrubber.stats.reset()
+        self.assertEqual({'detectors': {}, 'post_processors': {}}, scrubber.stats.as_dict())
+
+    def test_post_processor_removed(self):
+        """Test that filth removed by a post processor is counted"""
+        class DropEmails(scrubadub.post_processors.PostProcessor):
+            name = 'drop_emails'
+
+            def process_filth(self, filth_list):
+                return [filth for filth in filth_list if filth.type != 'email']
+
+        scrubber = scrubadub.Scrubber(
+            detector_list=['email', 'twitter'],
+            post_processor_list=[DropEmails()],
+            stats=scrubadub.stats.ScrubberStats(),
+        )
+        scrubber.clean('Hello @Jane: example@example.com')
+        stats = scrubber.stats.as_dict()['post_processors']['drop_emails']
+        self.assertEqual(1, stats['calls'])
+        self.assertEqual(1, stats['filth_found'])
+        self.assertEqual(1, stats['filth_rejected'])
+
+    def test_parallel_stats(self):
+        """Test that stats are collected when running detectors in threads or processes"""
+        expected = self._make_scrubber()
+        expected.clean_documents(self.docs)
+        expected_stats = expected.stats.as_dict()
+
+        fields = ['calls', 'documents', 'characters', 'filth_found', 'filth_rejected']
+        for executor_cls in [concurrent.futures.ThreadPoolExecutor, concurrent.futures.ProcessPoolExecutor]:
+            with executor_cls(max_workers=2) as executor:
+                scrubber = self._make_scrubber(executor=executor)
+                scrubber.clean_documents(self.docs)
+            for name, detector_stats in expected_stats['detectors'].items():
+                for field in fields:
+                    self.assertEqual(detector_stats[field], scrubber.stats.as_dict()['detectors'][name][field])
+
+        scrubber = self._make_scrubber()
+        scrubber.clean_documents(self.docs, workers=2)
+        for name, detector_stats in expected_stats['detectors'].items():
+            for field in ['documents', 'characters', 'filth_found', 'filth_rejected']:
+                self.assertEqual(detector_stats[field], scrubber.stats.as_dict()['detectors'][name][field])
+
+    def test_prometheus(self):
+        """Test the prometheus text format"""
+        stats = scrubadub.stats.ScrubberStats()
+        stats.record_detector('email', scrubadub.stats.ComponentStats(calls=1, documents=2, wall_time=0.5))
+        stats.record_detector('email', scrubadub.stats.ComponentStats(calls=1, documents=3))
+        stats.record_post_processor('odd "name"', scrubadub.stats.ComponentStats(calls=1, filth_found=4))
+        text = stats.to_prometheus(prefix='test')
+        lines = text.splitlines()
+
+        self.assertTrue(text.endswith('\n'))
+        self.assertIn('# TYPE test_detector_documents_total counter', lines)
+        self.assertIn('test_detector_documents_total{detector="email"} 5', lines)
+        self.assertIn('test_detector_wall_seconds_total{detector="email"} 0.5', lines)
+        self.assertIn('test_post_processor_filth_found_total{post_processor="odd \\"name\\""} 4', lines)
+        self.assertEqual('\n', scrubadub.stats.ScrubberStats().to_prometheus())
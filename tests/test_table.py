@@ -0,0 +1,63 @@
+import unittest
+
+import scrubadub
+from scrubadub.filth import EmailFilth, UrlFilth, NameFilth
+from scrubadub.table import FilthTable
+
+
+class FilthTableTestCase(unittest.TestCase):
+
+    def test_from_scrubber(self):
+        """Test that the table holds the same filth as iter_filth_documents"""
+        documents = {'a': 'contact me at joe@example.com or https://example.com', 'b': 'nothing', 'c': 'jo@x.com'}
+        scrubber = scrubadub.Scrubber(detector_list=['email', 'url'])
+        filth_list = list(scrubber.iter_filth_documents(documents))
+        table = scrubber.get_filth_table(documents)
+
+        self.assertEqual(len(filth_list), len(table))
+        self.assertEqual([f.beg for f in filth_list], table.beg.tolist())
+        self.assertEqual([f.end for f in filth_list], table.end.tolist())
+        self.assertEqual([f.type for f in filth_list], table.names(table.type_id).tolist())
+        self.assertEqual([f.detector_name for f in filth_list], table.names(table.detector_id).tolist())
+        self.assertEqual([f.document_name for f in filth_list], table.names(table.document_id).tolist())
+        self.assertEqual([f.locale for f in filth_list], table.names(table.locale_id).tolist())
+
+        dataframe = table.filter_types(['email']).to_dataframe(documents)
+        self.assertEqual(['joe@example.com', 'jo@x.com'], dataframe['text'].tolist())
+        self.assertEqual(['a', 'c'], dataframe['document_name'].tolist())
+
+    def test_merge(self):
+        """Test that merging the table groups the filth in the same way as the Scrubber"""
+        filth_list = [
+            UrlFilth(beg=10, end=20, text='x' * 10, document_name='b'),
+            EmailFilth(beg=0, end=5, text='x' * 5, document_name='a'),
+            EmailFilth(beg=4, end=8, text='x' * 4, document_name='a'),
+            NameFilth(beg=8, end=9, text='x', document_name='a'),
+            NameFilth(beg=10, end=12, text='x' * 2, document_name='a'),
+            EmailFilth(beg=0, end=15, text='x' * 15, document_name='b'),
+        ]
+        table = FilthTable.from_filth(filth_list).merge()
+        merged_filth = list(scrubadub.Scrubber._merge_filths(filth_list))
+
+        document_ids, begs, ends = table.spans()
+        self.assertEqual([f.document_name for f in merged_filth], table.names(document_ids).tolist())
+        self.assertEqual([f.beg for f in merged_filth], begs.tolist())
+        self.assertEqual([f.end for f in merged_filth], ends.tolist())
+        self.assertEqual([0, 0, 0, 1, 2, 2], table.group_id.tolist())
+
+        # Merged Filth is stored as a row for each of the Filth that it was made from
+        merged_table = FilthTable.from_filth(merged_filth)
+        self.assertEqual(len(filth_list), len(merged_table))
+        self.assertEqual(table.group_id.tolist(), merged_table.group_id.tolist())
+
+    def test_empty(self):
+        """Test that an empty table can be used"""
+        table = FilthTable.from_filth([])
+        self.assertEqual(0, len(table))
+        self.assertEqual(0, len(table.merge()))
+        self.assertEqual(0, len(table.filter_types(['email'])))
+        self.assertEqual([0, 0, 0], [len(column) for column in table.spans()])
+        self.assertEqual(0, len(table.to_dataframe()))
+
+        with self.assertRaises(ValueError):
+            FilthTable(strings=[], beg=[1], end=[])
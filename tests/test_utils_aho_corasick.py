@@ -0,0 +1,27 @@
+import pickle
+import unittest
+
+from scrubadub.utils import AhoCorasick
+
+
+class AhoCorasickTestCase(unittest.TestCase):
+
+    def test_matches(self):
+        """make sure overlapping and nested patterns are all found, in the order that they end"""
+        automaton = AhoCorasick(['he', 'she', 'hers', 'his', 'e'])
+        self.assertEqual(
+            [(1, 1), (2, 0), (3, 4), (2, 2), (8, 3)],
+            list(automaton.iter_matches('ushers this')),
+        )
+        self.assertEqual([], list(automaton.iter_matches('')))
+        self.assertEqual([], list(AhoCorasick([]).iter_matches('ushers')))
+
+    def test_empty_pattern(self):
+        """make sure an empty pattern is refused"""
+        with self.assertRaises(ValueError):
+            AhoCorasick(['he', ''])
+
+    def test_pickle(self):
+        """make sure an automaton can be copied to other processes"""
+        automaton = pickle.loads(pickle.dumps(AhoCorasick(['he', 'she'])))
+        self.assertEqual([(1, 1), (2, 0)], list(automaton.iter_matches('ushers')))
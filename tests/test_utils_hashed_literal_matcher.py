@@ -0,0 +1,24 @@
+import unittest
+
+from scrubadub.utils import AhoCorasick, HashedLiteralMatcher
+
+
+class HashedLiteralMatcherTestCase(unittest.TestCase):
+
+    def test_matches(self):
+        """make sure the same matches are found as with an AhoCorasick automaton"""
+        patterns = ['he', 'she', 'hers', 'his', 'e', 'is this']
+        text = 'ushers this is this'
+        self.assertEqual(
+            sorted(AhoCorasick(patterns).iter_matches(text)),
+            list(HashedLiteralMatcher(patterns).iter_matches(text)),
+        )
+        self.assertEqual([], list(HashedLiteralMatcher(patterns).iter_matches('')))
+        self.assertEqual([], list(HashedLiteralMatcher([]).iter_matches('ushers')))
+
+    def test_bad_patterns(self):
+        """make sure empty and repeated patterns are refused"""
+        with self.assertRaises(ValueError):
+            HashedLiteralMatcher(['he', ''])
+        with self.assertRaises(ValueError):
+            HashedLiteralMatcher(['he', 'she', 'he'])
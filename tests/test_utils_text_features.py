@@ -0,0 +1,35 @@
+import unittest
+
+from scrubadub.utils import TextFeatures
+
+
+class TextFeaturesTestCase(unittest.TestCase):
+
+    def test_contains_any(self):
+        """make sure literals are searched for in the case folded text"""
+        features = TextFeatures('My PASSWORD is Straße')
+        self.assertTrue(features.contains_any(['password']))
+        self.assertTrue(features.contains_any(['pw', 'strasse']))
+        self.assertFalse(features.contains_any(['username', 'login']))
+        self.assertFalse(features.contains_any([]))
+
+    def test_case_insensitive_regex_equivalents(self):
+        """make sure the features match the characters that re.IGNORECASE treats as equal"""
+        features = TextFeatures('paſſword and logın')
+        self.assertTrue(features.contains_any(['password']))
+        self.assertTrue(features.contains_any(['login']))
+
+    def test_has_digits(self):
+        """make sure digits are counted as far as needed"""
+        features = TextFeatures('call 0 1 2 or ٣')
+        self.assertTrue(features.has_digits(0))
+        self.assertTrue(features.has_digits(2))
+        self.assertTrue(features.has_digits(1))
+        self.assertTrue(features.has_digits(4))
+        self.assertFalse(features.has_digits(5))
+        self.assertTrue(features.has_digits(3))
+
+    def test_non_string(self):
+        """make sure only text is accepted"""
+        with self.assertRaises(TypeError):
+            TextFeatures(123)